@@ -7,20 +7,28 @@
 - 완전한 데이터 처리
 """
 
+import argparse
 import asyncio
-import aiohttp
 import os
+import time
 import pandas as pd
 from datetime import datetime
 from playwright.async_api import async_playwright
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
 # 모듈 임포트
 from modules.stealth_manager import StealthManager
 from modules.browser_controller import BrowserController
+from modules.browser_pool import BrowserPool
 from modules.api_collector import APICollector
+from modules.async_transport import AiohttpTransport
+from modules.network_tap import ArticleListTap
 from modules.property_parser import PropertyParser
 from modules.data_processor import PropertyDataProcessor
+from modules.district_scheduler import DistrictScheduler, HostBudget
+from modules.checkpoint_store import CheckpointStore
+from modules.db_sink import StreamingDBSink
+from modules.raw_payload import decode_payload, encode_payload
 
 # 진행률 관리자 임포트
 try:
@@ -32,16 +40,26 @@ except ImportError:
             def update_district_start(self, *args, **kwargs): pass
             def update_district_complete(self, *args, **kwargs): pass
             def complete_collection(self, *args, **kwargs): pass
+            def record_district_timing(self, *args, **kwargs): pass
+            def is_stop_requested(self): return False
         return DummyProgressManager()
 
 
+# 📜 스크롤 루프 상태 (매물 링크 수/스크롤 위치를 CDP 왕복 한 번에 숫자로만 반환)
+SCROLL_STATE_JS = """() => ({
+    articles: document.querySelectorAll('a[href*="article"]').length,
+    scrollY: window.scrollY,
+    scrollHeight: document.body.scrollHeight,
+    innerHeight: window.innerHeight
+})"""
+
+
 class DistrictCollector:
     """🎯 메인 하이브리드 수집 시스템 오케스트레이터"""
     
     def __init__(self, streamlit_params=None):
         # 모듈 초기화
         self.stealth_manager = StealthManager(pool_size=5)
-        self.browser_controller = BrowserController()
         
         # Streamlit 필터를 API 수집기에 전달
         streamlit_filters = None
@@ -53,7 +71,71 @@ class DistrictCollector:
             }
             print(f"         🎯 Streamlit 필터 전달: {streamlit_filters}")
         
-        self.api_collector = APICollector(self.stealth_manager)
+        # 🗓️ 동시 수집 설정 (구 N개 동시 진행, 호스트별 요청 예산 공유)
+        params = streamlit_params or {}
+        self.max_concurrent_districts = max(1, int(params.get('max_concurrent_districts', 2)))
+        self.max_requests_per_host = max(1, int(params.get('max_requests_per_host', 4)))
+        self.district_priorities = params.get('district_priorities', {})  # {구: 우선순위} (낮을수록 먼저)
+        self.host_budget = HostBudget(self.max_requests_per_host, min_interval=0.2)
+        
+        # 🏊 브라우저 풀 (warm Chromium 재사용, 구마다 격리된 컨텍스트만 새로 발급)
+        self.headless = bool(params.get('headless', False))
+        self.browser_pool_size = max(1, int(params.get('browser_pool_size', 1)))
+        self.context_max_uses = max(1, int(params.get('context_max_uses', 1)))      # 1이면 구마다 새 컨텍스트
+        self.browser_max_uses = max(1, int(params.get('browser_max_uses', 20)))     # 컨텍스트 N개 발급 후 브라우저 재시작
+        self.browser_pool: Optional[BrowserPool] = None
+        
+        # 🚧 지도 페이지 리소스 차단 (articleList XHR / '구만 보기' 버튼에 필요한 요청만 허용)
+        self.browser_controller = BrowserController(
+            block_resources=params.get('block_resources', True),
+            allowed_resource_types=params.get('allowed_resource_types'),
+            allow_url_patterns=params.get('allow_url_patterns'),
+            block_url_patterns=params.get('block_url_patterns')
+        )
+        self.resource_stats: Dict[str, Dict[str, Any]] = {}  # 구별 차단/절감 통계
+        
+        # ⚠️ 끝까지 수집하지 못한 구 (오류 등) - 완료 기록/워터마크 전진 대상에서 제외
+        self.incomplete_districts: Set[str] = set()
+        # 🔁 목록 끝(more=false / 빈 페이지 / 워터마크 통과)까지 수집한 구 - 이 구만 워터마크 전진
+        self.naturally_ended_districts: Set[str] = set()
+        
+        # 📥 articleList 응답 캡처 방식 ('response': 브라우저 응답 직접 사용, 'refetch': 재요청)
+        self.payload_capture_mode = params.get('payload_capture_mode', 'response')
+        self.payload_spool_dir = params.get('payload_spool_dir')  # 예: 'data/spool' (None이면 저장 안 함)
+        
+        # 🧩 쿼드트리 타일 분할 (단일 쿼리 결과 상한을 넘는 밀집 구 대응)
+        self.tiling_enabled = params.get('tiling', True)
+        self.tile_split_threshold = int(params.get('tile_split_threshold', 1000))  # 타일 totCnt가 이보다 크면 4분할
+        self.tile_max_depth = int(params.get('tile_max_depth', 4))
+        self.max_parallel_tiles = max(1, int(params.get('max_parallel_tiles', 4)))
+        self.scroll_result_cap = int(params.get('scroll_result_cap', 3000))  # 무한 스크롤 안전 제한
+        self.scroll_idle_timeout = float(params.get('scroll_idle_timeout', 1.5))  # 스크롤 후 articleList 응답 대기 (초)
+        self.scroll_idle_limit = max(1, int(params.get('scroll_idle_limit', 5)))  # 연속 N번 응답 없으면 종료
+        # 🔁 페이지 수집 방식 ('replay': 첫 articleList 요청 템플릿으로 나머지 페이지 직접 요청, 'scroll': 끝까지 스크롤)
+        self.pagination_mode = params.get('pagination_mode', 'replay')
+        self.replay_concurrency = max(1, int(params.get('replay_concurrency', self.max_requests_per_host)))
+        
+        # 💾 페이지 단위 체크포인트 (중단/비정상 종료 후 resume()으로 이어서 수집)
+        self.checkpoint_store = CheckpointStore() if params.get('checkpoint', True) else None
+        self.run_id = None
+        
+        # 🔁 증분 수집 (구별 워터마크 이후 매물만 최신순으로 수집, 워터마크는 모든 수집에서 갱신)
+        self.incremental = bool(params.get('incremental', False))
+        self.incremental_stop_pages = max(1, int(params.get('incremental_stop_pages', 2)))  # 이전 매물만 있는 페이지 연속 수
+        self.watermark_store = self.checkpoint_store or CheckpointStore()
+        
+        # 🚰 스트리밍 DB 저장 (페이지 수신 즉시 배치 UPSERT - 수집 중에도 결과 탭에서 조회 가능)
+        self.stream_to_db = params.get('stream_to_db', True)
+        self.stream_batch_size = int(params.get('stream_batch_size', 200))
+        self.stream_flush_interval = float(params.get('stream_flush_interval', 2.0))
+        self.sink: Optional[StreamingDBSink] = None
+        self._streamed_links: Dict[str, set] = {}  # 구별 저장된 naver_link (중복 저장 방지)
+        self.total_collected = 0
+        
+        self.api_collector = APICollector(
+            self.stealth_manager,
+            transport=AiohttpTransport(self.stealth_manager, host_budget=self.host_budget)
+        )
         self.property_parser = PropertyParser(streamlit_filters)
         self.data_processor = PropertyDataProcessor()
         self.progress_manager = get_progress_manager()
@@ -85,88 +167,513 @@ class DistrictCollector:
             }
         
         # 수집 설정
+        self.collection_mode = params.get('mode', 'hybrid')  # 'hybrid' | 'api-only'
         self.max_pages_per_district = 200  # 구별 최대 페이지 (4,000개)
         self.total_target = len(self.target_districts) * self.max_pages_per_district * 20  # 목표
     
+    async def run_collection(self) -> List[Dict[str, Any]]:
+        """🎛️ 수집 모드에 따라 실행 ('hybrid' | 'api-only')"""
+        if self.collection_mode == 'api-only':
+            return await self.run_api_only_collection()
+        return await self.run_hybrid_collection()
+    
     async def run_hybrid_collection(self) -> List[Dict[str, Any]]:
         """🚀 하이브리드 수집 메인 실행"""
         print("🗺️ === 모듈화된 하이브리드 수집 시스템 ===")
         print("💡 방식: 브라우저 '구만보기' → API 대량수집")
         print("🎯 목표: 100% 정확한 구별 분류 + 완전한 데이터")
         print(f"🎯 수집 목표: {self.total_target:,}개 매물 ({len(self.target_districts)}개구 × {self.max_pages_per_district}페이지 × 20개)")
+        print(f"🗓️ 동시 수집: 최대 {self.max_concurrent_districts}개 구, 호스트당 요청 {self.max_requests_per_host}개")
         
         # 진행률 시작
         self.progress_manager.start_collection(self.target_districts, self.max_pages_per_district * 20)
+        self._begin_run()
+        await self._open_sink()
         
-        all_properties = []
+        scheduler = self._build_scheduler()
         
         # Playwright 초기화
         playwright = await async_playwright().start()
         
         try:
-            for i, district_name in enumerate(self.target_districts, 1):
-                # 중지 요청 확인
-                if self.progress_manager.is_stop_requested():
-                    print(f"\n🛑 수집 중지 요청으로 인해 {district_name} 수집을 건너뜁니다.")
-                    break
-                    
-                print(f"\n📍 {i}/{len(self.target_districts)}: {district_name} 하이브리드 수집")
+            async def district_worker(district_name: str, index: int):
+                restored = self._restore_completed_district(district_name, index)
+                if restored is not None:
+                    return self._district_result(district_name, restored)
                 
-                # 🔄 구별 브라우저 재시작 (세션 격리)
-                print(f"         🔄 {district_name} 전용 브라우저 시작...")
-                browser, context, page = await self.browser_controller.create_mobile_context(playwright)
+                properties = None
+                if self._district_watermark(district_name) is not None:
+                    # 🔁 워터마크가 있는 구는 브라우저 없이 최신순 API 증분 수집 (거부 시 브라우저 수집)
+                    properties = await self.collect_district_api_only(district_name, index)
+                if properties is None and not self.progress_manager.is_stop_requested():
+                    properties = await self.collect_single_district(playwright, district_name, index)
+                result = await self._settle_district(district_name, properties)
                 
-                try:
-                    # 진행률 업데이트: 구별 시작
-                    self.progress_manager.update_district_start(district_name, i-1)
-                    
-                    # 1단계: 브라우저로 구별 필터 설정
-                    success = await self.setup_district_filter(page, district_name)
-                    
-                    if success:
-                        # 2단계: API로 대량 수집
-                        district_properties = await self.collect_district_data(page, district_name)
-                        
-                        if district_properties:
-                            # 3단계: 데이터 향상 및 검증
-                            enhanced_properties = self.enhance_and_validate_data(district_properties, district_name)
-                            all_properties.extend(enhanced_properties)
-                            
-                            print(f"      ✅ {district_name}: {len(enhanced_properties)}개 하이브리드 수집 완료")
-                            
-                            # 진행률 업데이트: 구별 완료
-                            self.progress_manager.update_district_complete(district_name, len(enhanced_properties))
-                        else:
-                            print(f"      ❌ {district_name}: 하이브리드 수집 실패")
-                            self.progress_manager.update_district_complete(district_name, 0)
-                    else:
-                        print(f"      ❌ {district_name}: 구만 보기 버튼 찾기 실패")
-                    
-                finally:
-                    # 🔄 구별 브라우저 종료 (세션 완전 격리)
-                    print(f"         🔄 {district_name} 브라우저 종료...")
-                    await browser.close()
-                
-                # 구간별 휴식
-                if i < len(self.target_districts):
-                    self.stealth_manager.rest_between_operations(f"{district_name} 완료")
+                # 구간별 휴식 (워커 단위 - 다른 구 수집은 계속 진행)
+                if index < len(self.target_districts) - 1:
+                    await self.stealth_manager.async_rest_between_operations(f"{district_name} 완료")
+                return result
+            
+            district_results = await scheduler.run(district_worker)
                 
         finally:
-            # Playwright 종료
+            # 브라우저 풀 → Playwright 종료
+            await self._close_browser_pool()
             await playwright.stop()
+            await self.api_collector.transport.close()
+            await self._close_sink()
+        
+        return await self._finish_collection(district_results)
+    
+    async def run_api_only_collection(self) -> List[Dict[str, Any]]:
+        """⚡ 브라우저 없는 순수 API 수집 (구별 좌표 범위 사용, API 거부 시에만 브라우저 폴백)"""
+        print("⚡ === 순수 API 수집 모드 (브라우저 생략) ===")
+        print("💡 방식: 구별 좌표 범위 → 클러스터 API 직접 페이지 수집")
+        print(f"🎯 수집 목표: {self.total_target:,}개 매물 ({len(self.target_districts)}개구 × {self.max_pages_per_district}페이지 × 20개)")
+        print(f"🗓️ 동시 수집: 최대 {self.max_concurrent_districts}개 구, 호스트당 요청 {self.max_requests_per_host}개")
+        
+        # 진행률 시작
+        self.progress_manager.start_collection(self.target_districts, self.max_pages_per_district * 20)
+        self._begin_run()
+        await self._open_sink()
+        
+        scheduler = self._build_scheduler()
+        
+        # Playwright는 폴백이 필요할 때만 시작
+        playwright = None
+        playwright_lock = asyncio.Lock()
+        
+        async def get_playwright():
+            nonlocal playwright
+            async with playwright_lock:
+                if playwright is None:
+                    print("         🌐 브라우저 폴백용 Playwright 시작...")
+                    playwright = await async_playwright().start()
+            return playwright
+        
+        try:
+            async def district_worker(district_name: str, index: int):
+                restored = self._restore_completed_district(district_name, index)
+                if restored is not None:
+                    return self._district_result(district_name, restored)
+                
+                properties = await self.collect_district_api_only(district_name, index)
+                
+                if properties is None and not self.progress_manager.is_stop_requested():
+                    print(f"         🌐 {district_name}: API 파라미터 거부 → 브라우저 부트스트랩 폴백")
+                    properties = await self.collect_single_district(await get_playwright(), district_name, index)
+                result = await self._settle_district(district_name, properties)
+                
+                if index < len(self.target_districts) - 1:
+                    await self.stealth_manager.async_rest_between_operations(f"{district_name} 완료")
+                return result
+            
+            district_results = await scheduler.run(district_worker)
+            
+        finally:
+            if playwright is not None:
+                await self._close_browser_pool()
+                await playwright.stop()
+            await self.api_collector.transport.close()
+            await self._close_sink()
+        
+        return await self._finish_collection(district_results)
+    
+    async def resume(self, run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """↩️ 중단된 수집 이어서 실행 (run_id 생략 시 가장 최근 미완료 실행)"""
+        if self.checkpoint_store is None:
+            print("⚠️ 체크포인트가 비활성화되어 재개할 수 없습니다")
+            return []
+        
+        run = self.checkpoint_store.get_run(run_id) if run_id else self.checkpoint_store.latest_resumable_run()
+        if not run:
+            print("ℹ️ 재개할 수집 실행이 없습니다")
+            return []
+        
+        run_params = run['params']
+        self.run_id = run['run_id']
+        self.target_districts = run_params.get('districts', self.target_districts)
+        self.collection_mode = run_params.get('mode', self.collection_mode)
+        self.max_pages_per_district = run_params.get('max_pages_per_district', self.max_pages_per_district)
+        self.incremental = run_params.get('incremental', self.incremental)
+        self.total_target = len(self.target_districts) * self.max_pages_per_district * 20
         
-        # 4단계: 최종 결과 분석 및 저장
-        await self.finalize_results(all_properties)
+        print(f"↩️ 수집 재개: {self.run_id} ({run['status']}, {len(self.target_districts)}개 구, 모드: {self.collection_mode})")
+        return await self.run_collection()
+    
+    def _begin_run(self):
+        """💾 체크포인트 실행 등록 (재개 중이면 기존 실행 계속)"""
+        if self.checkpoint_store is None:
+            return
+        if self.run_id:
+            self.checkpoint_store.set_run_status(self.run_id, 'running')
+        else:
+            self.run_id = self.checkpoint_store.start_run(self.target_districts, {
+                'mode': self.collection_mode,
+                'max_pages_per_district': self.max_pages_per_district,
+                'incremental': self.incremental
+            })
+    
+    def _get_browser_pool(self, playwright) -> BrowserPool:
+        """🏊 실행 단위 브라우저 풀 (첫 하이브리드 구에서 생성)"""
+        if self.browser_pool is None:
+            self.browser_pool = BrowserPool(
+                playwright,
+                size=self.browser_pool_size,
+                headless=self.headless,
+                max_context_uses=self.context_max_uses,
+                max_browser_uses=self.browser_max_uses
+            )
+        return self.browser_pool
+    
+    async def _close_browser_pool(self):
+        if self.browser_pool is not None:
+            await self.browser_pool.close()
+            self.browser_pool = None
+    
+    def _district_checkpoint(self, district_name: str):
+        if self.checkpoint_store is None or not self.run_id:
+            return None
+        return self.checkpoint_store.for_district(self.run_id, district_name)
+    
+    def _restore_completed_district(self, district_name: str, index: int) -> Optional[List[Dict[str, Any]]]:
+        """↩️ 이미 완료된 구는 저장된 매물로 결과 복원 (재수집 생략)"""
+        checkpoint = self._district_checkpoint(district_name)
+        if checkpoint is None or self.checkpoint_store.get_district_status(self.run_id, district_name) != 'done':
+            return None
+        
+        converted_properties = []
+        for raw_prop in checkpoint.load_articles():
+            converted_prop = self.convert_api_property_to_standard(raw_prop, district_name)
+            if converted_prop:
+                converted_properties.append(converted_prop)
+        
+        enhanced_properties = self.enhance_and_validate_data(converted_properties, district_name) if converted_properties else []
+        print(f"\n↩️ {index + 1}/{len(self.target_districts)}: {district_name} 체크포인트에서 복원 ({len(enhanced_properties)}개)")
+        self.progress_manager.update_district_complete(district_name, len(enhanced_properties))
+        return enhanced_properties
+    
+    async def _settle_district(self, district_name: str, properties: Optional[List[Dict[str, Any]]]):
+        """💾 구 결과 저장을 확인한 뒤 완료 기록 (스트리밍 DB 저장에 실패한 구는 미완료로 남김)"""
+        result = self._district_result(district_name, properties)
+        if self.sink is not None and properties is not None:
+            await self.sink.flush()
+            unsaved = self.sink.unsaved_districts()
+            if district_name in unsaved or '' in unsaved:
+                print(f"      ⚠️ {district_name}: DB 저장 실패 ({self.sink.last_error}) → 미완료 처리")
+                self.incomplete_districts.add(district_name)
+        self._mark_district_done(district_name, properties)
+        return result
+    
+    def _mark_district_done(self, district_name: str, properties: Optional[List[Dict[str, Any]]]):
+        """💾 구 완료 기록 + 워터마크 전진 (중지 요청으로 중단된 구는 미완료로 남겨 재개 대상 유지)"""
+        if properties is None or self.progress_manager.is_stop_requested() or district_name in self.incomplete_districts:
+            return
+        if district_name in self.naturally_ended_districts:
+            self._advance_watermark(district_name, properties)
+        elif self.incremental:
+            print(f"      🔁 {district_name}: 목록 끝까지 수집하지 못함 (상한/오류) → 워터마크 유지")
+        if self.checkpoint_store is None or not self.run_id:
+            return
+        self.checkpoint_store.set_district_status(self.run_id, district_name, 'done', len(properties))
+    
+    def _district_watermark(self, district_name: str) -> Optional[Dict[str, Any]]:
+        """🔁 증분 수집 기준 워터마크 (증분 모드가 아니거나 전체 수집 기록이 없으면 None)"""
+        if not self.incremental:
+            return None
+        return self.watermark_store.get_watermark(district_name)
+    
+    def _advance_watermark(self, district_name: str, properties: List[Dict[str, Any]]):
+        """🔁 끝까지 수집한 구의 원시 매물로 워터마크 갱신"""
+        articles = []
+        for prop in properties:
+            try:
+                raw_prop = decode_payload(prop.get('raw_text'))
+            except ValueError:
+                continue
+            if isinstance(raw_prop, dict):
+                articles.append(raw_prop)
+        if not articles:
+            return
+        try:
+            watermark = self.watermark_store.update_watermark(district_name, articles)
+            print(f"      🔁 {district_name} 워터마크: {watermark['confirm_date']} / 매물번호 {watermark['article_id']}")
+        except Exception as e:
+            print(f"      ⚠️ {district_name} 워터마크 저장 실패: {e}")
+    
+    def _build_scheduler(self) -> DistrictScheduler:
+        """🗓️ 우선순위 작업 큐 구성 (지정 우선순위 → 입력 순서)"""
+        scheduler = DistrictScheduler(self.max_concurrent_districts, self.progress_manager)
+        for i, district_name in enumerate(self.target_districts):
+            scheduler.submit(district_name, priority=self.district_priorities.get(district_name, i), index=i)
+        return scheduler
+    
+    async def _finish_collection(self, district_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """🏁 구별 결과 병합 → 저장 → 진행률 완료 처리 (스트리밍 모드는 이미 저장됨 → 빈 목록 반환)"""
+        all_properties = []
+        if self.sink is not None:
+            # 🚰 스트리밍 모드: 구별 결과는 매물 수만 전달됨 (DB/백업 CSV에 이미 저장)
+            self.total_collected = sum(count for count in district_results.values() if isinstance(count, int))
+            self.print_stream_summary()
+            if self.sink.pending_count:
+                # 종료 시점까지 DB에 못 넣은 매물의 구는 재개 대상으로 되돌림 (체크포인트 정리 금지)
+                unsaved = self.sink.unsaved_districts()
+                for district_name in (self.target_districts if '' in unsaved else unsaved):
+                    self.incomplete_districts.add(district_name)
+                    if self.checkpoint_store is not None and self.run_id:
+                        self.checkpoint_store.set_district_status(self.run_id, district_name, 'pending')
+        else:
+            # 입력 순서대로 결과 병합
+            for district_name in self.target_districts:
+                all_properties.extend(district_results.get(district_name) or [])
+            self.total_collected = len(all_properties)
+            
+            # 4단계: 최종 결과 분석 및 저장
+            await self.finalize_results(all_properties)
         
         # 중지 요청 확인 후 완료 처리
         if self.progress_manager.is_stop_requested():
-            self.progress_manager.complete_collection(len(all_properties), success=False)
-            print(f"\n🛑 사용자 요청으로 수집이 중지되었습니다. 총 {len(all_properties)}개 매물 수집됨")
+            self.progress_manager.complete_collection(self.total_collected, success=False)
+            print(f"\n🛑 사용자 요청으로 수집이 중지되었습니다. 총 {self.total_collected}개 매물 수집됨")
+            if self.checkpoint_store is not None and self.run_id:
+                self.checkpoint_store.set_run_status(self.run_id, 'stopped')
+                print(f"💾 체크포인트 보존: resume('{self.run_id}')로 이어서 수집할 수 있습니다")
         else:
-            self.progress_manager.complete_collection(len(all_properties), success=True)
+            self.progress_manager.complete_collection(self.total_collected, success=True)
+            if self.checkpoint_store is not None and self.run_id:
+                if self.incomplete_districts:
+                    # 오류로 끝까지 못 받은 구가 있으면 체크포인트 유지 (resume 대상)
+                    self.checkpoint_store.set_run_status(self.run_id, 'incomplete')
+                    print(f"💾 미완료 구 {len(self.incomplete_districts)}개 ({', '.join(sorted(self.incomplete_districts))}): "
+                          f"resume('{self.run_id}')로 이어서 수집할 수 있습니다")
+                else:
+                    self.checkpoint_store.set_run_status(self.run_id, 'completed')
+                    pruned = await asyncio.to_thread(self.checkpoint_store.prune_run, self.run_id)
+                    print(f"🧹 체크포인트 정리: 완료된 실행의 저장 매물 {pruned}개 삭제")
         
         return all_properties
     
+    async def _open_sink(self):
+        """🚰 스트리밍 DB 저장 시작"""
+        self._streamed_links = {}
+        if not self.stream_to_db:
+            self.sink = None
+            return
+        backup_csv = f"backup_collection_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        self.sink = StreamingDBSink(
+            self.data_processor,
+            batch_size=self.stream_batch_size,
+            flush_interval=self.stream_flush_interval,
+            backup_csv=backup_csv
+        )
+        await self.sink.start()
+        print(f"🚰 스트리밍 DB 저장: {self.stream_batch_size}개 또는 {self.stream_flush_interval:.0f}초마다 (백업: {backup_csv})")
+    
+    async def _close_sink(self):
+        if self.sink is not None:
+            await self.sink.close()
+    
+    def _page_streamer(self, district_name: str, data_source: str):
+        """📄 페이지별 원시 매물 → 변환 → 스트리밍 저장 콜백 (스트리밍 비활성 시 None)"""
+        if self.sink is None:
+            return None
+        
+        def on_page(raw_articles: List[Dict[str, Any]]):
+            converted_properties = []
+            for raw_prop in raw_articles:
+                if isinstance(raw_prop, dict):
+                    converted_prop = self.convert_api_property_to_standard(raw_prop, district_name, data_source=data_source)
+                    if converted_prop:
+                        converted_properties.append(converted_prop)
+            if converted_properties:
+                self._stream_records(district_name, self.enhance_and_validate_data(converted_properties, district_name))
+        
+        return on_page
+    
+    def _stream_records(self, district_name: str, records: List[Dict[str, Any]]) -> int:
+        """🚰 아직 저장하지 않은 매물만 싱크에 전달"""
+        if self.sink is None or not records:
+            return 0
+        seen_links = self._streamed_links.setdefault(district_name, set())
+        new_records = []
+        for record in records:
+            link = record.get('naver_link') or ''
+            if link and link in seen_links:
+                continue
+            if link:
+                seen_links.add(link)
+            new_records.append(record)
+        self.sink.add(new_records)
+        return len(new_records)
+    
+    def _district_result(self, district_name: str, properties: Optional[List[Dict[str, Any]]]):
+        """🗓️ 스케줄러에 돌려줄 구별 결과 (스트리밍 모드: 남은 매물 저장 후 매물 수만 반환)"""
+        if self.sink is None:
+            return properties
+        properties = properties or []
+        self._stream_records(district_name, properties)
+        return len(properties)
+    
+    def print_stream_summary(self):
+        """🚰 스트리밍 저장 결과 출력"""
+        print(f"\n📊 === 스트리밍 수집 결과 ===")
+        print(f"총 매물: {self.total_collected:,}개")
+        if self.sink is not None:
+            message = (f"✅ DB UPSERT ({self.sink.batches}개 배치): 신규 {self.sink.new_count}개, "
+                       f"업데이트 {self.sink.updated_count}개")
+            if self.sink.error_count > 0:
+                message += f", ⚠️ 오류 {self.sink.error_count}개"
+            if self.sink.pending_count > 0:
+                message += f", ❌ DB 미저장 {self.sink.pending_count}개 (백업 CSV에 기록)"
+            print(message)
+            print(f"📦 백업 CSV: {self.sink.backup_csv}")
+        if self.resource_stats:
+            blocked = sum(stats['blocked_requests'] for stats in self.resource_stats.values())
+            saved = sum(stats['estimated_saved_bytes'] for stats in self.resource_stats.values())
+            print(f"🚧 리소스 차단: {len(self.resource_stats)}개 구, 요청 {blocked:,}개 차단, "
+                  f"약 {saved / 1024 / 1024:.1f}MB 절감 추정")
+    
+    async def collect_district_api_only(self, district_name: str, index: int) -> Optional[List[Dict[str, Any]]]:
+        """⚡ 단일 구 순수 API 수집 (None 반환 = API 거부, 브라우저 폴백 필요)"""
+        print(f"\n📍 {index + 1}/{len(self.target_districts)}: {district_name} 순수 API 수집")
+        self.progress_manager.update_district_start(district_name, index)
+        
+        # 구별 수집기 (중복 감지 상태 격리, 호스트 예산은 공유)
+        collector = APICollector(
+            self.stealth_manager,
+            transport=AiohttpTransport(self.stealth_manager, host_budget=self.host_budget)
+        )
+        watermark = self._district_watermark(district_name)
+        try:
+            if watermark is not None:
+                # 🔁 증분: 구 전체 범위를 최신순으로 보다가 워터마크를 넘으면 중단 (타일 분할 불필요)
+                raw_properties = await collector.collect_with_api_params(
+                    {}, district_name, max_pages=self.max_pages_per_district,
+                    checkpoint=self._district_checkpoint(district_name),
+                    on_page=self._page_streamer(district_name, 'api_only'),
+                    watermark=watermark,
+                    watermark_stop_pages=self.incremental_stop_pages
+                )
+            elif self.tiling_enabled:
+                raw_properties = await collector.collect_with_tiles(
+                    district_name,
+                    split_threshold=self.tile_split_threshold,
+                    max_depth=self.tile_max_depth,
+                    max_parallel_tiles=self.max_parallel_tiles,
+                    max_pages_per_tile=self.max_pages_per_district,
+                    checkpoint=self._district_checkpoint(district_name),
+                    on_page=self._page_streamer(district_name, 'api_only')
+                )
+            else:
+                raw_properties = await collector.collect_with_api_params(
+                    {}, district_name, max_pages=self.max_pages_per_district,
+                    checkpoint=self._district_checkpoint(district_name),
+                    on_page=self._page_streamer(district_name, 'api_only')
+                )
+        finally:
+            await collector.transport.close()
+        
+        if collector.params_rejected:
+            return None
+        if collector.collection_errored:
+            # 네트워크/일시 오류 - 브라우저로 넘기지 않고 미완료로 남겨 재개 시 다시 수집
+            self.incomplete_districts.add(district_name)
+        if collector.ended_naturally:
+            self.naturally_ended_districts.add(district_name)
+        
+        # 하이브리드 수집과 동일한 표준 형식으로 변환
+        converted_properties = []
+        for prop in raw_properties:
+            raw_data = prop.get('raw_data')
+            if isinstance(raw_data, dict):
+                converted_prop = self.convert_api_property_to_standard(raw_data, district_name, data_source='api_only')
+                if converted_prop:
+                    converted_properties.append(converted_prop)
+        
+        enhanced_properties = self.enhance_and_validate_data(converted_properties, district_name)
+        print(f"      ✅ {district_name}: {len(enhanced_properties)}개 순수 API 수집 완료")
+        self.progress_manager.update_district_complete(district_name, len(enhanced_properties))
+        return enhanced_properties
+    
+    async def collect_tiled_articles(self, district_name: str) -> List[Dict[str, Any]]:
+        """🧩 타일 분할 API 수집 → 원시 articleList 항목 반환 (무한 스크롤 보완용)"""
+        print(f"            🧩 {district_name}: 스크롤 상한 도달 → 타일 분할 수집으로 보완")
+        collector = APICollector(
+            self.stealth_manager,
+            transport=AiohttpTransport(self.stealth_manager, host_budget=self.host_budget)
+        )
+        try:
+            properties = await collector.collect_with_tiles(
+                district_name,
+                split_threshold=self.tile_split_threshold,
+                max_depth=self.tile_max_depth,
+                max_parallel_tiles=self.max_parallel_tiles,
+                max_pages_per_tile=self.max_pages_per_district,
+                checkpoint=self._district_checkpoint(district_name)
+            )
+        except Exception as e:
+            print(f"            ❌ 타일 분할 수집 오류: {e}")
+            return []
+        finally:
+            await collector.transport.close()
+        if collector.ended_naturally:
+            self.naturally_ended_districts.add(district_name)
+        return [prop['raw_data'] for prop in properties if isinstance(prop.get('raw_data'), dict)]
+    
+    async def collect_single_district(self, playwright, district_name: str, index: int) -> List[Dict[str, Any]]:
+        """📍 단일 구 하이브리드 수집 (스케줄러 워커에서 호출)"""
+        print(f"\n📍 {index + 1}/{len(self.target_districts)}: {district_name} 하이브리드 수집")
+        
+        # 🏊 풀의 warm 브라우저에서 구 전용 컨텍스트 발급 (쿠키/스토리지 격리)
+        started = time.monotonic()
+        pool = self._get_browser_pool(playwright)
+        context, page, lease = await pool.acquire()
+        resource_filter = await self.browser_controller.apply_resource_filter(page)
+        print(f"         🏊 {district_name} 전용 컨텍스트 준비 ({time.monotonic() - started:.2f}초)")
+        
+        try:
+            # 진행률 업데이트: 구별 시작
+            self.progress_manager.update_district_start(district_name, index)
+            
+            # 1단계: 브라우저로 구별 필터 설정
+            success = await self.setup_district_filter(page, district_name)
+            
+            if success:
+                # 2단계: API로 대량 수집
+                district_properties = await self.collect_district_data(page, district_name)
+                
+                if district_properties:
+                    # 3단계: 데이터 향상 및 검증
+                    enhanced_properties = self.enhance_and_validate_data(district_properties, district_name)
+                    
+                    print(f"      ✅ {district_name}: {len(enhanced_properties)}개 하이브리드 수집 완료")
+                    
+                    # 진행률 업데이트: 구별 완료
+                    self.progress_manager.update_district_complete(district_name, len(enhanced_properties))
+                    return enhanced_properties
+                
+                if district_properties is None:
+                    # 수집 오류 - 완료로 기록하지 않고 미완료로 남겨 재개 시 다시 수집
+                    print(f"      ❌ {district_name}: 하이브리드 수집 실패 → 미완료 처리")
+                    self.incomplete_districts.add(district_name)
+                else:
+                    print(f"      ⚠️ {district_name}: 수집된 매물 없음")
+                    self.progress_manager.update_district_complete(district_name, 0)
+            else:
+                print(f"      ❌ {district_name}: 구만 보기 버튼 찾기 실패 → 미완료 처리")
+                self.incomplete_districts.add(district_name)
+            
+            return []
+            
+        finally:
+            if resource_filter is not None:
+                self.resource_stats[district_name] = dict(resource_filter.stats)
+                print(f"         🚧 {district_name} 리소스 차단: {resource_filter.summary()}")
+            
+            # 🔄 구별 컨텍스트 반환 (브라우저 프로세스는 다음 구에서 재사용)
+            print(f"         🔄 {district_name} 컨텍스트 반환...")
+            await pool.release(context, lease)
+    
     async def setup_district_filter(self, page, district_name: str) -> bool:
         """🌐 1단계: 브라우저로 구별 필터 설정"""
         print(f"         🌐 1단계: 브라우저로 {district_name}만 보기 활성화...")
@@ -176,7 +683,7 @@ class DistrictCollector:
         
         if success:
             # 목록 모드로 전환
-            await self.browser_controller.switch_to_list_mode(page)
+            await self.browser_controller.switch_to_list_mode(page, district_name)
         
         return success
     
@@ -383,227 +890,137 @@ class DistrictCollector:
         """🚀 무한 스크롤 + 네트워크 모니터링으로 매물 수집"""
         print(f"            🚀 {district_name} 무한 스크롤 + 네트워크 모니터링 수집 시작...")
         
-        # 네트워크 요청 모니터링
-        api_requests = []
-        all_properties = []
-        total_property_count = 0  # 전체 매물 수 (totCnt에서 추출)
-        
-        def handle_response(response):
-            nonlocal total_property_count
-            # 더 넓은 범위의 API 요청 감지
-            if any(keyword in response.url for keyword in ['article', 'atcl', 'ajax', 'cluster', 'list', 'land', 'm.land']):
-                api_requests.append({
-                    'url': response.url,
-                    'status': response.status,
-                    'timestamp': asyncio.get_event_loop().time()
-                })
-                print(f'🌐 API 발견: {response.status} {response.url}')
-                
-                # totCnt 추출 (전체 매물 수)
-                if 'totCnt=' in response.url:
-                    import re
-                    match = re.search(r'totCnt=(\d+)', response.url)
-                    if match and total_property_count == 0:
-                        total_property_count = int(match.group(1))
-                        print(f'🎯 전체 매물 수 감지: {total_property_count}개')
-                
-                # 매물 관련 API인지 추가 확인
-                if any(keyword in response.url for keyword in ['articleList', 'cluster', 'ajax']):
-                    print(f'🎯 매물 API 확인: {response.url}')
-                    
-                    # 실시간으로 API 처리 (비동기 태스크로 실행)
-                    asyncio.create_task(process_api_request(response.url))
-        
-        page.on('response', handle_response)
+        # 네트워크 요청 모니터링 (구별 공유 세션 + 추적되는 처리 태스크)
+        tap = ArticleListTap(page, district_name, host_budget=self.host_budget,
+                             max_concurrent_fetches=self.max_requests_per_host,
+                             capture_mode=self.payload_capture_mode,
+                             spool_dir=self.payload_spool_dir, run_id=self.run_id,
+                             checkpoint=self._district_checkpoint(district_name),
+                             on_page=self._page_streamer(district_name, 'infinite_scroll_api'),
+                             progress_manager=self.progress_manager)
+        tap.attach()
         
-        # API 요청을 실시간으로 처리하는 함수
-        async def process_api_request(url):
-            try:
-                print(f'                🎯 실시간 API 처리: {url}')
-                
-                # aiohttp로 직접 요청
-                async with aiohttp.ClientSession() as session:
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
-                        'Referer': page.url,
-                        'Accept': 'application/json, text/javascript, */*; q=0.01',
-                        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                        'X-Requested-With': 'XMLHttpRequest'
-                    }
-                    
-                    async with session.get(url, headers=headers) as response:
-                        print(f'                📡 응답 상태: {response.status}')
-                        
-                        if response.status == 200:
-                            data = await response.json()
-                            print(f'                📋 응답 키들: {list(data.keys()) if isinstance(data, dict) else "리스트 형태"}')
-                            
-                            if 'body' in data and isinstance(data['body'], list):
-                                new_properties = data['body']
-                                all_properties.extend(new_properties)
-                                print(f'                📊 매물 데이터: {len(new_properties)}개 추가 (총 {len(all_properties)}개)')
-                                
-                                # 매물 데이터 샘플 출력
-                                for j, prop in enumerate(new_properties[:3]):  # 처음 3개만
-                                    name = prop.get('atclNm', '이름없음')
-                                    deposit = prop.get('prc', 0)
-                                    rent = prop.get('rentPrc', 0)
-                                    area = prop.get('spc1', 0)
-                                    print(f'                  매물 {j+1}: {name} - {deposit}/{rent}만원 ({area}㎡)')
-                                return True
-                            else:
-                                print(f'                ❌ 응답 구조 오류: body 키 없음 또는 리스트 아님')
-                                print(f'                📋 응답 구조 (처음 500자): {str(data)[:500]}')
-                        else:
-                            print(f'                ❌ HTTP 오류: {response.status}')
-                            
-            except Exception as e:
-                print(f'                ❌ API 데이터 추출 실패: {e}')
-                import traceback
-                print(f'                📋 상세 오류: {traceback.format_exc()}')
-            
-            return False
+        try:
+            return await self._scroll_and_collect(page, district_name, tap)
+        finally:
+            await tap.close()
+    
+    async def _scroll_and_collect(self, page, district_name: str, tap: ArticleListTap) -> List[Dict[str, Any]]:
+        """📜 무한 스크롤 루프 + 탭 결과 변환"""
+        api_requests = tap.api_requests
+        all_properties = tap.all_properties
         
-        # 초기 상태 확인
-        articles = await page.query_selector_all('a[href*="article"]')
-        print(f'            초기 매물 링크: {len(articles)}개')
+        # 초기 상태 확인 (DOM 매물 수/스크롤 위치를 evaluate 한 번으로)
+        state = await page.evaluate(SCROLL_STATE_JS)
+        print(f'            초기 매물 링크: {state["articles"]}개')
         print(f'            초기 API 요청: {len(api_requests)}개')
         
-        # 무한 스크롤하면서 네트워크 모니터링
-        no_new_data_count = 0  # 연속으로 새 데이터가 없는 횟수
-        max_scroll_attempts = 100  # 최대 스크롤 시도 횟수
-
-        i = 0
-        while i < max_scroll_attempts:  # 무한 루프 대신 제한된 횟수로 변경
-            print(f'            --- 스크롤 {i+1}/{max_scroll_attempts} ---')
-
-            # 스크롤 전 상태
-            before_articles = await page.query_selector_all('a[href*="article"]')
-            before_count = len(before_articles)
-            before_requests = len(api_requests)
+        # 응답 기반 무한 스크롤: 스크롤 → 다음 articleList 응답(또는 짧은 유휴 시간) 대기
+        idle_count = 0  # 연속으로 새 응답이 없는 횟수
+        replay = self.pagination_mode == 'replay'
+        max_scroll_attempts = max(100, self.scroll_result_cap // 20 + 10)  # 페이지당 20개 기준
+        started = time.monotonic()
+        ended_naturally = False  # 목록 끝까지 받았는지 (상한/유휴 시간 초과로 끊기면 False)
+        
+        for i in range(max_scroll_attempts):
+            before_responses = tap.article_response_count
+            before_articles = state['articles']
             before_properties = len(all_properties)
-
-            # 페이지의 전체 높이 확인
-            scroll_height = await page.evaluate('document.body.scrollHeight')
-            current_scroll_y = await page.evaluate('window.scrollY')
-
-            print(f'              현재 스크롤 위치: {current_scroll_y}px / 전체 높이: {scroll_height}px')
-
-            # 🚀 강화된 스크롤 방법 (20000px씩 대폭 스크롤)
-            # 스크롤 실행 (20000px씩 내림)
-            await page.evaluate('window.scrollBy(0, 20000)')
-            await asyncio.sleep(2)  # 로딩 대기
-
-            # 스크롤 후 상태
-            after_articles = await page.query_selector_all('a[href*="article"]')
-            after_count = len(after_articles)
-            after_requests = len(api_requests)
-            
-            # 🔧 스크롤이 안 되면 다른 방법 시도 (이전 성공 코드)
-            scroll_y = await page.evaluate('window.scrollY')
-            if scroll_y == current_scroll_y:  # 스크롤 위치가 변하지 않았다면
-                print('              ❌ 스크롤 안됨, 다른 방법 시도...')
-                
-                # 방법 1: 키보드 스크롤
-                await page.keyboard.press('PageDown')
-                await asyncio.sleep(1)
-                
-                # 방법 2: 마우스 휠 (강화)
-                await page.mouse.wheel(0, 15000)
-                await asyncio.sleep(1)
-                
-                # 방법 3: 강제 스크롤 (강화)
-                await page.evaluate('window.scrollTo(0, 20000)')
-                await asyncio.sleep(1)
-                
-                new_scroll_y = await page.evaluate('window.scrollY')
-                print(f'              강제 스크롤 후: {new_scroll_y}px')
-
-            print(f'              매물: {before_count} → {after_count}개')
-            print(f'              API 요청: {before_requests} → {after_requests}개')
-            print(f'              수집된 매물 데이터: {len(all_properties)}개')
             
-            # 전체 매물 수집 진행률 표시
-            if total_property_count > 0:
-                progress_percent = (len(all_properties) / total_property_count) * 100
-                print(f'              📊 수집 진행률: {len(all_properties)}/{total_property_count}개 ({progress_percent:.1f}%)')
-
-            # 새로운 API 요청이 있으면 데이터 추출 (실시간 처리로 대체)
-            if after_requests > before_requests:
-                print(f'              ✅ 새로운 API 요청 {after_requests - before_requests}개! (실시간 처리됨)')
-
-                # 실시간 처리된 데이터 확인
-                print(f'              📊 현재까지 수집된 매물: {len(all_properties)}개')
-
-                # API 요청이 있으면 새 데이터가 있다는 의미이므로 카운터 리셋
-                no_new_data_count = 0
-                
-                # API 요청이 계속 들어오면 더 적극적으로 스크롤
-                if len(all_properties) > before_properties:
-                    print(f'              🚀 새 매물 데이터 감지! 적극적 스크롤 계속...')
-                    # 추가 시도를 위해 여기서 스크롤 한번 더 (강화)
-                    await page.evaluate('window.scrollBy(0, 15000)')
-                    await asyncio.sleep(1)
-
-            # 매물이 로딩되면 계속
-            if after_count > before_count:
-                print(f'              🎉 매물 로딩 성공! {after_count - before_count}개 추가')
-                no_new_data_count = 0  # 리셋
-            else:
-                no_new_data_count += 1
-                print(f'              ❌ 매물 로딩 없음 (연속 {no_new_data_count}번)')
-
-            # 페이지 끝 감지 (스크롤이 실제로 작동할 때만)
-            current_height = await page.evaluate('document.body.scrollHeight')
-            current_scroll = await page.evaluate('window.scrollY')
-            
-            # 스크롤이 실제로 작동하고 있을 때만 페이지 끝 감지
-            if current_scroll > 100:  # 스크롤이 실제로 움직였을 때만
-                if current_scroll + await page.evaluate('window.innerHeight') >= current_height - 500:
-                    print(f'              📍 페이지 끝 근처 도달: {current_scroll}px / {current_height}px')
-                    # 끝에 도달해도 몇 번 더 시도
-                    if no_new_data_count >= 5:  # 더 많이 시도
-                        break
+            # 스크롤 (20000px) - 이동 전 위치를 함께 반환
+            previous_y = await page.evaluate('(() => { const y = window.scrollY; window.scrollBy(0, 20000); return y; })()')
+            got_response = await tap.wait_for_article_response(before_responses, self.scroll_idle_timeout)
+            
+            if not got_response:
+                state = await page.evaluate(SCROLL_STATE_JS)
+                if state['scrollY'] == previous_y:
+                    # 🔧 스크롤이 안 되면 터치/휠 스크롤로 한 번 더 시도
+                    print('              ❌ 스크롤 안됨, 마우스 휠로 재시도...')
+                    await page.mouse.wheel(0, 15000)
+                    got_response = await tap.wait_for_article_response(before_responses, self.scroll_idle_timeout)
+            
+            # 🔁 articleList 요청 템플릿을 얻었으면 스크롤 대신 나머지 페이지를 직접 요청 (브라우저는 부트스트랩만)
+            if replay and tap.request_template is not None:
+                replayed = await tap.replay_pages(self.replay_concurrency, max_items=self.scroll_result_cap,
+                                                  should_stop=self.progress_manager.is_stop_requested)
+                if replayed is not None:
+                    ended_naturally = tap.replay_complete
+                    if tap.replay_failed_page is not None:
+                        # 저장된 페이지('scroll' 커서) 다음부터 재개하도록 미완료로 남김
+                        print(f'              ⚠️ {tap.replay_failed_page}페이지 이후 미수집 → {district_name} 미완료 처리')
+                        self.incomplete_districts.add(district_name)
+                    break
+                print('              ⚠️ 직접 페이지 요청 거부 → 스크롤 수집으로 계속')
+                replay = False
+                tap.attach()
+            
+            state = await page.evaluate(SCROLL_STATE_JS)
+            new_responses = tap.article_response_count - before_responses
+            
+            if got_response or state['articles'] > before_articles:
+                idle_count = 0
             else:
-                print(f'              🔄 스크롤 위치가 낮음 ({current_scroll}px), 페이지 끝 감지 무시')
-
+                idle_count += 1
+            
+            print(f'            --- 스크롤 {i+1}: 매물 링크 {before_articles} → {state["articles"]}개, '
+                  f'응답 +{new_responses}, 데이터 {before_properties} → {len(all_properties)}개'
+                  f'{f" (연속 {idle_count}번 응답 없음)" if idle_count else ""}')
+            
+            # 전체 매물 수집 진행률 표시
+            if tap.total_property_count > 0:
+                progress_percent = (len(all_properties) / tap.total_property_count) * 100
+                print(f'              📊 수집 진행률: {len(all_properties)}/{tap.total_property_count}개 ({progress_percent:.1f}%)')
+            
             # 🎯 전체 매물 수집 완료 확인 (최우선)
-            if total_property_count > 0 and len(all_properties) >= total_property_count * 0.95:  # 95% 이상 수집
-                print(f'              🎉 전체 매물 수집 완료! {len(all_properties)}/{total_property_count}개 ({len(all_properties)/total_property_count*100:.1f}%)')
+            if tap.total_property_count > 0 and len(all_properties) >= tap.total_property_count * 0.95:  # 95% 이상 수집
+                print(f'              🎉 전체 매물 수집 완료! {len(all_properties)}/{tap.total_property_count}개 ({len(all_properties)/tap.total_property_count*100:.1f}%)')
+                ended_naturally = len(all_properties) >= tap.total_property_count
                 break
             
-            # 연속으로 새 데이터가 없으면 중단 (전체 매물 수가 알려진 경우 더 관대하게)
-            max_attempts = 50 if total_property_count > 0 else 30  # 전체 수를 알면 더 많이 시도
-            if no_new_data_count >= 15 and i <= 30:  # 처음 30번 중에 15번 연속 실패하면 조기 중단
-                print(f'              ⏹️ 초기 수집 완료 (연속 {no_new_data_count}번), 중단')
+            # 페이지 끝에서 응답이 멈추면 종료, 끝이 아니어도 유휴가 길어지면 종료
+            at_bottom = state['scrollY'] > 100 and state['scrollY'] + state['innerHeight'] >= state['scrollHeight'] - 500
+            if at_bottom and idle_count >= 2:
+                print(f'              📍 페이지 끝 도달 + 새 응답 없음: {state["scrollY"]}px / {state["scrollHeight"]}px')
+                ended_naturally = True
                 break
-            elif no_new_data_count >= max_attempts:  # 동적 중단 조건
-                print(f'              ⏹️ 연속 {max_attempts}번 새 데이터 없음, 중단')
+            if idle_count >= self.scroll_idle_limit:
+                print(f'              ⏹️ 연속 {idle_count}번 새 응답 없음, 중단')
                 break
-
-            # 너무 많은 매물이 수집되면 중단 (안전장치)
-            if len(all_properties) >= 3000:  # 3000개 이상 수집되면 중단
-                print(f'              ⏹️ 3000개 이상 수집됨, 중단')
+            
+            # 너무 많은 매물이 수집되면 중단 (안전장치 - 나머지는 타일 분할 수집으로 보완)
+            if len(all_properties) >= self.scroll_result_cap:
+                print(f'              ⏹️ {self.scroll_result_cap}개 이상 수집됨, 중단')
                 break
-
-            i += 1  # 스크롤 카운터 증가
-
-            # 스크롤 간격 조정 (초기에는 빠르게, 나중에는 천천히)
-            sleep_time = 1.0 if i < 20 else 2.0
-            await asyncio.sleep(sleep_time)
+        
+        print(f'            ⏱️ 스크롤 수집: {time.monotonic() - started:.1f}초, API 응답 {tap.article_response_count}개')
+        if ended_naturally:
+            self.naturally_ended_districts.add(district_name)
+        
+        # 진행 중인 API 처리 완료 대기 (변환 전에 모든 페이지 반영)
+        await tap.drain()
+        
+        # ↩️ 이전 (중단된) 실행에서 저장된 매물 병합 - 아래 중복 제거 단계에서 정리됨
+        if tap.checkpoint is not None:
+            all_properties.extend(tap.checkpoint.load_articles())
+        
+        # 🧩 스크롤 상한에 걸려 잘린 밀집 구는 타일 분할 API 수집으로 보완
+        if (self.tiling_enabled and len(all_properties) >= self.scroll_result_cap
+                and tap.total_property_count > len(all_properties)):
+            all_properties.extend(await self.collect_tiled_articles(district_name))
         
         # 최종 결과
-        final_articles = await page.query_selector_all('a[href*="article"]')
+        final_state = await page.evaluate(SCROLL_STATE_JS)
         
         print(f'            📊 최종 결과:')
-        print(f'              매물 링크: {len(final_articles)}개')
+        print(f'              매물 링크: {final_state["articles"]}개')
         print(f'              총 API 요청: {len(api_requests)}개')
+        print(f'              응답 직접 캡처: {tap.captured_count}개 / 재요청: {tap.refetch_count}개 / 직접 페이지 요청: {tap.replayed_count}개')
         print(f'              총 수집된 매물 데이터: {len(all_properties)}개')
         
         # 전체 매물 수집 완성도 표시
-        if total_property_count > 0:
-            completion_percent = (len(all_properties) / total_property_count) * 100
-            print(f'              🎯 수집 완성도: {len(all_properties)}/{total_property_count}개 ({completion_percent:.1f}%)')
+        if tap.total_property_count > 0:
+            completion_percent = (len(all_properties) / tap.total_property_count) * 100
+            print(f'              🎯 수집 완성도: {len(all_properties)}/{tap.total_property_count}개 ({completion_percent:.1f}%)')
             if completion_percent >= 95:
                 print(f'              ✅ 거의 완전 수집 달성!')
             elif completion_percent >= 80:
@@ -637,7 +1054,8 @@ class DistrictCollector:
         print(f'            📊 변환 완료: {len(converted_properties)}개 유효 매물')
         return converted_properties
     
-    def convert_api_property_to_standard(self, api_prop: Dict, district_name: str) -> Optional[Dict[str, Any]]:
+    def convert_api_property_to_standard(self, api_prop: Dict, district_name: str,
+                                         data_source: str = 'infinite_scroll_api') -> Optional[Dict[str, Any]]:
         """API 응답을 표준 매물 형식으로 변환"""
         try:
             # API 응답에서 필요한 데이터 추출
@@ -692,8 +1110,8 @@ class DistrictCollector:
                 'property_type': property_type,
                 'trade_type': trade_type,
                 'naver_link': naver_link,
-                'raw_text': str(api_prop),  # ✅ data_processor가 찾는 raw_text 컬럼으로 저장
-                'data_source': 'infinite_scroll_api',
+                'raw_text': encode_payload(api_prop),  # ✅ compact JSON (data_processor가 찾는 raw_text 컬럼)
+                'data_source': data_source,
                 'collected_at': datetime.now().isoformat(),
                 'article_id': article_no,
                 'cortar_no': cortar_no,  # 행정구역코드 추가
@@ -807,18 +1225,35 @@ class DistrictCollector:
         }
 
 
-async def run_modular_collection():
+async def run_modular_collection(mode: str = 'hybrid', districts: Optional[List[str]] = None,
+                                 max_concurrent_districts: Optional[int] = None, resume_run_id: Optional[str] = None,
+                                 incremental: bool = False, incremental_stop_pages: Optional[int] = None,
+                                 headless: bool = False, block_resources: bool = True):
     """🎯 모듈화된 수집 시스템 실행"""
     collector = DistrictCollector()
+    collector.collection_mode = mode
+    collector.headless = headless
+    collector.browser_controller.block_resources = block_resources
+    collector.incremental = incremental
+    if incremental_stop_pages:
+        collector.incremental_stop_pages = max(1, incremental_stop_pages)
+    if districts:
+        collector.target_districts = districts
+        collector.total_target = len(districts) * collector.max_pages_per_district * 20
+    if max_concurrent_districts:
+        collector.max_concurrent_districts = max(1, max_concurrent_districts)
     
-    print("🎯 === 모듈화된 하이브리드 수집 시스템 시작 ===")
+    print(f"🎯 === 모듈화된 수집 시스템 시작 (모드: {collector.collection_mode}) ===")
     collector.stealth_manager.print_stealth_status()
     
     try:
-        properties = await collector.run_hybrid_collection()
+        if resume_run_id is not None:
+            properties = await collector.resume(resume_run_id or None)
+        else:
+            properties = await collector.run_collection()
         
         print(f"\n🎉 === 수집 완료 ===")
-        print(f"✅ 총 {len(properties)}개 매물 수집 완료")
+        print(f"✅ 총 {collector.total_collected}개 매물 수집 완료")
         
         return properties
         
@@ -826,12 +1261,13 @@ async def run_modular_collection():
         print(f"❌ 수집 시스템 오류: {e}")
         return []
 
-async def run_streamlit_collection(streamlit_params):
-    """🎯 Streamlit에서 호출하는 수집 함수"""
+async def run_streamlit_collection(streamlit_params, raise_errors: bool = False):
+    """🎯 Streamlit에서 호출하는 수집 함수 (수집된 매물 수 반환, raise_errors면 오류를 호출자에게 전달)"""
     collector = DistrictCollector(streamlit_params=streamlit_params)
     
     print("🚀 === Streamlit 수집 시스템 시작 ===")
     print(f"📍 대상 지역: {collector.target_districts}")
+    print(f"🎛️ 수집 모드: {collector.collection_mode}")
     print(f"💰 보증금 범위: {collector.filter_conditions['min_deposit']}~{collector.filter_conditions['max_deposit']}만원")
     print(f"🏠 월세 범위: {collector.filter_conditions['min_monthly_rent']}~{collector.filter_conditions['max_monthly_rent']}만원")
     print(f"📐 면적 범위: {collector.filter_conditions['min_area_pyeong']}~{collector.filter_conditions['max_area_pyeong']}평")
@@ -839,22 +1275,48 @@ async def run_streamlit_collection(streamlit_params):
     collector.stealth_manager.print_stealth_status()
     
     try:
-        properties = await collector.run_hybrid_collection()
+        if streamlit_params.get('resume'):
+            properties = await collector.resume(streamlit_params.get('resume_run_id'))
+        else:
+            properties = await collector.run_collection()
         
         print(f"\n🎉 === Streamlit 수집 완료 ===")
-        print(f"✅ 총 {len(properties)}개 매물 수집 완료")
+        print(f"✅ 총 {collector.total_collected}개 매물 수집 완료")
         
-        return properties
+        return collector.total_collected
         
     except Exception as e:
         print(f"❌ Streamlit 수집 오류: {e}")
-        return []
+        if raise_errors:
+            raise
+        return 0
 
-def run_streamlit_collection_sync(streamlit_params):
+def run_streamlit_collection_sync(streamlit_params, raise_errors: bool = False):
     """🎯 Streamlit용 동기 래퍼 함수"""
-    return asyncio.run(run_streamlit_collection(streamlit_params))
+    return asyncio.run(run_streamlit_collection(streamlit_params, raise_errors=raise_errors))
+
+
+def parse_cli_args(argv=None):
+    """⌨️ 명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="네이버 부동산 구별 매물 수집기")
+    parser.add_argument('--mode', choices=['hybrid', 'api-only'], default='hybrid',
+                        help="hybrid: 브라우저 구만보기 후 수집 / api-only: 브라우저 없이 구별 좌표로 API 직접 수집")
+    parser.add_argument('--districts', nargs='+', default=None, help="수집할 구 목록 (예: 강남구 서초구)")
+    parser.add_argument('--concurrency', type=int, default=None, help="동시 수집 구 수")
+    parser.add_argument('--resume', nargs='?', const='', default=None, metavar='RUN_ID',
+                        help="중단된 수집 이어서 실행 (RUN_ID 생략 시 가장 최근 미완료 실행)")
+    parser.add_argument('--headless', action='store_true', help="브라우저를 화면 없이 실행 (서버 환경)")
+    parser.add_argument('--no-block-resources', action='store_true', help="이미지/폰트/지도 타일 차단 끄기 (전체 페이지 로드)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="증분 수집: 구별 워터마크 이후 새로 올라오거나 다시 확인된 매물만 최신순으로 수집")
+    parser.add_argument('--incremental-stop-pages', type=int, default=None,
+                        help="증분 수집 중단 기준 (워터마크 이전 매물만 있는 페이지 연속 수, 기본 2)")
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
     # 메인 실행
-    asyncio.run(run_modular_collection())
+    args = parse_cli_args()
+    asyncio.run(run_modular_collection(args.mode, args.districts, args.concurrency, args.resume,
+                                       args.incremental, args.incremental_stop_pages, args.headless,
+                                       not args.no_block_resources))
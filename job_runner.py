@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+🧵 JobRunner - 수집 작업 큐 / 워커 프로세스 실행
+- 수집은 Streamlit 서버와 분리된 워커 프로세스에서 실행 (GIL/재실행 영향 없음)
+- 동시에 하나의 작업만 실행 (single-flight, DB 트랜잭션으로 선점)
+- 나머지는 대기열에 쌓였다가 앞 작업이 끝나면 순서대로 실행
+- 작업 상태는 진행률 DB(collection_jobs 테이블)에 기록 → 조회/취소 API
+"""
+
+import argparse
+import json
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from progress_manager import get_progress_manager
+
+
+class JobRunner:
+    """🧵 수집 작업 제출 / 상태 조회 / 취소"""
+
+    ACTIVE_STATUSES = ("queued", "running")
+
+    # 선점 후 이 시간(초)이 지나도 pid가 기록되지 않으면 워커 시작 실패로 간주
+    SPAWN_TIMEOUT = 60
+
+    # 같은 서버 프로세스에서 띄운 워커 (종료 후 좀비 회수용)
+    _workers: Dict[str, subprocess.Popen] = {}
+
+    def __init__(self, db_path: str = "data/collection_progress.db", log_dir: str = "data/jobs"):
+        self.db_path = db_path
+        self.log_dir = log_dir
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        os.makedirs(self.log_dir, exist_ok=True)
+        self.create_tables()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def create_tables(self):
+        """작업 테이블 생성"""
+        conn = self._connect()
+        try:
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS collection_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    params TEXT,
+                    pid INTEGER,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    result INTEGER,
+                    error TEXT,
+                    submitted_at TEXT,
+                    started_at TEXT,
+                    finished_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_collection_jobs_status ON collection_jobs(status, submitted_at);
+            ''')
+        finally:
+            conn.close()
+
+    def submit(self, params: Dict[str, Any]) -> str:
+        """📥 작업 제출 (실행 중인 작업이 없으면 바로 워커 시작)"""
+        job_id = datetime.now().strftime('%Y%m%d_%H%M%S_') + uuid.uuid4().hex[:6]
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO collection_jobs (job_id, status, params, submitted_at) VALUES (?, 'queued', ?, ?)",
+                (job_id, json.dumps(params, ensure_ascii=False), datetime.now().isoformat())
+            )
+        finally:
+            conn.close()
+        print(f"📥 수집 작업 제출: {job_id}")
+        self.dispatch()
+        return job_id
+
+    def dispatch(self) -> Optional[str]:
+        """▶️ 실행 중인 작업이 없으면 가장 오래된 대기 작업의 워커 시작"""
+        self.reap()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                if conn.execute("SELECT 1 FROM collection_jobs WHERE status = 'running'").fetchone():
+                    conn.execute('ROLLBACK')
+                    return None
+                row = conn.execute(
+                    "SELECT job_id FROM collection_jobs WHERE status = 'queued' ORDER BY submitted_at LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    conn.execute('ROLLBACK')
+                    return None
+                job_id = row['job_id']
+                # 워커가 뜨기 전에 먼저 선점 → 다른 프로세스가 같은 작업을 중복 실행하지 않음
+                conn.execute(
+                    "UPDATE collection_jobs SET status = 'running', started_at = ? WHERE job_id = ?",
+                    (datetime.now().isoformat(), job_id)
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        finally:
+            conn.close()
+
+        try:
+            pid = self._spawn_worker(job_id)
+        except Exception as e:
+            self._finish(job_id, 'failed', error=f"워커 시작 실패: {e}")
+            return None
+        self._update(job_id, pid=pid)
+        print(f"▶️ 수집 워커 시작: {job_id} (pid {pid})")
+        return job_id
+
+    def _spawn_worker(self, job_id: str) -> int:
+        log_file = open(os.path.join(self.log_dir, f"{job_id}.log"), 'a', encoding='utf-8')
+        process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--worker', job_id, '--db', self.db_path],
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            cwd=os.getcwd(),
+            env=dict(os.environ, PYTHONUNBUFFERED='1'),
+            start_new_session=True  # Streamlit 재시작/종료 시 함께 죽지 않음
+        )
+        log_file.close()
+        self._workers[job_id] = process
+        return process.pid
+
+    def reap(self):
+        """🧹 워커 프로세스가 비정상 종료됐거나 시작 기록 없이 남은 실행 중 작업을 실패 처리"""
+        conn = self._connect()
+        try:
+            running = conn.execute(
+                "SELECT job_id, pid, started_at FROM collection_jobs WHERE status = 'running'"
+            ).fetchall()
+        finally:
+            conn.close()
+        for row in running:
+            if row['pid'] is None:
+                # 선점 직후 디스패처가 죽으면 pid 없이 'running'으로 남아 대기열 전체가 멈춤
+                started_at = datetime.fromisoformat(row['started_at']) if row['started_at'] else None
+                if started_at is None or (datetime.now() - started_at).total_seconds() > self.SPAWN_TIMEOUT:
+                    self._finish(row['job_id'], 'failed', error="워커 시작이 기록되지 않았습니다")
+                    self._reset_progress()
+            elif not self._is_alive(row['job_id'], row['pid']):
+                self._finish(row['job_id'], 'failed', error="워커 프로세스가 비정상 종료되었습니다")
+                self._reset_progress()
+
+    @staticmethod
+    def _reset_progress():
+        """진행률을 '중지됨'으로 마감 (워커가 정리하지 못하고 끝난 경우 'running'으로 남지 않게)"""
+        progress_manager = get_progress_manager()
+        progress = progress_manager.get_progress()
+        if progress.get('status') == 'running':
+            progress_manager.complete_collection(progress.get('current_properties_collected', 0), success=False)
+
+    def _is_alive(self, job_id: str, pid: int) -> bool:
+        process = self._workers.get(job_id)
+        if process is not None:
+            if process.poll() is None:
+                return True
+            del self._workers[job_id]
+            return False
+        try:
+            os.kill(pid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+
+    def cancel(self, job_id: str, force: bool = False) -> bool:
+        """🛑 작업 취소 (대기 중이면 바로 취소, 실행 중이면 중지 요청 / force면 워커 종료)"""
+        job = self.get_job(job_id)
+        if job is None or job['status'] not in self.ACTIVE_STATUSES:
+            return False
+
+        if job['status'] == 'queued':
+            self._finish(job_id, 'cancelled')
+            print(f"🛑 대기 작업 취소: {job_id}")
+            return True
+
+        self._update(job_id, cancel_requested=1)
+        get_progress_manager().request_stop()
+        if force and job['pid']:
+            try:
+                os.killpg(job['pid'], signal.SIGTERM)
+            except (ProcessLookupError, PermissionError, AttributeError):
+                pass
+            self._finish(job_id, 'cancelled', error="강제 종료")
+            self._reset_progress()
+            self.dispatch()
+        print(f"🛑 실행 중 작업 중지 요청: {job_id}{' (강제 종료)' if force else ''}")
+        return True
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM collection_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (최신순)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT * FROM collection_jobs ORDER BY submitted_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [self._row_to_job(row) for row in rows]
+
+    def active_job(self) -> Optional[Dict[str, Any]]:
+        """실행 중인 작업 (없으면 None)"""
+        self.reap()
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM collection_jobs WHERE status = 'running' LIMIT 1").fetchone()
+        finally:
+            conn.close()
+        return self._row_to_job(row) if row else None
+
+    def status(self, job_id: Optional[str] = None) -> Dict[str, Any]:
+        """📊 작업 상태 + 진행률 (job_id 없으면 실행 중인 작업)"""
+        self.dispatch()
+        job = self.get_job(job_id) if job_id else self.active_job()
+        return {
+            "job": job,
+            "queued": sum(1 for item in self.list_jobs(limit=100) if item['status'] == 'queued'),
+            "progress": get_progress_manager().get_progress() if job and job['status'] == 'running' else None
+        }
+
+    def _update(self, job_id: str, **columns):
+        conn = self._connect()
+        try:
+            assignments = ', '.join(f"{name} = ?" for name in columns)
+            conn.execute(f"UPDATE collection_jobs SET {assignments} WHERE job_id = ?", (*columns.values(), job_id))
+        finally:
+            conn.close()
+
+    def _finish(self, job_id: str, status: str, result: Optional[int] = None, error: Optional[str] = None):
+        """종료 상태 기록 (이미 끝난 작업은 그대로)"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE collection_jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+                "WHERE job_id = ? AND status IN ('queued', 'running')",
+                (status, result, error, datetime.now().isoformat(), job_id)
+            )
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job['params'] = json.loads(job['params']) if job['params'] else {}
+        job['cancel_requested'] = bool(job['cancel_requested'])
+        return job
+
+    def run_worker(self, job_id: str) -> int:
+        """🧵 워커 프로세스 본체: 수집 실행 → 결과 기록 → 다음 대기 작업 시작"""
+        job = self.get_job(job_id)
+        if job is None:
+            print(f"❌ 작업을 찾을 수 없습니다: {job_id}")
+            return 1
+
+        print(f"🧵 수집 워커 시작: {job_id} (pid {os.getpid()})")
+        exit_code = 0
+        try:
+            if job['cancel_requested']:
+                self._finish(job_id, 'cancelled')
+            else:
+                from district_collector import run_streamlit_collection_sync
+                collected = run_streamlit_collection_sync(job['params'], raise_errors=True)
+                cancelled = (self.get_job(job_id) or {}).get('cancel_requested')
+                self._finish(job_id, 'cancelled' if cancelled else 'completed', result=collected)
+                print(f"✅ 수집 작업 종료: {job_id} ({collected}개)")
+        except BaseException as e:
+            self._finish(job_id, 'failed', error=str(e) or type(e).__name__)
+            self._reset_progress()
+            print(f"❌ 수집 작업 실패: {job_id}: {e}")
+            exit_code = 1
+        finally:
+            get_progress_manager().flush()
+            self.dispatch()
+        return exit_code
+
+
+# 싱글톤 인스턴스
+_job_runner = None
+
+def get_job_runner() -> JobRunner:
+    """전역 작업 실행기 인스턴스 반환"""
+    global _job_runner
+    if _job_runner is None:
+        _job_runner = JobRunner()
+    return _job_runner
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="수집 작업 실행기")
+    parser.add_argument('--worker', metavar='JOB_ID', help="워커 모드: 지정한 작업 실행")
+    parser.add_argument('--db', default="data/collection_progress.db", help="진행률/작업 DB 경로")
+    parser.add_argument('--list', action='store_true', help="최근 작업 목록 출력")
+    parser.add_argument('--cancel', metavar='JOB_ID', help="작업 취소")
+    args = parser.parse_args()
+
+    runner = JobRunner(db_path=args.db)
+    if args.worker:
+        sys.exit(runner.run_worker(args.worker))
+    elif args.cancel:
+        runner.cancel(args.cancel)
+    else:
+        for item in runner.list_jobs():
+            print(f"{item['job_id']}  {item['status']:<10} {item['result'] or '-':>6}  {item['error'] or ''}")
@@ -5,15 +5,36 @@
 """
 
 from .stealth_manager import StealthManager
+from .async_transport import AsyncTransport, AiohttpTransport
 from .browser_controller import BrowserController
+from .browser_pool import BrowserPool
 from .api_collector import APICollector
 from .property_parser import PropertyParser
+from .district_scheduler import DistrictScheduler, HostBudget
+from .network_tap import ArticleListTap
+from .tile_planner import QuadtreeTiler, Tile
+from .checkpoint_store import CheckpointStore
+from .db_sink import StreamingDBSink
+from .raw_payload import RawPayloadStore
+from .progress_stream import ProgressStreamServer
 
 __all__ = [
     'StealthManager',
+    'AsyncTransport',
+    'AiohttpTransport',
     'BrowserController', 
+    'BrowserPool',
     'APICollector',
-    'PropertyParser'
+    'PropertyParser',
+    'DistrictScheduler',
+    'HostBudget',
+    'ArticleListTap',
+    'QuadtreeTiler',
+    'Tile',
+    'CheckpointStore',
+    'StreamingDBSink',
+    'RawPayloadStore',
+    'ProgressStreamServer'
 ]
 
 __version__ = "1.0.0"
@@ -12,6 +12,9 @@ import asyncio
 import time
 from typing import List, Dict, Any, Optional
 from .stealth_manager import StealthManager
+from .async_transport import AsyncTransport, AiohttpTransport, CONNECTION_ERRORS
+from .tile_planner import QuadtreeTiler, Tile, is_rejection
+from .checkpoint_store import is_newer_than_watermark
 
 # 진행률 관리자 임포트
 try:
@@ -25,11 +28,59 @@ except ImportError:
         return DummyProgressManager()
 
 
+# 서울시 25개 구별 좌표 (인접 지역 10% 겹침 허용 - 매물 누락 최소화)
+SEOUL_DISTRICT_COORDS = {
+    # 강남 3구 (10-15% 겹침 허용으로 매물 누락 최소화)
+    '강남구': {'lat': 37.516, 'lon': 127.055, 'btm': 37.485, 'lft': 127.030, 'top': 37.550, 'rgt': 127.085},
+    '서초구': {'lat': 37.485, 'lon': 127.015, 'btm': 37.455, 'lft': 126.980, 'top': 37.515, 'rgt': 127.050},
+    '송파구': {'lat': 37.515, 'lon': 127.115, 'btm': 37.485, 'lft': 127.090, 'top': 37.545, 'rgt': 127.145},
+    
+    # 강동 지역 (10% 겹침 허용)
+    '강동구': {'lat': 37.545, 'lon': 127.135, 'btm': 37.520, 'lft': 127.115, 'top': 37.570, 'rgt': 127.155},
+    '광진구': {'lat': 37.555, 'lon': 127.085, 'btm': 37.535, 'lft': 127.065, 'top': 37.575, 'rgt': 127.105},
+    '성동구': {'lat': 37.560, 'lon': 127.045, 'btm': 37.540, 'lft': 127.025, 'top': 37.580, 'rgt': 127.065},
+    
+    # 동북 지역 (10% 겹침 허용)
+    '동대문구': {'lat': 37.585, 'lon': 127.045, 'btm': 37.565, 'lft': 127.025, 'top': 37.605, 'rgt': 127.065},
+    '중랑구': {'lat': 37.605, 'lon': 127.080, 'btm': 37.585, 'lft': 127.060, 'top': 37.625, 'rgt': 127.100},
+    '성북구': {'lat': 37.595, 'lon': 127.015, 'btm': 37.575, 'lft': 126.995, 'top': 37.615, 'rgt': 127.035},
+    '강북구': {'lat': 37.625, 'lon': 127.025, 'btm': 37.605, 'lft': 127.005, 'top': 37.645, 'rgt': 127.045},
+    '도봉구': {'lat': 37.665, 'lon': 127.035, 'btm': 37.645, 'lft': 127.015, 'top': 37.685, 'rgt': 127.055},
+    '노원구': {'lat': 37.645, 'lon': 127.075, 'btm': 37.615, 'lft': 127.055, 'top': 37.675, 'rgt': 127.095},
+    
+    # 서북 지역 (10% 겹침 허용)
+    '은평구': {'lat': 37.605, 'lon': 126.925, 'btm': 37.585, 'lft': 126.905, 'top': 37.625, 'rgt': 126.945},
+    '서대문구': {'lat': 37.575, 'lon': 126.945, 'btm': 37.555, 'lft': 126.925, 'top': 37.595, 'rgt': 126.965},
+    '마포구': {'lat': 37.565, 'lon': 126.915, 'btm': 37.545, 'lft': 126.895, 'top': 37.585, 'rgt': 126.935},
+    
+    # 중심 지역 (10% 겹침 허용)
+    '종로구': {'lat': 37.585, 'lon': 126.985, 'btm': 37.565, 'lft': 126.965, 'top': 37.605, 'rgt': 127.005},
+    '중구': {'lat': 37.565, 'lon': 126.985, 'btm': 37.545, 'lft': 126.965, 'top': 37.585, 'rgt': 127.005},
+    '용산구': {'lat': 37.535, 'lon': 126.975, 'btm': 37.515, 'lft': 126.955, 'top': 37.555, 'rgt': 126.995},
+    
+    # 서남 지역 (10% 겹침 허용)
+    '강서구': {'lat': 37.565, 'lon': 126.825, 'btm': 37.545, 'lft': 126.805, 'top': 37.585, 'rgt': 126.845},
+    '양천구': {'lat': 37.525, 'lon': 126.845, 'btm': 37.505, 'lft': 126.825, 'top': 37.545, 'rgt': 126.865},
+    '구로구': {'lat': 37.485, 'lon': 126.865, 'btm': 37.465, 'lft': 126.845, 'top': 37.505, 'rgt': 126.885},
+    '금천구': {'lat': 37.465, 'lon': 126.905, 'btm': 37.445, 'lft': 126.885, 'top': 37.485, 'rgt': 126.925},
+    '영등포구': {'lat': 37.525, 'lon': 126.915, 'btm': 37.505, 'lft': 126.895, 'top': 37.545, 'rgt': 126.935},
+    
+    # 남부 지역 (10% 겹침 허용)
+    '동작구': {'lat': 37.495, 'lon': 126.965, 'btm': 37.475, 'lft': 126.945, 'top': 37.515, 'rgt': 126.985},
+    '관악구': {'lat': 37.475, 'lon': 126.945, 'btm': 37.455, 'lft': 126.925, 'top': 37.495, 'rgt': 126.965}
+}
+
+
+
 class APICollector:
     """🚀 네이버 부동산 API를 통한 매물 수집 클래스"""
     
-    def __init__(self, stealth_manager: StealthManager, streamlit_filters=None):
+    def __init__(self, stealth_manager: StealthManager, streamlit_filters=None,
+                 transport: Optional[AsyncTransport] = None):
         self.stealth_manager = stealth_manager
+        # ⚡ 비동기 전송 계층 (외부에서 주입하면 여러 수집기가 커넥션 풀 공유)
+        self._owns_transport = transport is None
+        self.transport = transport or AiohttpTransport(stealth_manager)
         # 🔄 API URL 교체: HTTP 307 차단 회피
         self.api_urls = [
             'https://m.land.naver.com/cluster/ajax/articleList',  # 기존 URL
@@ -45,6 +96,14 @@ class APICollector:
         # 🎯 중복 감지 시스템
         self.collected_article_ids = set()  # 이미 수집된 article_no 저장
         self.duplicate_count = 0            # 중복 발견 카운터
+        self.params_rejected = False        # 마지막 수집에서 API가 파라미터를 거부했는지
+        self.collection_stopped = False     # 마지막 수집이 중지 요청으로 끝났는지
+        self.collection_errored = False     # 정상 응답 없이 네트워크/일시 오류로만 끝났는지
+        self.ended_naturally = False        # 목록 끝(more=false / 빈 페이지 / 워터마크 통과)까지 수집했는지
+        
+        # 🛡️ 단일 쿼리 수집 상한 (초과 매물은 타일 분할 수집으로 보완)
+        self.max_results_per_query = 2000   # 강제 안전 제한
+        self.browser_miss_limit = 3000      # 브라우저 매물 수 감지 실패 시 안전 제한
         
         # 동적 API 파라미터 (Streamlit 필터 반영)
         self.base_api_params = self._build_api_params_from_filters()
@@ -85,8 +144,10 @@ class APICollector:
             'cortarNo': ''
         }
     
-    async def collect_with_api_params(self, api_params: Dict[str, Any], district_name: str, max_pages: int = 20) -> List[Dict[str, Any]]:
-        """🌐 API 파라미터로 대량 수집"""
+    async def collect_with_api_params(self, api_params: Dict[str, Any], district_name: str, max_pages: int = 20,
+                                      checkpoint=None, on_page=None, watermark: Optional[Dict[str, Any]] = None,
+                                      watermark_stop_pages: int = 2) -> List[Dict[str, Any]]:
+        """🌐 API 파라미터로 대량 수집 (watermark: 최신순 정렬 후 워터마크를 넘으면 중단하는 증분 수집)"""
         print(f"            🌐 API 파라미터 추출 완료, 대량 수집 시작...")
         
         # 🔧 지역별 API URL 리셋 (중요: 이전 지역에서 무효화된 URL 복구)
@@ -126,50 +187,18 @@ class APICollector:
         else:
             # 폴백: 기존 하드코딩 좌표 사용
             print(f"            ⚠️ 브라우저 파라미터 없음, 기본 좌표 사용")
-            
-        # 서울시 25개 구별 좌표 (인접 지역 10% 겹침 허용 - 매물 누락 최소화)
-        district_coords = {
-            # 강남 3구 (10-15% 겹침 허용으로 매물 누락 최소화)
-            '강남구': {'lat': 37.516, 'lon': 127.055, 'btm': 37.485, 'lft': 127.030, 'top': 37.550, 'rgt': 127.085},
-            '서초구': {'lat': 37.485, 'lon': 127.015, 'btm': 37.455, 'lft': 126.980, 'top': 37.515, 'rgt': 127.050},
-            '송파구': {'lat': 37.515, 'lon': 127.115, 'btm': 37.485, 'lft': 127.090, 'top': 37.545, 'rgt': 127.145},
-            
-            # 강동 지역 (10% 겹침 허용)
-            '강동구': {'lat': 37.545, 'lon': 127.135, 'btm': 37.520, 'lft': 127.115, 'top': 37.570, 'rgt': 127.155},
-            '광진구': {'lat': 37.555, 'lon': 127.085, 'btm': 37.535, 'lft': 127.065, 'top': 37.575, 'rgt': 127.105},
-            '성동구': {'lat': 37.560, 'lon': 127.045, 'btm': 37.540, 'lft': 127.025, 'top': 37.580, 'rgt': 127.065},
-            
-            # 동북 지역 (10% 겹침 허용)
-            '동대문구': {'lat': 37.585, 'lon': 127.045, 'btm': 37.565, 'lft': 127.025, 'top': 37.605, 'rgt': 127.065},
-            '중랑구': {'lat': 37.605, 'lon': 127.080, 'btm': 37.585, 'lft': 127.060, 'top': 37.625, 'rgt': 127.100},
-            '성북구': {'lat': 37.595, 'lon': 127.015, 'btm': 37.575, 'lft': 126.995, 'top': 37.615, 'rgt': 127.035},
-            '강북구': {'lat': 37.625, 'lon': 127.025, 'btm': 37.605, 'lft': 127.005, 'top': 37.645, 'rgt': 127.045},
-            '도봉구': {'lat': 37.665, 'lon': 127.035, 'btm': 37.645, 'lft': 127.015, 'top': 37.685, 'rgt': 127.055},
-            '노원구': {'lat': 37.645, 'lon': 127.075, 'btm': 37.615, 'lft': 127.055, 'top': 37.675, 'rgt': 127.095},
-            
-            # 서북 지역 (10% 겹침 허용)
-            '은평구': {'lat': 37.605, 'lon': 126.925, 'btm': 37.585, 'lft': 126.905, 'top': 37.625, 'rgt': 126.945},
-            '서대문구': {'lat': 37.575, 'lon': 126.945, 'btm': 37.555, 'lft': 126.925, 'top': 37.595, 'rgt': 126.965},
-            '마포구': {'lat': 37.565, 'lon': 126.915, 'btm': 37.545, 'lft': 126.895, 'top': 37.585, 'rgt': 126.935},
-            
-            # 중심 지역 (10% 겹침 허용)
-            '종로구': {'lat': 37.585, 'lon': 126.985, 'btm': 37.565, 'lft': 126.965, 'top': 37.605, 'rgt': 127.005},
-            '중구': {'lat': 37.565, 'lon': 126.985, 'btm': 37.545, 'lft': 126.965, 'top': 37.585, 'rgt': 127.005},
-            '용산구': {'lat': 37.535, 'lon': 126.975, 'btm': 37.515, 'lft': 126.955, 'top': 37.555, 'rgt': 126.995},
-            
-            # 서남 지역 (10% 겹침 허용)
-            '강서구': {'lat': 37.565, 'lon': 126.825, 'btm': 37.545, 'lft': 126.805, 'top': 37.585, 'rgt': 126.845},
-            '양천구': {'lat': 37.525, 'lon': 126.845, 'btm': 37.505, 'lft': 126.825, 'top': 37.545, 'rgt': 126.865},
-            '구로구': {'lat': 37.485, 'lon': 126.865, 'btm': 37.465, 'lft': 126.845, 'top': 37.505, 'rgt': 126.885},
-            '금천구': {'lat': 37.465, 'lon': 126.905, 'btm': 37.445, 'lft': 126.885, 'top': 37.485, 'rgt': 126.925},
-            '영등포구': {'lat': 37.525, 'lon': 126.915, 'btm': 37.505, 'lft': 126.895, 'top': 37.545, 'rgt': 126.935},
-            
-            # 남부 지역 (10% 겹침 허용)
-            '동작구': {'lat': 37.495, 'lon': 126.965, 'btm': 37.475, 'lft': 126.945, 'top': 37.515, 'rgt': 126.985},
-            '관악구': {'lat': 37.475, 'lon': 126.945, 'btm': 37.455, 'lft': 126.925, 'top': 37.495, 'rgt': 126.965}
-        }
         
-        coords = district_coords.get(district_name, district_coords['강남구'])
+        self._apply_district_bounds(request_params, district_name)
+        if watermark is not None:
+            request_params['sort'] = 'dates'  # 최신 확인순
+        
+        return await self.stealth_mass_collect(request_params, district_name, max_pages,
+                                               checkpoint=checkpoint, on_page=on_page,
+                                               watermark=watermark, watermark_stop_pages=watermark_stop_pages)
+    
+    def _apply_district_bounds(self, request_params: Dict[str, Any], district_name: str) -> Dict[str, Any]:
+        """📍 구별 좌표 범위 + 조건.md 필터 적용"""
+        coords = SEOUL_DISTRICT_COORDS.get(district_name, SEOUL_DISTRICT_COORDS['강남구'])
         
         request_params.update({
             'lat': str(coords['lat']),
@@ -183,18 +212,87 @@ class APICollector:
             'rprcMax': '130',      # 월세 최대 130만원  
             'spcMin': '66'         # 면적 최소 66㎡ = 20평
         })
+        return request_params
+    
+    async def collect_with_tiles(self, district_name: str, split_threshold: int = 1000, max_depth: int = 4,
+                                 max_parallel_tiles: int = 4, max_pages_per_tile: int = 200,
+                                 checkpoint=None, on_page=None) -> List[Dict[str, Any]]:
+        """🧩 구 좌표 범위를 쿼드트리로 분할해 단일 쿼리 상한 없이 수집"""
+        print(f"            🧩 {district_name} 타일 분할 수집 시작 (분할 임계값 {split_threshold}개, 최대 깊이 {max_depth})")
         
-        return await self.stealth_mass_collect(request_params, district_name, max_pages)
+        self.current_api_index = 0
+        self.api_url = self.api_urls[self.current_api_index]
+        self.stealth_manager.set_persona(self.stealth_manager.get_random_persona())
+        
+        request_params = self._apply_district_bounds(self.base_api_params.copy(), district_name)
+        coords = SEOUL_DISTRICT_COORDS.get(district_name, SEOUL_DISTRICT_COORDS['강남구'])
+        
+        async def page_wait():
+            await asyncio.sleep(self.stealth_manager.get_human_wait_time())
+        
+        tiler = QuadtreeTiler(
+            self.transport, self.api_url, request_params,
+            split_threshold=split_threshold,
+            max_depth=max_depth,
+            max_parallel_tiles=max_parallel_tiles,
+            max_pages_per_tile=max_pages_per_tile,
+            page_wait=page_wait,
+            progress_manager=self.progress_manager,
+            checkpoint=checkpoint,
+            on_page=on_page,
+            district_name=district_name
+        )
+        raw_articles = await tiler.collect(Tile.from_coords(coords))
+        
+        self._record_outcome(district_name, tiler.params_accepted, tiler.rejection_seen,
+                             self.progress_manager.is_stop_requested())
+        self.ended_naturally = tiler.complete
+        
+        all_properties = []
+        for article in raw_articles:
+            try:
+                processed_property = self.process_api_property(article, district_name)
+                if processed_property:
+                    all_properties.append(processed_property)
+            except Exception as prop_error:
+                print(f"                     ⚠️ 매물 처리 오류 (건너뜀): {prop_error}", flush=True)
+        
+        print(f"            ✅ {district_name} 타일 수집 완료: {len(all_properties)}개", flush=True)
+        return all_properties
     
-    async def stealth_mass_collect(self, api_params: Dict[str, Any], district_name: str, max_pages: int = 500) -> List[Dict[str, Any]]:
-        """🥷 스텔스 모드로 대량 수집"""
+    async def stealth_mass_collect(self, api_params: Dict[str, Any], district_name: str, max_pages: int = 500,
+                                   checkpoint=None, on_page=None, watermark: Optional[Dict[str, Any]] = None,
+                                   watermark_stop_pages: int = 2) -> List[Dict[str, Any]]:
+        """🥷 스텔스 모드로 대량 수집 (checkpoint: 페이지마다 저장/재개, on_page: 페이지별 원시 매물 콜백,
+        watermark: 워터마크 이전 매물만 있는 페이지가 watermark_stop_pages번 연속되면 중단)"""
         print(f"            🥷 스텔스 API 수집 시작 (최대 {max_pages}페이지)")
+        if watermark is not None:
+            print(f"            🔁 증분 수집: 워터마크 {watermark.get('confirm_date')} / {watermark.get('article_id')} "
+                  f"(이전 매물만 있는 페이지 {watermark_stop_pages}번 연속 시 중단)")
         
         all_properties = []
         current_page = 1
         consecutive_failures = 0
+        pages_past_watermark = 0
+        params_accepted = False
+        rejection_seen = False  # 파라미터 거부 응답 (200 비목록 / 4xx) - 일시 오류(429/5xx/예외)와 구분
+        stopped = False
+        ended_naturally = False  # 상한/오류가 아니라 목록 끝에 도달해서 끝났는지 (워터마크 전진 기준)
+        pages_skipped = False    # 오류로 건너뛴 페이지가 있으면 목록 끝에 닿아도 완전 수집 아님
         max_failures = 3
         
+        # ↩️ 체크포인트 복원 (이전 실행에서 저장된 매물 + 다음 페이지부터 이어서)
+        if checkpoint is not None:
+            cursor = checkpoint.get_cursor('bbox')
+            for article in checkpoint.load_articles():
+                processed_property = self.process_api_property(article, district_name)
+                if processed_property:
+                    all_properties.append(processed_property)
+            if cursor:
+                current_page = cursor['page'] + 1
+                params_accepted = True
+                print(f"            ↩️ 체크포인트 재개: {len(all_properties)}개 복원, {current_page}페이지부터", flush=True)
+        
         # 페르소나 설정
         self.stealth_manager.set_persona(self.stealth_manager.get_random_persona())
         
@@ -215,6 +313,7 @@ class APICollector:
                 # 1. 사용자 중지 요청
                 if self.progress_manager.is_stop_requested():
                     print(f"                  🛑 수집 중지 요청 감지 → 중단 (페이지 {current_page})", flush=True)
+                    stopped = True
                     break
                 
                 # 2. 시간 제한 체크 (구별 60분)
@@ -229,14 +328,6 @@ class APICollector:
             try:
                 print(f"               📄 {current_page}페이지 (스텔스 모드)...", flush=True)
                 
-                # 🛡️ HTTP 307 방지: 세션 재생성 (매 5페이지마다)
-                if current_page % 5 == 1 or current_page == 1:
-                    print(f"                  🔄 세션 재생성 (페이지 {current_page})", flush=True)
-                    self.stealth_manager.create_stealth_session_pool()
-                
-                # 스텔스 세션 가져오기
-                session = self.stealth_manager.get_stealth_session()
-                
                 # API 요청 파라미터
                 params = api_params.copy()
                 params['page'] = current_page
@@ -244,13 +335,12 @@ class APICollector:
                 # 첫 페이지가 아니면 대기
                 if current_page > 1:
                     wait_time = self.stealth_manager.get_human_wait_time()
-                    self.stealth_manager.wait_with_message(wait_time, f"({self.stealth_manager.current_persona} 패턴)")
+                    await self.stealth_manager.async_wait_with_message(wait_time, f"({self.stealth_manager.current_persona} 패턴)")
                 
-                # API 호출
-                response = session.get(self.api_url, params=params, timeout=30)
+                # API 호출 (비동기 - 이벤트 루프 비차단)
+                status_code, data = await self.transport.get_json(self.api_url, params=params, timeout=30)
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if status_code == 200:
                     
                     # 총 매물 수 확인 (첫 페이지에서)
                     if current_page == 1:
@@ -283,7 +373,7 @@ class APICollector:
                             print(f"                  📊 총 {total_count}개 매물 확인됨", flush=True)
                             # 진행률 관리자에 총 개수 업데이트 (안전 처리)
                             try:
-                                self.progress_manager.update_page_progress(current_page, 0, total_count)
+                                self.progress_manager.update_page_progress(current_page, 0, total_count, district_name=district_name)
                             except:
                                 pass
                         else:
@@ -294,24 +384,36 @@ class APICollector:
                     # 기존 시스템과 동일한 응답 처리
                     if 'body' in data and isinstance(data['body'], list):
                         articles = data['body']
+                        page_listed = True
                     else:
                         articles = data.get('data', {}).get('ARTICLE', [])
+                        page_listed = isinstance(data.get('data', {}).get('ARTICLE'), list)
+                    params_accepted = params_accepted or page_listed
+                    if not page_listed:
+                        rejection_seen = rejection_seen or is_rejection(status_code, data)
                     
                     if articles:
                         print(f"                  ✅ {len(articles)}개 원시 데이터", flush=True)
                         
                         # 매물 처리 (안전한 처리)
                         processed_count = 0
+                        page_articles = []
                         for article in articles:
                             try:
                                 processed_property = self.process_api_property(article, district_name)
                                 if processed_property:
                                     all_properties.append(processed_property)
+                                    page_articles.append(article)
                                     processed_count += 1
                             except Exception as prop_error:
                                 print(f"                     ⚠️ 매물 처리 오류 (건너뜀): {prop_error}", flush=True)
                                 continue
                         
+                        if checkpoint is not None:
+                            await asyncio.to_thread(checkpoint.save_page, 'bbox', current_page, articles)
+                        if on_page is not None and page_articles:
+                            on_page(page_articles)
+                        
                         unique_count = len(self.collected_article_ids)
                         print(f"                  ✅ {processed_count}개 처리 완료 (누적: {len(all_properties)}개, 유니크: {unique_count}개)", flush=True)
                         if self.duplicate_count > 0:
@@ -321,10 +423,21 @@ class APICollector:
                         # 진행률 업데이트 (안전 처리)
                         try:
                             browser_total = getattr(self, '_browser_total_count', None)
-                            self.progress_manager.update_page_progress(current_page, processed_count, browser_total)
+                            self.progress_manager.update_page_progress(current_page, processed_count, browser_total,
+                                                                    district_name=district_name)
                         except:
                             pass
                         
+                        # 🔁 증분 수집: 새 매물이 없는 페이지가 연속되면 중단 (최신순 정렬이라 이후는 모두 이전 매물)
+                        if watermark is not None:
+                            new_in_page = sum(1 for article in articles if is_newer_than_watermark(article, watermark))
+                            pages_past_watermark = 0 if new_in_page else pages_past_watermark + 1
+                            if pages_past_watermark >= watermark_stop_pages:
+                                print(f"                  🔁 워터마크 통과 {pages_past_watermark}페이지 연속 → 증분 수집 완료 "
+                                      f"({current_page}페이지, {len(all_properties)}개)", flush=True)
+                                ended_naturally = True
+                                break
+                        
                         # 수집 종료 조건 확인
                         more_value = data.get('more', 'unknown')
                         unique_count = len(self.collected_article_ids)
@@ -334,17 +447,20 @@ class APICollector:
                         if browser_total and unique_count >= browser_total:
                             print(f"                  🎯 브라우저 정확한 매물 수 도달: {unique_count}/{browser_total}개", flush=True)
                             print(f"                  ✅ 브라우저-API 동기화 완료! (+{len(all_properties) - browser_total}개 차이)", flush=True)
+                            ended_naturally = True
                             break
                         
                         if hasattr(self, '_total_count'):
                             print(f"                  🔍 디버그: _total_count={self._total_count}, 현재={len(all_properties)}개, 유니크={unique_count}개, more={more_value}", flush=True)
                             if self._total_count is not None and len(all_properties) >= self._total_count:
                                 print(f"                  🎯 전체 매물 수집 완료: {len(all_properties)}/{self._total_count}개", flush=True)
+                                ended_naturally = True
                                 break
                         
                         # 'more' 필드로 종료 조건 확인 (API가 더 이상 데이터 없음을 알림)
                         if 'more' in data and not data['more']:
                             print(f"                  🎯 API 응답 완료: 더 이상 데이터 없음 (총 {len(all_properties)}개 수집)", flush=True)
+                            ended_naturally = True
                             break
                         
                         # 🛡️ 빈 응답 연속 감지 (안전장치 강화)
@@ -371,17 +487,18 @@ class APICollector:
                                     print(f"                  ✅ 완벽한 브라우저-API 동기화 달성! (정확히 일치)", flush=True)
                                 else:
                                     print(f"                  ✅ 브라우저-API 동기화 완료! ({difference:+d}개 차이)", flush=True)
+                                ended_naturally = True
                                 break
                         else:
                             # 브라우저 매물 수를 감지하지 못한 경우에만 경고
-                            if len(all_properties) >= 3000:  # 매우 높은 안전 제한
+                            if len(all_properties) >= self.browser_miss_limit:  # 매우 높은 안전 제한
                                 print(f"                  ⚠️ 브라우저 매물 수 감지 실패 - 안전 제한 도달: {len(all_properties)}개", flush=True)
                                 print(f"                  🔧 브라우저 감지 로직 개선 필요", flush=True)
                                 break
                         
                         # 강제 안전 제한 (비정상 상황 방지)
-                        if len(all_properties) >= 2000:
-                            print(f"                  ⚠️ 안전 제한 도달: 2000개 수집 완료 (more={more_value})", flush=True)
+                        if len(all_properties) >= self.max_results_per_query:
+                            print(f"                  ⚠️ 안전 제한 도달: {self.max_results_per_query}개 수집 완료 (more={more_value})", flush=True)
                             break
                         
                         # 5페이지마다 긴 휴식
@@ -393,21 +510,23 @@ class APICollector:
                         print(f"                  ⚠️ {current_page}페이지: 매물 없음", flush=True)
                         consecutive_failures += 1
                         
-                        # 연속 3페이지 매물 없으면 수집 종료
+                        # 연속 3페이지 매물 없으면 수집 종료 (정상 목록의 빈 페이지 = 목록 끝)
                         if consecutive_failures >= 3:
                             print(f"                  🛑 연속 {consecutive_failures}페이지 매물 없음 → 수집 종료", flush=True)
+                            ended_naturally = page_listed
                             break
                 else:
-                    print(f"                  ❌ {current_page}페이지: HTTP {response.status_code}", flush=True)
+                    print(f"                  ❌ {current_page}페이지: HTTP {status_code}", flush=True)
+                    rejection_seen = rejection_seen or is_rejection(status_code)
                     
                     # 🛡️ HTTP 307 리다이렉트 특별 처리: API URL 교체
-                    if response.status_code == 307:
+                    if status_code == 307:
                         print(f"                  🔄 HTTP 307 감지: API URL 교체 시도", flush=True)
                         if self.current_api_index < len(self.api_urls) - 1:
                             self.current_api_index += 1
                             self.api_url = self.api_urls[self.current_api_index]
                             print(f"                  🔄 새 API URL: {self.api_url}", flush=True)
-                            self.stealth_manager.create_stealth_session_pool()
+                            await self.transport.reset()
                             # 즉시 재시도 (페이지 증가 없이)
                             continue
                         else:
@@ -415,6 +534,7 @@ class APICollector:
                             break
                     
                     consecutive_failures += 1
+                    pages_skipped = True
                     
                     # 연속 5페이지 HTTP 오류시 수집 종료
                     if consecutive_failures >= 5:
@@ -428,12 +548,21 @@ class APICollector:
                 print(f"                  ❌ {current_page}페이지 수집 오류: {e}", flush=True)
                 print(f"                  🔍 상세 오류: {traceback.format_exc()}", flush=True)
                 consecutive_failures += 1
+                pages_skipped = True
                 current_page += 1
                 
+                # 커넥션 오류일 때만 세션 재생성 (정상일 때는 keep-alive 커넥션 계속 재사용)
+                if isinstance(e, CONNECTION_ERRORS):
+                    print(f"                  🔄 커넥션 오류 → 세션 재생성", flush=True)
+                    await self.transport.reset()
+                
                 # 오류 시 더 긴 대기
                 error_wait = self.stealth_manager.get_human_wait_time(long_wait=True)
                 await asyncio.sleep(error_wait)
         
+        self._record_outcome(district_name, params_accepted, rejection_seen, stopped)
+        self.ended_naturally = ended_naturally and not stopped and not pages_skipped
+        
         unique_count = len(self.collected_article_ids)
         print(f"            ✅ {district_name} 신중한 수집 완료: {len(all_properties)}개 (유니크: {unique_count}개)", flush=True)
         if self.duplicate_count > 0:
@@ -442,6 +571,21 @@ class APICollector:
         
         return all_properties
     
+    def _record_outcome(self, district_name: str, params_accepted: bool, rejection_seen: bool, stopped: bool):
+        """정상 응답이 없을 때 원인 구분: 중지 요청 / API 파라미터 거부 (브라우저 폴백 대상) / 일시 오류"""
+        self.collection_stopped = stopped
+        self.params_rejected = not params_accepted and not stopped and rejection_seen
+        self.collection_errored = not params_accepted and not stopped and not rejection_seen
+        if self.params_rejected:
+            print(f"            ⚠️ {district_name}: API가 요청 파라미터를 거부함 (정상 목록 응답 없음)", flush=True)
+        elif self.collection_errored:
+            print(f"            ⚠️ {district_name}: 정상 응답 없이 오류로 종료 (파라미터 거부 아님)", flush=True)
+    
+    async def close(self) -> None:
+        """🔒 전송 계층 종료 (직접 생성한 경우에만)"""
+        if self._owns_transport:
+            await self.transport.close()
+    
     def process_api_property(self, prop, district_name: str) -> Optional[Dict[str, Any]]:
         """🏠 API 매물 데이터 처리 (중복 감지 포함)"""
         try:
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+⚡ AsyncTransport - 비동기 HTTP 전송 계층
+- 이벤트 루프를 막지 않는 API 호출
+- 커넥션 풀 (keep-alive) 재사용
+- 스텔스 헤더 / User-Agent 로테이션
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+# 커넥션이 끊겼거나 응답이 없어 세션을 새로 만들어야 하는 오류 (HTTP 상태 오류는 해당 없음)
+CONNECTION_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, OSError)
+
+
+class AsyncTransport(ABC):
+    """⚡ 비동기 HTTP 전송 인터페이스 (APICollector 등에서 사용)"""
+
+    @abstractmethod
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                       headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> Tuple[int, Optional[Any]]:
+        """GET 요청 후 (HTTP 상태코드, JSON 본문) 반환 - 200이 아니면 본문은 None"""
+
+    @abstractmethod
+    async def reset(self) -> None:
+        """🔄 세션 재생성 (User-Agent/쿠키 교체)"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """🔒 커넥션 풀 종료"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class AiohttpTransport(AsyncTransport):
+    """⚡ aiohttp 기반 풀링 전송 구현"""
+
+    def __init__(self, stealth_manager=None, pool_limit: int = 10, limit_per_host: int = 4,
+                 extra_headers: Optional[Dict[str, str]] = None, host_budget=None):
+        self.stealth_manager = stealth_manager
+        self.pool_limit = pool_limit
+        self.limit_per_host = limit_per_host
+        self.extra_headers = extra_headers or {}
+        self.host_budget = host_budget  # 여러 전송 계층이 공유하는 호스트별 요청 예산 (선택)
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self.request_count = 0
+
+    def _build_headers(self) -> Dict[str, str]:
+        """스텔스 매니저의 헤더 세트를 사용 (없으면 기본 모바일 헤더)"""
+        if self.stealth_manager is not None:
+            headers = self.stealth_manager.build_stealth_headers()
+        else:
+            headers = {
+                'Accept': 'application/json, text/plain, */*',
+                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+                'Referer': 'https://m.land.naver.com/',
+            }
+        headers.update(self.extra_headers)
+        return headers
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """세션 지연 생성 (실행 중인 이벤트 루프에서 생성해야 함)"""
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    connector = aiohttp.TCPConnector(
+                        limit=self.pool_limit,
+                        limit_per_host=self.limit_per_host,
+                        keepalive_timeout=30
+                    )
+                    self._session = aiohttp.ClientSession(
+                        connector=connector,
+                        headers=self._build_headers()
+                    )
+        return self._session
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                       headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> Tuple[int, Optional[Any]]:
+        session = await self._get_session()
+        query = {key: str(value) for key, value in (params or {}).items() if value is not None}
+
+        if self.host_budget is not None:
+            async with self.host_budget.slot(url):
+                return await self._request_json(session, url, query, headers, timeout)
+        return await self._request_json(session, url, query, headers, timeout)
+
+    async def _request_json(self, session: aiohttp.ClientSession, url: str, query: Dict[str, str],
+                            headers: Optional[Dict[str, str]], timeout: float) -> Tuple[int, Optional[Any]]:
+        self.request_count += 1
+        async with session.get(url, params=query, headers=headers,
+                               timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status != 200:
+                return response.status, None
+            # requests.Response.json()과 동일하게 파싱 실패 시 예외 전파
+            data = await response.json(content_type=None)
+            return response.status, data
+
+    async def reset(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def close(self) -> None:
+        await self.reset()
@@ -4,19 +4,123 @@
 - 네이버 지도 네비게이션
 - "구만 보기" 버튼 클릭
 - 목록 모드 전환
-- 페이지 인터랙션
+- 페이지 인터랙션 (고정 sleep 대신 선택자/응답 이벤트 대기, 단계별 소요 시간 기록)
+- 리소스 차단 (허용 목록 밖의 이미지/폰트/지도 타일/분석 요청 중단)
 """
 
-import asyncio
 import re
-from typing import Optional, Dict, Any, Tuple
-from playwright.async_api import Page
+import time
+from typing import Optional, Dict, Any, Iterable, Tuple
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+
+# 📱 모바일(iPhone) 브라우저 컨텍스트 설정
+MOBILE_CONTEXT_OPTIONS = {
+    'viewport': {'width': 390, 'height': 844},
+    'user_agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1',
+    'device_scale_factor': 3,
+    'is_mobile': True,
+    'has_touch': True,
+    'locale': 'ko-KR',
+    'timezone_id': 'Asia/Seoul'
+}
+
+
+# 🚧 리소스 차단 기본 설정 (articleList XHR과 '구만 보기' 버튼에 필요한 것만 허용)
+DEFAULT_ALLOWED_RESOURCE_TYPES = ('document', 'script', 'stylesheet', 'xhr', 'fetch')
+DEFAULT_ALLOW_URL_PATTERNS = ('articleList', '/cluster/', '/api/')   # 종류와 관계없이 항상 허용
+DEFAULT_BLOCK_URL_PATTERNS = (                                         # 허용 종류여도 차단 (분석/광고)
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'wcs.naver.net', 'lcs.naver.com', 'nlog.naver.com', 'tivan.naver.com', 'veta.naver.com'
+)
+
+# 차단한 요청 1건당 추정 절감 바이트 (실제로 받지 않으므로 종류별 평균값 사용)
+ESTIMATED_BLOCKED_BYTES = {'image': 25_000, 'font': 60_000, 'media': 300_000, 'script': 40_000}
+
+
+class ResourceFilter:
+    """🚧 페이지 요청 차단 + 구별 절감 통계"""
+
+    def __init__(self, allowed_resource_types: Optional[Iterable[str]] = None,
+                 allow_url_patterns: Optional[Iterable[str]] = None,
+                 block_url_patterns: Optional[Iterable[str]] = None):
+        self.allowed_resource_types = set(allowed_resource_types or DEFAULT_ALLOWED_RESOURCE_TYPES)
+        self.allow_url_patterns = tuple(DEFAULT_ALLOW_URL_PATTERNS if allow_url_patterns is None else allow_url_patterns)
+        self.block_url_patterns = tuple(DEFAULT_BLOCK_URL_PATTERNS if block_url_patterns is None else block_url_patterns)
+        self.stats = {
+            'allowed_requests': 0,
+            'blocked_requests': 0,
+            'blocked_by_type': {},
+            'loaded_bytes': 0,
+            'estimated_saved_bytes': 0
+        }
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """허용 URL 패턴 → 차단 URL 패턴 → 리소스 종류 순으로 판단"""
+        if any(pattern in url for pattern in self.allow_url_patterns):
+            return False
+        if any(pattern in url for pattern in self.block_url_patterns):
+            return True
+        return resource_type not in self.allowed_resource_types
+
+    async def attach(self, page: Page) -> 'ResourceFilter':
+        await page.route('**/*', self.handle_route)
+        page.on('response', self.handle_response)
+        return self
+
+    async def handle_route(self, route) -> None:
+        request = route.request
+        try:
+            if self.should_block(request.resource_type, request.url):
+                self.stats['blocked_requests'] += 1
+                by_type = self.stats['blocked_by_type']
+                by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+                self.stats['estimated_saved_bytes'] += ESTIMATED_BLOCKED_BYTES.get(request.resource_type, 2_000)
+                await route.abort('blockedbyclient')
+            else:
+                self.stats['allowed_requests'] += 1
+                await route.continue_()
+        except Exception:
+            pass  # 페이지/컨텍스트가 이미 닫힌 경우
+
+    def handle_response(self, response) -> None:
+        length = response.headers.get('content-length', '')
+        if length.isdigit():
+            self.stats['loaded_bytes'] += int(length)
+
+    def summary(self) -> str:
+        blocked_types = ', '.join(f"{kind} {count}" for kind, count in
+                                  sorted(self.stats['blocked_by_type'].items(), key=lambda item: -item[1]))
+        return (f"요청 {self.stats['blocked_requests']}개 차단 ({blocked_types or '-'}), "
+                f"약 {self.stats['estimated_saved_bytes'] / 1024 / 1024:.1f}MB 절감 추정, "
+                f"허용 {self.stats['allowed_requests']}개 / 수신 {self.stats['loaded_bytes'] / 1024 / 1024:.1f}MB")
 
 
 class BrowserController:
     """🌐 브라우저 제어를 담당하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, block_resources: bool = True, allowed_resource_types: Optional[Iterable[str]] = None,
+                 allow_url_patterns: Optional[Iterable[str]] = None, block_url_patterns: Optional[Iterable[str]] = None):
+        # 🚧 리소스 차단 설정 (block_resources=False면 전체 지도 페이지 로드)
+        self.block_resources = block_resources
+        self.allowed_resource_types = allowed_resource_types
+        self.allow_url_patterns = allow_url_patterns
+        self.block_url_patterns = block_url_patterns
+        
+        # ⏱️ 단계별 대기 상한 (ms) - 조건이 충족되면 즉시 다음 단계로 진행
+        self.step_timeouts = {
+            'page_load': 30000,        # page.goto (domcontentloaded)
+            'button_appear': 8000,     # 로딩 중 '구만 보기' 버튼 등장
+            'network_idle': 10000,     # 버튼이 안 보일 때 networkidle 대기
+            'button_after_idle': 3000,
+            'interaction': 1500,       # 스크롤/탭 후 버튼 등장
+            'button_click': 5000,
+            'filter_response': 5000,   # 버튼 클릭 후 articleList 응답
+            'list_button': 3000,       # 목록 버튼 등장
+            'list_response': 5000      # 목록 전환 후 첫 articleList 응답
+        }
+        self.step_timings: Dict[str, Dict[str, float]] = {}  # {구: {단계: 초}}
+        
         # 기본 네이버 지도 URL (필터 적용된 상태)
         self.base_map_url = "https://m.land.naver.com/map/37.5665:126.9780:12/SG:SMS/B2?wprcMax=2000&rprcMax=130&spcMin=66&flrMin=-1&flrMax=2"
         
@@ -62,32 +166,51 @@ class BrowserController:
             '관악구': {'lat': 37.475, 'lon': 126.945, 'btm': 37.455, 'lft': 126.925, 'top': 37.495, 'rgt': 126.965}
         }
     
-    async def create_mobile_context(self, playwright):
-        """📱 모바일 브라우저 컨텍스트 생성"""
-        browser = await playwright.chromium.launch(headless=False)
-        context = await browser.new_context(
-            viewport={'width': 390, 'height': 844},
-            user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 17_1_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1',
-            device_scale_factor=3,
-            is_mobile=True,
-            has_touch=True,
-            locale='ko-KR',
-            timezone_id='Asia/Seoul'
-        )
+    async def create_mobile_context(self, playwright, headless: bool = False):
+        """📱 모바일 브라우저 컨텍스트 생성 (브라우저 1회용 - 여러 구는 BrowserPool 사용)"""
+        browser = await playwright.chromium.launch(headless=headless)
+        context = await browser.new_context(**MOBILE_CONTEXT_OPTIONS)
         page = await context.new_page()
         return browser, context, page
     
+    async def apply_resource_filter(self, page: Page) -> Optional[ResourceFilter]:
+        """🚧 페이지에 리소스 차단 적용 (비활성화 시 None)"""
+        if not self.block_resources:
+            return None
+        resource_filter = ResourceFilter(self.allowed_resource_types, self.allow_url_patterns, self.block_url_patterns)
+        return await resource_filter.attach(page)
+    
+    def _record_step(self, district_name: str, step: str, started: float) -> float:
+        """⏱️ 단계별 실제 소요 시간 기록"""
+        elapsed = time.monotonic() - started
+        self.step_timings.setdefault(district_name, {})[step] = round(elapsed, 3)
+        print(f"         ⏱️ {district_name} {step}: {elapsed:.2f}초")
+        return elapsed
+    
+    def district_button(self, page: Page, district_name: str):
+        """🔍 '구만 보기' 버튼 통합 locator (선택자 하나로 한 번에 탐색)"""
+        label = f"{district_name}만 보기"
+        return page.locator(
+            f"button:has-text('{label}'), a:has-text('{label}'), [role='button']:has-text('{label}')"
+        ).or_(page.get_by_text(label)).first
+    
+    @staticmethod
+    def _is_article_list_response(response) -> bool:
+        return 'articleList' in response.url and response.status == 200
+    
     async def navigate_to_map_and_apply_district_filter(self, page: Page, district_name: str) -> bool:
         """🗺️ 지도로 이동하고 구별 필터 적용"""
         print(f"         🌐 {district_name} 집중 탐색 시작...")
+        self.step_timings[district_name] = {}
         
         try:
             # 구별 맞춤 URL 생성
             district_url = self.create_district_focused_url(district_name)
             print(f"         🌐 {district_name} 맞춤 URL 접속...")
             
-            await page.goto(district_url, wait_until='domcontentloaded', timeout=30000)
-            await asyncio.sleep(2)
+            started = time.monotonic()
+            await page.goto(district_url, wait_until='domcontentloaded', timeout=self.step_timeouts['page_load'])
+            self._record_step(district_name, '페이지 로드', started)
             
             # 페이지 로딩 중에 버튼 찾기 시도
             success = await self.search_during_page_load(page, district_name)
@@ -113,39 +236,43 @@ class BrowserController:
             return f"https://m.land.naver.com/map/{coords['lat']}:{coords['lon']}:12/SG:SMS/B2?wprcMax=2000&rprcMax=130&spcMin=66&flrMin=-1&flrMax=2"
         return self.base_map_url
     
+    async def wait_for_district_button(self, page: Page, district_name: str, timeout: float) -> bool:
+        """⏳ 버튼이 나타나는 즉시 반환 (timeout ms까지 대기)"""
+        try:
+            await self.district_button(page, district_name).wait_for(state='visible', timeout=timeout)
+            return True
+        except Exception:
+            return False
+    
     async def search_during_page_load(self, page: Page, district_name: str) -> bool:
         """⏳ 페이지 로딩 중 버튼 탐색"""
         print(f"         ⏳ 페이지 로딩 중 {district_name}만 보기 버튼 탐색...")
         
-        max_attempts = 10
-        for attempt in range(1, max_attempts + 1):
-            try:
-                await asyncio.sleep(0.5)
-                
-                if await self.check_district_button_exists(page, district_name):
-                    print(f"         ✅ 로딩 중 {district_name}만 보기 버튼 발견! (시도 {attempt})")
-                    return await self.attempt_button_click(page, district_name)
-                    
-            except Exception as e:
-                if attempt == max_attempts:
-                    print(f"         ⚠️ 로딩 중 탐색 실패: {e}")
+        started = time.monotonic()
+        if await self.wait_for_district_button(page, district_name, self.step_timeouts['button_appear']):
+            self._record_step(district_name, '버튼 탐색', started)
+            print(f"         ✅ 로딩 중 {district_name}만 보기 버튼 발견!")
+            return await self.attempt_button_click(page, district_name)
         
+        self._record_step(district_name, '버튼 탐색 (실패)', started)
         return False
     
     async def search_after_page_load(self, page: Page, district_name: str) -> bool:
         """✅ 페이지 로딩 완료 후 버튼 탐색"""
         print(f"         ✅ 로딩 완료 후 {district_name}만 보기 버튼 탐색...")
         
+        started = time.monotonic()
         try:
-            await page.wait_for_load_state('networkidle', timeout=10000)
-            await asyncio.sleep(2)
-            
-            if await self.check_district_button_exists(page, district_name):
-                print(f"         ✅ 로딩 완료 후 {district_name}만 보기 버튼 발견!")
-                return await self.attempt_button_click(page, district_name)
-                
+            await page.wait_for_load_state('networkidle', timeout=self.step_timeouts['network_idle'])
         except Exception as e:
-            print(f"         ⚠️ 로딩 완료 후 탐색 실패: {e}")
+            print(f"         ⚠️ 네트워크 대기 시간 초과: {e}")
+        self._record_step(district_name, '네트워크 안정화', started)
+        
+        started = time.monotonic()
+        if await self.wait_for_district_button(page, district_name, self.step_timeouts['button_after_idle']):
+            self._record_step(district_name, '로딩 후 버튼 탐색', started)
+            print(f"         ✅ 로딩 완료 후 {district_name}만 보기 버튼 발견!")
+            return await self.attempt_button_click(page, district_name)
         
         return False
     
@@ -161,11 +288,12 @@ class BrowserController:
         
         for i, interaction in enumerate(interactions, 1):
             try:
+                started = time.monotonic()
                 if interaction:
                     await interaction()
-                await asyncio.sleep(1)
                 
-                if await self.check_district_button_exists(page, district_name):
+                if await self.wait_for_district_button(page, district_name, self.step_timeouts['interaction']):
+                    self._record_step(district_name, f'인터랙션 {i} 후 버튼 탐색', started)
                     print(f"         ✅ 인터랙션 {i} 후 {district_name}만 보기 버튼 발견!")
                     return await self.attempt_button_click(page, district_name)
                     
@@ -175,106 +303,85 @@ class BrowserController:
         return False
     
     async def check_district_button_exists(self, page: Page, district_name: str) -> bool:
-        """🔍 구만 보기 버튼 존재 확인"""
-        selectors = [
-            f"button:has-text('{district_name}만 보기')",
-            f"a:has-text('{district_name}만 보기')",
-            f"div:has-text('{district_name}만 보기')",
-            f"span:has-text('{district_name}만 보기')",
-            f"*:has-text('{district_name}만')",
-        ]
-        
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    text = await element.text_content()
-                    if district_name in text and '보기' in text:
-                        return True
-            except:
-                continue
-        
-        return False
+        """🔍 구만 보기 버튼 존재 확인 (대기 없이 현재 상태만)"""
+        try:
+            return await self.district_button(page, district_name).count() > 0
+        except Exception:
+            return False
     
     async def attempt_button_click(self, page: Page, district_name: str) -> bool:
-        """🎯 버튼 클릭 시도"""
+        """🎯 버튼 클릭 후 목록 요청(articleList)이 나오면 바로 다음 단계로"""
+        started = time.monotonic()
         try:
-            # 더 정확한 선택자들
-            selectors = [
-                f"button:has-text('{district_name}만 보기')",
-                f"a:has-text('{district_name}만 보기')",
-                f"div[role='button']:has-text('{district_name}만 보기')",
-                f"*:has-text('{district_name}만 보기')"
-            ]
+            button = self.district_button(page, district_name)
+            text = (await button.text_content(timeout=self.step_timeouts['button_click']) or '').strip()
+            print(f"         🎯 {district_name}만 보기 버튼 클릭: \"{text}\"")
             
-            for selector in selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        if district_name in text and '보기' in text:
-                            print(f"         🎯 {district_name}만 보기 버튼 클릭: \"{text.strip()}\"")
-                            await element.click()
-                            await asyncio.sleep(2)
-                            print(f"         ✅ {district_name}만 보기 클릭 완료")
-                            return True
-                except Exception as e:
-                    continue
+            clicked = False
+            try:
+                async with page.expect_response(self._is_article_list_response,
+                                                timeout=self.step_timeouts['filter_response']):
+                    await button.click(timeout=self.step_timeouts['button_click'])
+                    clicked = True
+            except PlaywrightTimeoutError:
+                if not clicked:
+                    raise
+                # 클릭은 됐지만 목록 요청이 바로 나오지 않는 경우 (목록 모드 전환 시 요청됨)
             
-            print(f"         ❌ {district_name}만 보기 버튼 클릭 실패")
-            return False
+            self._record_step(district_name, '버튼 클릭', started)
+            print(f"         ✅ {district_name}만 보기 클릭 완료")
+            return True
             
         except Exception as e:
-            print(f"         ❌ 버튼 클릭 중 오류: {e}")
+            print(f"         ❌ {district_name}만 보기 버튼 클릭 실패: {e}")
             return False
     
-    async def switch_to_list_mode(self, page: Page) -> bool:
-        """📋 목록 모드로 전환"""
+    async def switch_to_list_mode(self, page: Page, district_name: str = '') -> bool:
+        """📋 목록 모드로 전환 (첫 articleList 응답까지 대기)"""
         print(f"         📋 목록 모드 전환 중...")
         
+        started = time.monotonic()
         try:
-            # 목록 모드 버튼 찾기
-            list_selectors = [
-                "button:has-text('목록')",
-                "a:has-text('목록')",
-                "*[data-nclicks*='list']",
-                "*:has-text('목록')"
-            ]
+            # 목록 모드 버튼 (통합 locator)
+            list_button = page.locator(
+                "button:has-text('목록'), a:has-text('목록'), *[data-nclicks*='list']"
+            ).or_(page.get_by_text('목록', exact=True)).first
             
-            for selector in list_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        await element.click()
-                        await asyncio.sleep(2)
-                        print(f"         ✅ 목록 모드 활성화")
-                        return True
-                except:
-                    continue
+            try:
+                await list_button.wait_for(state='visible', timeout=self.step_timeouts['list_button'])
+                async with page.expect_response(self._is_article_list_response,
+                                                timeout=self.step_timeouts['list_response']):
+                    await list_button.click()
+                self._record_step(district_name, '목록 모드 전환', started)
+                print(f"         ✅ 목록 모드 활성화")
+                return True
+            except Exception as e:
+                print(f"         ⚠️ 목록 버튼 전환 실패, JavaScript로 시도: {type(e).__name__}")
             
             # JavaScript로 목록 모드 활성화 (더 안전한 방법)
             try:
-                # 목록 모드 JavaScript 실행
-                await page.evaluate("""
-                    // 목록 모드로 전환하는 다양한 시도
-                    if (window.location.hash !== '#mapFullList') {
-                        window.location.hash = '#mapFullList';
-                    }
-                    
-                    // 목록 관련 버튼이나 요소 클릭 시도
-                    const listButtons = document.querySelectorAll('[data-nclicks*="list"], button[class*="list"], a[class*="list"]');
-                    for (let btn of listButtons) {
-                        if (btn.textContent.includes('목록')) {
-                            btn.click();
-                            break;
+                async with page.expect_response(self._is_article_list_response,
+                                                timeout=self.step_timeouts['list_response']):
+                    # 목록 모드 JavaScript 실행
+                    await page.evaluate("""
+                        // 목록 모드로 전환하는 다양한 시도
+                        if (window.location.hash !== '#mapFullList') {
+                            window.location.hash = '#mapFullList';
                         }
-                    }
-                """)
-                await asyncio.sleep(3)
+                        
+                        // 목록 관련 버튼이나 요소 클릭 시도
+                        const listButtons = document.querySelectorAll('[data-nclicks*="list"], button[class*="list"], a[class*="list"]');
+                        for (let btn of listButtons) {
+                            if (btn.textContent.includes('목록')) {
+                                btn.click();
+                                break;
+                            }
+                        }
+                    """)
+                self._record_step(district_name, '목록 모드 전환 (JavaScript)', started)
                 print(f"         ✅ 목록 모드 활성화 (JavaScript)")
-                return True
-            except:
-                pass
+            except Exception:
+                self._record_step(district_name, '목록 모드 전환 (응답 없음)', started)
             
             return True
             
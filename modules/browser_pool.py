@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+🏊 BrowserPool - 브라우저 프로세스 재사용 풀
+- Chromium 프로세스를 미리 띄워 두고 구마다 격리된 BrowserContext만 새로 발급
+- 헤드리스 실행 지원 (서버 환경)
+- 컨텍스트는 N회 사용 후 폐기, 브라우저는 N개 컨텍스트 발급 후 재시작 (메모리 누수 방지)
+- 재사용 컨텍스트는 쿠키/스토리지/권한/라우트를 비운 뒤 반환 (비우지 못하면 폐기)
+- 비정상 종료된 브라우저는 자동으로 교체
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from .browser_controller import MOBILE_CONTEXT_OPTIONS
+
+
+class _BrowserSlot:
+    """풀 안의 브라우저 프로세스 1개"""
+
+    __slots__ = ('browser', 'leases', 'active', 'idle_contexts')
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.leases = 0          # 지금까지 발급한 컨텍스트 수
+        self.active = 0          # 사용 중인 컨텍스트 수
+        self.idle_contexts: List[List[Any]] = []  # [context, 사용 횟수] (재사용 대기)
+
+
+class BrowserPool:
+    """🏊 warm 브라우저 풀 (구별 컨텍스트 발급)"""
+
+    # 페이지를 닫기 전에 방문한 오리진의 스토리지 비우기 (오리진 단위라 페이지 안에서만 가능)
+    CLEAR_STORAGE_JS = '() => { localStorage.clear(); sessionStorage.clear(); }'
+
+    def __init__(self, playwright, size: int = 1, headless: bool = False,
+                 max_context_uses: int = 1, max_browser_uses: int = 20,
+                 context_options: Optional[Dict[str, Any]] = None, launch_options: Optional[Dict[str, Any]] = None):
+        self.playwright = playwright
+        self.size = max(1, size)
+        self.headless = headless
+        self.max_context_uses = max(1, max_context_uses)  # 1이면 구마다 새 컨텍스트
+        self.max_browser_uses = max(1, max_browser_uses)
+        self.context_options = dict(context_options or MOBILE_CONTEXT_OPTIONS)
+        self.launch_options = dict(launch_options or {})
+
+        self._slots: List[_BrowserSlot] = []
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self.stats = {'browser_launches': 0, 'contexts_created': 0, 'contexts_reused': 0}
+
+    async def _launch(self) -> _BrowserSlot:
+        started = time.monotonic()
+        browser = await self.playwright.chromium.launch(headless=self.headless, **self.launch_options)
+        self.stats['browser_launches'] += 1
+        print(f"         🏊 브라우저 풀: Chromium 시작 ({'헤드리스' if self.headless else '화면 표시'}, "
+              f"{time.monotonic() - started:.1f}초)")
+        return _BrowserSlot(browser)
+
+    async def _pick_slot(self) -> _BrowserSlot:
+        """사용 가능한 브라우저 선택 (끊긴/수명 다한 브라우저 정리, 부족하면 새로 시작)"""
+        for slot in list(self._slots):
+            if not slot.browser.is_connected():
+                print("         ⚠️ 브라우저 풀: 연결 끊긴 브라우저 교체")
+                self._slots.remove(slot)
+            elif slot.leases >= self.max_browser_uses and slot.active == 0:
+                await self._retire(slot)
+
+        # 수명이 남은 브라우저가 size개보다 적으면 새로 시작 (수명 다한 브라우저는 사용이 끝나면 종료)
+        candidates = [slot for slot in self._slots if slot.leases < self.max_browser_uses]
+        if len(candidates) < self.size:
+            slot = await self._launch()
+            self._slots.append(slot)
+            return slot
+        return min(candidates, key=lambda item: item.active)
+
+    async def _retire(self, slot: _BrowserSlot):
+        """브라우저 종료 (재시작 주기 도달)"""
+        if slot in self._slots:
+            self._slots.remove(slot)
+        try:
+            await slot.browser.close()
+            print(f"         ♻️ 브라우저 풀: 컨텍스트 {slot.leases}개 발급한 브라우저 재시작")
+        except Exception:
+            pass
+
+    async def acquire(self):
+        """🎫 (context, page, 반환용 핸들) 발급"""
+        if self._closed:
+            raise RuntimeError("닫힌 브라우저 풀입니다")
+
+        async with self._lock:
+            slot = await self._pick_slot()
+            slot.leases += 1
+            slot.active += 1
+            entry = slot.idle_contexts.pop() if slot.idle_contexts else None
+
+        try:
+            if entry is not None:
+                context, uses = entry
+                self.stats['contexts_reused'] += 1
+            else:
+                context, uses = await slot.browser.new_context(**self.context_options), 0
+                self.stats['contexts_created'] += 1
+            page = await context.new_page()
+        except Exception:
+            slot.active -= 1
+            raise
+        return context, page, (slot, uses + 1)
+
+    async def release(self, context, handle):
+        """🎫 컨텍스트 반환 (사용 횟수가 남았으면 페이지만 닫고 재사용 대기)"""
+        slot, uses = handle
+        slot.active -= 1
+        reusable = (not self._closed and uses < self.max_context_uses
+                    and slot.leases < self.max_browser_uses and slot.browser.is_connected())
+        try:
+            if reusable and await self._reset_context(context):
+                slot.idle_contexts.append([context, uses])
+            else:
+                await context.close()
+        except Exception as e:
+            print(f"         ⚠️ 브라우저 풀: 컨텍스트 정리 오류 ({e})")
+
+        if slot.leases >= self.max_browser_uses and slot.active == 0:
+            async with self._lock:
+                await self._retire(slot)
+
+    async def _reset_context(self, context) -> bool:
+        """🧹 재사용 전 이전 구의 흔적 제거 (쿠키/로컬·세션 스토리지/권한/라우트), 실패하면 False → 폐기"""
+        try:
+            for page in list(context.pages):
+                for frame in page.frames:
+                    if frame.url.startswith('http'):
+                        await frame.evaluate(self.CLEAR_STORAGE_JS)
+                await page.close()
+            await context.clear_cookies()
+            await context.clear_permissions()
+            if hasattr(context, 'unroute_all'):
+                await context.unroute_all()
+            return True
+        except Exception as e:
+            print(f"         ⚠️ 브라우저 풀: 컨텍스트 초기화 실패 → 폐기 ({e})")
+            return False
+
+    @asynccontextmanager
+    async def page(self):
+        """📱 격리된 컨텍스트의 새 페이지 (블록 종료 시 반환)"""
+        context, page, handle = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(context, handle)
+
+    async def close(self):
+        """🔒 모든 브라우저 종료"""
+        self._closed = True
+        async with self._lock:
+            for slot in list(self._slots):
+                try:
+                    await slot.browser.close()
+                except Exception:
+                    pass
+            self._slots.clear()
+        print(f"         🏊 브라우저 풀 종료: 브라우저 {self.stats['browser_launches']}회 시작, "
+              f"컨텍스트 {self.stats['contexts_created']}개 생성 / {self.stats['contexts_reused']}회 재사용")
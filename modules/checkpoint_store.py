@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+💾 CheckpointStore - 수집 체크포인트 / 재개
+- 실행(run) 단위 상태 저장 (SQLite, data/ 폴더)
+- 구/타일별 마지막 페이지 커서
+- 페이지 단위로 원시 매물 저장 (atclNo 기준 중복 제거)
+- 중단/비정상 종료 후 이어서 수집
+- 구별 워터마크 (가장 최근 확인일자 atclCfmYmd / 매물번호) → 증분 수집 중단 기준
+"""
+
+import json
+import os
+import sqlite3
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+def confirm_date_key(value: Any) -> Optional[str]:
+    """atclCfmYmd ('25.01.15.' / '2025.01.15' / '20250115') → 'YYYYMMDD' (해석 불가 시 None)"""
+    if value is None:
+        return None
+    digits = ''.join(ch for ch in str(value) if ch.isdigit())
+    if len(digits) == 6:
+        return '20' + digits
+    if len(digits) == 8:
+        return digits
+    return None
+
+
+def _article_number(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def is_newer_than_watermark(article: Dict[str, Any], watermark: Dict[str, Any]) -> bool:
+    """🔁 워터마크 이후 새로 올라오거나 다시 확인된 매물인지
+
+    확인일자가 더 최근이면 신규, 같은 날이면 그날 이미 본 매물번호가 아닐 때만 신규,
+    확인일자가 없으면 매물번호가 지금까지 본 최대값보다 클 때 신규
+    """
+    confirm_date = confirm_date_key(article.get('atclCfmYmd'))
+    if confirm_date is None or not watermark.get('confirm_date'):
+        return _article_number(article.get('atclNo')) > watermark.get('article_id', 0)
+    if confirm_date != watermark['confirm_date']:
+        return confirm_date > watermark['confirm_date']
+    return str(article.get('atclNo')) not in watermark.get('seen_ids', set())
+
+
+class CheckpointStore:
+    """💾 SQLite 기반 수집 체크포인트 저장소"""
+
+    def __init__(self, db_path: str = "data/crawl_checkpoint.db"):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        self.create_tables()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def create_tables(self):
+        """체크포인트 테이블 생성"""
+        conn = self._connect()
+        try:
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS crawl_runs (
+                    run_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    params TEXT,
+                    created_at TEXT,
+                    updated_at TEXT
+                );
+                CREATE TABLE IF NOT EXISTS crawl_districts (
+                    run_id TEXT NOT NULL,
+                    district TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    properties INTEGER DEFAULT 0,
+                    updated_at TEXT,
+                    PRIMARY KEY (run_id, district)
+                );
+                CREATE TABLE IF NOT EXISTS crawl_cursors (
+                    run_id TEXT NOT NULL,
+                    district TEXT NOT NULL,
+                    tile TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    state TEXT NOT NULL,
+                    updated_at TEXT,
+                    PRIMARY KEY (run_id, district, tile)
+                );
+                CREATE TABLE IF NOT EXISTS crawl_articles (
+                    run_id TEXT NOT NULL,
+                    district TEXT NOT NULL,
+                    atcl_no TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (run_id, district, atcl_no)
+                );
+                CREATE TABLE IF NOT EXISTS crawl_watermarks (
+                    district TEXT PRIMARY KEY,
+                    confirm_date TEXT,
+                    article_id INTEGER NOT NULL DEFAULT 0,
+                    seen_ids TEXT,
+                    updated_at TEXT
+                );
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ---- 실행(run) 단위 ----
+
+    def start_run(self, districts: List[str], params: Optional[Dict[str, Any]] = None) -> str:
+        """🆕 새 실행 등록 후 run_id 반환"""
+        run_id = datetime.now().strftime('%Y%m%d_%H%M%S_') + uuid.uuid4().hex[:6]
+        now = datetime.now().isoformat()
+        run_params = dict(params or {})
+        run_params['districts'] = list(districts)
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                'INSERT INTO crawl_runs (run_id, status, params, created_at, updated_at) VALUES (?, ?, ?, ?, ?)',
+                (run_id, 'running', json.dumps(run_params, ensure_ascii=False), now, now)
+            )
+            conn.executemany(
+                'INSERT OR IGNORE INTO crawl_districts (run_id, district, status, updated_at) VALUES (?, ?, ?, ?)',
+                [(run_id, district, 'pending', now) for district in districts]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        print(f"💾 체크포인트 실행 등록: {run_id}")
+        return run_id
+
+    def set_run_status(self, run_id: str, status: str):
+        """실행 상태 변경 ('running' | 'stopped' | 'incomplete' | 'completed')"""
+        conn = self._connect()
+        try:
+            conn.execute('UPDATE crawl_runs SET status = ?, updated_at = ? WHERE run_id = ?',
+                         (status, datetime.now().isoformat(), run_id))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def prune_run(self, run_id: str) -> int:
+        """🧹 완료된 실행의 페이지 단위 데이터(매물/커서) 삭제 - 실행/구 상태 기록은 유지"""
+        conn = self._connect()
+        try:
+            with conn:
+                deleted = conn.execute('DELETE FROM crawl_articles WHERE run_id = ?', (run_id,)).rowcount
+                conn.execute('DELETE FROM crawl_cursors WHERE run_id = ?', (run_id,))
+        finally:
+            conn.close()
+        return deleted
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """실행 정보 조회"""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT run_id, status, params, created_at, updated_at FROM crawl_runs WHERE run_id = ?',
+                               (run_id,)).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+        return {
+            'run_id': row[0],
+            'status': row[1],
+            'params': json.loads(row[2]) if row[2] else {},
+            'created_at': row[3],
+            'updated_at': row[4]
+        }
+
+    def latest_resumable_run(self) -> Optional[Dict[str, Any]]:
+        """↩️ 완료되지 않은 가장 최근 실행 (중지 또는 비정상 종료)"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT run_id FROM crawl_runs WHERE status != 'completed' ORDER BY created_at DESC LIMIT 1"
+            ).fetchone()
+        finally:
+            conn.close()
+        return self.get_run(row[0]) if row else None
+
+    # ---- 구 단위 ----
+
+    def set_district_status(self, run_id: str, district: str, status: str, properties: int = 0):
+        """구 상태 변경 ('pending' | 'running' | 'done')"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                '''INSERT INTO crawl_districts (run_id, district, status, properties, updated_at)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(run_id, district) DO UPDATE SET
+                       status = excluded.status, properties = excluded.properties, updated_at = excluded.updated_at''',
+                (run_id, district, status, properties, datetime.now().isoformat())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_district_status(self, run_id: str, district: str) -> Optional[str]:
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT status FROM crawl_districts WHERE run_id = ? AND district = ?',
+                               (run_id, district)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def for_district(self, run_id: str, district: str) -> 'DistrictCheckpoint':
+        """구별 체크포인트 뷰 (수집기에 전달)"""
+        return DistrictCheckpoint(self, run_id, district)
+
+    # ---- 페이지 단위 ----
+
+    def save_page(self, run_id: str, district: str, tile: str, page: int,
+                  articles: List[Dict[str, Any]], state: str = 'partial'):
+        """📄 페이지 매물 + 커서를 한 트랜잭션으로 저장"""
+        rows = []
+        for article in articles:
+            if isinstance(article, dict) and article.get('atclNo'):
+                rows.append((run_id, district, str(article['atclNo']),
+                             json.dumps(article, ensure_ascii=False, separators=(',', ':'))))
+
+        conn = self._connect()
+        try:
+            with conn:
+                if rows:
+                    conn.executemany(
+                        'INSERT OR REPLACE INTO crawl_articles (run_id, district, atcl_no, payload) VALUES (?, ?, ?, ?)',
+                        rows
+                    )
+                conn.execute(
+                    '''INSERT INTO crawl_cursors (run_id, district, tile, page, state, updated_at)
+                       VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(run_id, district, tile) DO UPDATE SET
+                           page = excluded.page, state = excluded.state, updated_at = excluded.updated_at''',
+                    (run_id, district, tile, page, state, datetime.now().isoformat())
+                )
+        finally:
+            conn.close()
+
+    def get_cursor(self, run_id: str, district: str, tile: str) -> Optional[Dict[str, Any]]:
+        """마지막 저장 커서 {'page', 'state'} (없으면 None)"""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT page, state FROM crawl_cursors WHERE run_id = ? AND district = ? AND tile = ?',
+                               (run_id, district, tile)).fetchone()
+        finally:
+            conn.close()
+        return {'page': row[0], 'state': row[1]} if row else None
+
+    def load_articles(self, run_id: str, district: str) -> List[Dict[str, Any]]:
+        """구별 저장된 원시 매물 목록"""
+        conn = self._connect()
+        try:
+            rows = conn.execute('SELECT payload FROM crawl_articles WHERE run_id = ? AND district = ?',
+                                (run_id, district)).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(row[0]) for row in rows]
+
+    def seen_ids(self, run_id: str, district: str) -> Set[str]:
+        """구별 저장된 atclNo 집합"""
+        conn = self._connect()
+        try:
+            rows = conn.execute('SELECT atcl_no FROM crawl_articles WHERE run_id = ? AND district = ?',
+                                (run_id, district)).fetchall()
+        finally:
+            conn.close()
+        return {row[0] for row in rows}
+
+    # ---- 구별 워터마크 (증분 수집) ----
+
+    def get_watermark(self, district: str) -> Optional[Dict[str, Any]]:
+        """구별 워터마크 {'confirm_date', 'article_id', 'seen_ids'} (전체 수집 기록이 없으면 None)"""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT confirm_date, article_id, seen_ids, updated_at FROM crawl_watermarks '
+                               'WHERE district = ?', (district,)).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+        return {
+            'confirm_date': row[0],
+            'article_id': row[1],
+            'seen_ids': set(json.loads(row[2])) if row[2] else set(),
+            'updated_at': row[3]
+        }
+
+    def update_watermark(self, district: str, articles: Iterable[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """🔁 수집한 원시 매물로 워터마크 전진 (가장 최근 확인일자 + 그날 본 매물번호)"""
+        watermark = self.get_watermark(district) or {'confirm_date': None, 'article_id': 0, 'seen_ids': set()}
+        confirm_date = watermark['confirm_date']
+        seen_ids = set(watermark['seen_ids'])
+        article_id = watermark['article_id']
+
+        for article in articles:
+            if not isinstance(article, dict) or not article.get('atclNo'):
+                continue
+            article_id = max(article_id, _article_number(article['atclNo']))
+            article_date = confirm_date_key(article.get('atclCfmYmd'))
+            if article_date is None:
+                continue
+            if confirm_date is None or article_date > confirm_date:
+                confirm_date = article_date
+                seen_ids = set()
+            if article_date == confirm_date:
+                seen_ids.add(str(article['atclNo']))
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                '''INSERT INTO crawl_watermarks (district, confirm_date, article_id, seen_ids, updated_at)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(district) DO UPDATE SET
+                       confirm_date = excluded.confirm_date, article_id = excluded.article_id,
+                       seen_ids = excluded.seen_ids, updated_at = excluded.updated_at''',
+                (district, confirm_date, article_id, json.dumps(sorted(seen_ids)), datetime.now().isoformat())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return self.get_watermark(district)
+
+
+class DistrictCheckpoint:
+    """📍 (run_id, 구)에 고정된 체크포인트 뷰"""
+
+    def __init__(self, store: CheckpointStore, run_id: str, district: str):
+        self.store = store
+        self.run_id = run_id
+        self.district = district
+
+    def save_page(self, tile: str, page: int, articles: List[Dict[str, Any]], state: str = 'partial'):
+        try:
+            self.store.save_page(self.run_id, self.district, tile, page, articles, state)
+        except Exception as e:
+            print(f"                  ⚠️ 체크포인트 저장 실패 ({tile} {page}페이지): {e}", flush=True)
+
+    def get_cursor(self, tile: str) -> Optional[Dict[str, Any]]:
+        return self.store.get_cursor(self.run_id, self.district, tile)
+
+    def load_articles(self) -> List[Dict[str, Any]]:
+        return self.store.load_articles(self.run_id, self.district)
+
+    def seen_ids(self) -> Set[str]:
+        return self.store.seen_ids(self.run_id, self.district)
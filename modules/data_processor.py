@@ -3,12 +3,16 @@ import sqlite3
 import os
 from datetime import datetime
 
+from .db_schema import migrate
+from .raw_payload import RawPayloadStore, article_id_from_link, decode_payload, encode_payload, is_json_payload
+
 class PropertyDataProcessor:
     """부동산 데이터 처리 및 필터링 클래스"""
     
     def __init__(self):
         # 기본 설정
         self.db_path = 'data/properties.db'
+        self.raw_payload_store = RawPayloadStore()  # 원시 페이로드는 raw_payloads 테이블에 (zstd 가능 시 압축)
         self.filter_conditions = {
             'max_deposit': 2000,      # 보증금 2000만원 이하
             'max_monthly_rent': 130,  # 월세 130만원 이하  
@@ -45,10 +49,10 @@ class PropertyDataProcessor:
             'raw_text': 'raw_text',  # district_collector의 raw_text
             'data_source': 'data_source',  # district_collector의 data_source
             'collected_at': 'collected_at',  # 수집 시간
-            'article_id': None,  # DB 컬럼이 없으므로 무시 (필요시 추가)
-            'cortar_no': None,  # DB 컬럼이 없으므로 무시 (필요시 추가)
+            'article_id': 'article_id',  # 매물번호 (atclNo)
+            'cortar_no': 'cortar_no',  # 행정구역코드
             'meets_conditions': None,  # DB 컬럼이 없으므로 무시 (필요시 추가)
-            'trade_type': None,  # DB 컬럼이 없으므로 무시
+            'trade_type': 'trade_type',  # 거래유형
             'region': 'region'  # 지역 정보
         }
         
@@ -59,47 +63,12 @@ class PropertyDataProcessor:
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
     def create_tables(self):
-        """데이터베이스 테이블 생성"""
+        """데이터베이스 테이블 생성 / 스키마 마이그레이션 (modules/db_schema.py)"""
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # 매물 정보 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS properties (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                region TEXT,
-                district TEXT,
-                building_name TEXT,
-                full_address TEXT,
-                area_sqm REAL,
-                area_pyeong REAL,
-                exclusive_area_sqm REAL,
-                exclusive_area_pyeong REAL,
-                contract_area_sqm REAL,
-                contract_area_pyeong REAL,
-                floor INTEGER,
-                total_floors INTEGER,
-                floor_display TEXT,
-                deposit INTEGER,
-                monthly_rent INTEGER,
-                management_fee INTEGER,
-                total_monthly_cost REAL,
-                ceiling_height REAL,
-                parking_available BOOLEAN,
-                near_station BOOLEAN,
-                build_year INTEGER,
-                naver_link TEXT,
-                data_source TEXT,
-                score INTEGER DEFAULT 0,
-                        labels TEXT,
-                        collected_at TIMESTAMP,
-                        raw_text TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        try:
+            migrate(conn)
+        finally:
+            conn.close()
     
     def extract_additional_info(self, raw_data):
         """추가 정보 추출 (tagList, atclFetrDesc에서)"""
@@ -214,11 +183,190 @@ class PropertyDataProcessor:
             'parking_available_from_tags': parking_available_from_tags
         }
 
-    def csv_to_db_dataframe(self, csv_df: pd.DataFrame) -> pd.DataFrame:
-        """🔄 CSV 데이터를 DB 형식으로 변환 (스마트 파싱 포함)"""
-        import ast
-        import re
+    # 🎯 raw 파싱 결과를 DB 컬럼에 반영하는 순서 (새 컬럼은 처음 등장한 행/이 순서대로 추가)
+    RAW_PARSED_COLUMNS = [
+        'management_fee', 'building_name', 'parking_available', 'near_station',
+        'floor', 'total_floors', 'floor_display',
+        'exclusive_area_sqm', 'exclusive_area_pyeong', 'contract_area_sqm', 'contract_area_pyeong',
+        'management_fee_from_tags', 'management_fee_to_tags', 'loan_status',
+        'build_year_from_tags', 'build_year_to_tags', 'station_distance', 'station_name',
+        'facilities', 'usage_type', 'conditions', 'price_quality',
+        'broker_name', 'broker_company', 'floor_detail', 'parking_available_from_tags',
+        'full_address', 'lat', 'lng'
+    ]
+    
+    # 새로 만드는 컬럼의 초기값 (파싱 값이 없는 행에 남는 값)
+    RAW_PARSED_DEFAULTS = {
+        'management_fee': 0,
+        'building_name': '',
+        'parking_available': False,
+        'near_station': False,
+        'full_address': '',
+        'lat': 0.0,
+        'lng': 0.0
+    }
+    
+    # None 값은 반영하지 않는 컬럼 (층수 파싱 실패 시 기존 값 유지)
+    RAW_PARSED_SKIP_NONE = {'floor', 'total_floors', 'floor_display'}
+    
+    @staticmethod
+    def parse_floor_info(floor_info):
+        """🏢 flrInfo → (현재 층, 총 층수, 표시 문자열)"""
+        if pd.isna(floor_info) or floor_info == '':
+            return None, None, None
+        
+        floor_str = str(floor_info)
+        
+        # "전체층/15" 패턴
+        if '전체층' in floor_str:
+            if '/' in floor_str:
+                total = floor_str.split('/')[1]
+                try:
+                    total_floors = int(total)
+                    return 0, total_floors, f"전체층 ({total_floors}층 건물)"
+                except:
+                    return 0, None, "전체층"
+            else:
+                return 0, None, "전체층"
+        
+        # "1/4", "B1/5" 등 일반 패턴
+        if '/' in floor_str:
+            parts = floor_str.split('/')
+            if len(parts) == 2:
+                current_part = parts[0].strip()
+                total_part = parts[1].strip()
+                
+                try:
+                    # 현재 층 파싱
+                    if current_part.startswith('B'):
+                        current_floor = -int(current_part[1:])  # B1 → -1
+                        current_display = f"지하{current_part[1:]}층"
+                    else:
+                        current_floor = int(current_part)
+                        current_display = f"{current_part}층"
+                    
+                    # 총 층수 파싱
+                    total_floors = int(total_part)
+                    
+                    # 표시용 문자열
+                    display = f"{current_display} ({total_floors}층 건물)"
+                    
+                    return current_floor, total_floors, display
+                except:
+                    pass
+        
+        # 파싱 실패시 기본값
+        return None, None, floor_str
+    
+    @staticmethod
+    def decode_raw_payload(value):
+        """📦 raw_text/raw_data 값 → dict (비어 있으면 None)"""
+        if isinstance(value, dict):
+            return value
+        if pd.isna(value) or value == '':
+            return None
+        if isinstance(value, str):
+            try:
+                # JSON 우선, 예전 str(dict) 행은 literal_eval
+                return decode_payload(value)
+            except ValueError:
+                # 둘 다 실패시 빈 dict로 처리
+                print(f"⚠️ raw 파싱 실패: {value[:100]}...")
+                return {}
+        return value if value else {}
+    
+    def parse_raw_payload(self, raw_value, building_name='', full_address='', district='') -> dict:
+        """🔍 raw 매물 1건에서 DB 보완 필드 추출 (반영할 필드만 담은 dict 반환)
+        
+        building_name / full_address / district는 CSV 원본 값 (비어 있을 때만 raw 값으로 보완)
+        """
+        parsed = {}
+        try:
+            raw_data = self.decode_raw_payload(raw_value)
+            if raw_data is None:
+                return parsed
+            
+            # 관리비 파싱 (minMviFee, maxMviFee)
+            min_fee = raw_data.get('minMviFee', 0)
+            max_fee = raw_data.get('maxMviFee', 0)
+            if max_fee > 0:
+                parsed['management_fee'] = max_fee
+            elif min_fee > 0:
+                parsed['management_fee'] = min_fee
+            
+            # 건물명 보완 (bildNm)
+            if pd.isna(building_name) or building_name == '':
+                parsed['building_name'] = raw_data.get('bildNm', raw_data.get('atclNm', ''))
+            
+            # 주차 가능 여부 (tagList에서 '주차가능' 찾기)
+            tag_list = raw_data.get('tagList', [])
+            if isinstance(tag_list, list):
+                parsed['parking_available'] = '주차가능' in tag_list or '주차' in ' '.join(tag_list)
+            
+            # 역세권 여부 (atclFetrDesc에서 '역', '지하철', '분거리' 찾기)
+            desc = raw_data.get('atclFetrDesc', '')
+            if isinstance(desc, str):
+                station_keywords = ['역', '지하철', '분거리', '역세권', '호선']
+                parsed['near_station'] = any(keyword in desc for keyword in station_keywords)
+            
+            # 🎯 좌표 정보 저장
+            lat = raw_data.get('lat', 0)
+            lng = raw_data.get('lng', 0)
+            if lat and lng:
+                parsed['lat'] = float(lat)
+                parsed['lng'] = float(lng)
+            
+            # 🏠 면적 정보 분리 파싱 (spc1: 계약면적, spc2: 전용면적)
+            spc1 = raw_data.get('spc1', '0')  # 계약면적
+            spc2 = raw_data.get('spc2', '0')  # 전용면적
+            try:
+                spc1_float = float(spc1) if spc1 and spc1 != '0' else 0
+                spc2_float = float(spc2) if spc2 and spc2 != '0' else 0
+                
+                if spc1_float > 0:
+                    parsed['contract_area_sqm'] = spc1_float
+                    parsed['contract_area_pyeong'] = round(spc1_float / 3.3058, 1)
+                
+                if spc2_float > 0:
+                    parsed['exclusive_area_sqm'] = spc2_float
+                    parsed['exclusive_area_pyeong'] = round(spc2_float / 3.3058, 1)
+            except (ValueError, TypeError) as e:
+                print(f"⚠️ 면적 정보 파싱 오류: {e}")
+            
+            # 상세주소 보완 (dtlAddr 우선, 없으면 지역구 + 좌표 정보)
+            if pd.isna(full_address) or full_address == '':
+                dtl_addr = raw_data.get('dtlAddr', '')
+                if dtl_addr:
+                    parsed['full_address'] = dtl_addr
+                elif district and lat and lng:
+                    # 지역구 + 좌표로 대략적 주소 생성
+                    parsed['full_address'] = f"서울특별시 {district} (위도: {lat}, 경도: {lng})"
+            
+            # 🏢 층수 정보 파싱 (flrInfo에서)
+            flr_info = raw_data.get('flrInfo', '')
+            if flr_info:
+                try:
+                    floor_data = self.parse_floor_info(flr_info)
+                    if floor_data[0] is not None:  # 파싱 성공
+                        parsed['floor'] = floor_data[0]
+                        parsed['total_floors'] = floor_data[1]
+                        parsed['floor_display'] = floor_data[2]
+                except Exception as e:
+                    print(f"⚠️ 층수 정보 파싱 오류: {e}")
+            
+            # 🎯 추가 정보 추출 및 저장
+            try:
+                parsed.update(self.extract_additional_info(raw_data))
+            except Exception as e:
+                print(f"⚠️ 추가 정보 추출 오류: {e}")
+            
+        except Exception as e:
+            print(f"⚠️ raw_data 파싱 오류: {e}")
         
+        return parsed
+    
+    def csv_to_db_dataframe(self, csv_df: pd.DataFrame) -> pd.DataFrame:
+        """🔄 CSV 데이터를 DB 형식으로 변환 (스마트 파싱 포함) - raw 디코딩 1회 + 컬럼 단위 반영"""
         db_df = pd.DataFrame()
         
         # 매핑된 컬럼들 변환
@@ -229,54 +377,6 @@ class PropertyDataProcessor:
         # 🎯 스마트 데이터 파싱 및 보완
         current_time_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        # 🏢 층수 정보 개선 (flrInfo에서 총 층수 추출)
-        def parse_floor_info(floor_info):
-            if pd.isna(floor_info) or floor_info == '':
-                return None, None, None
-            
-            floor_str = str(floor_info)
-            
-            # "전체층/15" 패턴
-            if '전체층' in floor_str:
-                if '/' in floor_str:
-                    total = floor_str.split('/')[1]
-                    try:
-                        total_floors = int(total)
-                        return 0, total_floors, f"전체층 ({total_floors}층 건물)"
-                    except:
-                        return 0, None, "전체층"
-                else:
-                    return 0, None, "전체층"
-            
-            # "1/4", "B1/5" 등 일반 패턴
-            if '/' in floor_str:
-                parts = floor_str.split('/')
-                if len(parts) == 2:
-                    current_part = parts[0].strip()
-                    total_part = parts[1].strip()
-                    
-                    try:
-                        # 현재 층 파싱
-                        if current_part.startswith('B'):
-                            current_floor = -int(current_part[1:])  # B1 → -1
-                            current_display = f"지하{current_part[1:]}층"
-                        else:
-                            current_floor = int(current_part)
-                            current_display = f"{current_part}층"
-                        
-                        # 총 층수 파싱
-                        total_floors = int(total_part)
-                        
-                        # 표시용 문자열
-                        display = f"{current_display} ({total_floors}층 건물)"
-                        
-                        return current_floor, total_floors, display
-                    except:
-                        pass
-            
-            # 파싱 실패시 기본값
-            return None, None, floor_str
-        
         # 층수 정보 초기화
         db_df['floor'] = None
         db_df['total_floors'] = None
@@ -305,210 +405,24 @@ class PropertyDataProcessor:
             raw_column = 'raw_data'
         
         if raw_column:
-            def parse_raw_data(row):
-                try:
-                    if pd.isna(row[raw_column]) or row[raw_column] == '':
-                        return row
-                    
-                    # Python dict 파싱 (문자열 형태로 저장된 경우)
-                    if isinstance(row[raw_column], dict):
-                        raw_data = row[raw_column]
-                    elif isinstance(row[raw_column], str) and row[raw_column]:
-                        import ast
-                        try:
-                            # 문자열을 dict로 변환 시도
-                            raw_data = ast.literal_eval(row[raw_column])
-                        except (ValueError, SyntaxError):
-                            # ast.literal_eval 실패시 JSON으로 시도
-                            import json
-                            try:
-                                raw_data = json.loads(row[raw_column])
-                            except (json.JSONDecodeError, TypeError):
-                                # 둘 다 실패시 빈 dict로 처리
-                                print(f"⚠️ {raw_column} 파싱 실패: {row[raw_column][:100]}...")
-                                raw_data = {}
-                    else:
-                        raw_data = row[raw_column] if row[raw_column] else {}
-                    
-                    # 관리비 파싱 (minMviFee, maxMviFee)
-                    min_fee = raw_data.get('minMviFee', 0)
-                    max_fee = raw_data.get('maxMviFee', 0)
-                    if max_fee > 0:
-                        row['management_fee'] = max_fee
-                    elif min_fee > 0:
-                        row['management_fee'] = min_fee
-                    
-                    # 건물명 보완 (bildNm)
-                    if pd.isna(row.get('building_name', '')) or row.get('building_name', '') == '':
-                        row['building_name'] = raw_data.get('bildNm', raw_data.get('atclNm', ''))
-                    
-                    # 주차 가능 여부 (tagList에서 '주차가능' 찾기)
-                    tag_list = raw_data.get('tagList', [])
-                    if isinstance(tag_list, list):
-                        row['parking_available'] = '주차가능' in tag_list or '주차' in ' '.join(tag_list)
-                    
-                    # 역세권 여부 (atclFetrDesc에서 '역', '지하철', '분거리' 찾기)
-                    desc = raw_data.get('atclFetrDesc', '')
-                    if isinstance(desc, str):
-                        station_keywords = ['역', '지하철', '분거리', '역세권', '호선']
-                        row['near_station'] = any(keyword in desc for keyword in station_keywords)
-                    
-                    # 🎯 좌표 정보 저장
-                    lat = raw_data.get('lat', 0)
-                    lng = raw_data.get('lng', 0)
-                    if lat and lng:
-                        row['lat'] = float(lat)
-                        row['lng'] = float(lng)
-                    
-                    # 🏠 면적 정보 분리 파싱 (spc1: 계약면적, spc2: 전용면적)
-                    spc1 = raw_data.get('spc1', '0')  # 계약면적
-                    spc2 = raw_data.get('spc2', '0')  # 전용면적
-                    
-                    # 문자열을 숫자로 변환하여 처리
-                    try:
-                        spc1_float = float(spc1) if spc1 and spc1 != '0' else 0
-                        spc2_float = float(spc2) if spc2 and spc2 != '0' else 0
-                        
-                        if spc1_float > 0:
-                            row['contract_area_sqm'] = spc1_float
-                            row['contract_area_pyeong'] = round(spc1_float / 3.3058, 1)
-                        
-                        if spc2_float > 0:
-                            row['exclusive_area_sqm'] = spc2_float
-                            row['exclusive_area_pyeong'] = round(spc2_float / 3.3058, 1)
-                        
-                        # 기존 area_sqm, area_pyeong은 전용면적(spc2) 우선, 없으면 계약면적(spc1)
-                        if spc2_float > 0:
-                            row['area_sqm'] = spc2_float
-                            row['area_pyeong'] = round(spc2_float / 3.3058, 1)
-                        elif spc1_float > 0:
-                            row['area_sqm'] = spc1_float
-                            row['area_pyeong'] = round(spc1_float / 3.3058, 1)
-                    except (ValueError, TypeError) as e:
-                        print(f"⚠️ 면적 정보 파싱 오류: {e}")
-                    
-                    # 상세주소 보완 (dtlAddr 우선, 없으면 지역구 + 좌표 정보)
-                    if pd.isna(row.get('full_address', '')) or row.get('full_address', '') == '':
-                        dtl_addr = raw_data.get('dtlAddr', '')
-                        if dtl_addr:
-                            row['full_address'] = dtl_addr
-                        else:
-                            # 지역구 + 좌표로 대략적 주소 생성
-                            district = row.get('district', '')
-                            if district and lat and lng:
-                                row['full_address'] = f"서울특별시 {district} (위도: {lat}, 경도: {lng})"
-                    
-                    # 🏢 층수 정보 파싱 (flrInfo에서)
-                    flr_info = raw_data.get('flrInfo', '')
-                    if flr_info:
-                        try:
-                            floor_data = parse_floor_info(flr_info)
-                            if floor_data[0] is not None:  # 파싱 성공
-                                row['floor'] = floor_data[0]
-                                row['total_floors'] = floor_data[1]
-                                row['floor_display'] = floor_data[2]
-                        except Exception as e:
-                            print(f"⚠️ 층수 정보 파싱 오류: {e}")
-                    
-                    # 🎯 추가 정보 추출 및 저장
-                    try:
-                        additional_info = self.extract_additional_info(raw_data)
-                        for key, value in additional_info.items():
-                            row[key] = value
-                        print(f"✅ 추가 정보 추출 완료: {len(additional_info)}개 필드")
-                    except Exception as e:
-                        print(f"⚠️ 추가 정보 추출 오류: {e}")
-                    
-                    return row
-                except Exception as e:
-                    print(f"⚠️ raw_data 파싱 오류: {e}")
-                    return row
+            row_count = len(csv_df)
             
-            # 각 행에 대해 raw_data 파싱 적용
-            for idx in range(len(csv_df)):
-                row_dict = csv_df.iloc[idx].to_dict()
-                parsed_row = parse_raw_data(row_dict)
-                
-                # 파싱된 값들을 db_df에 적용
-                if 'management_fee' in parsed_row:
-                    if idx >= len(db_df):
-                        continue
-                    if 'management_fee' not in db_df.columns:
-                        db_df['management_fee'] = 0
-                    db_df.at[idx, 'management_fee'] = parsed_row['management_fee']
-                
-                if 'building_name' in parsed_row:
-                    if 'building_name' not in db_df.columns:
-                        db_df['building_name'] = ''
-                    db_df.at[idx, 'building_name'] = parsed_row['building_name']
-                
-                if 'parking_available' in parsed_row:
-                    if 'parking_available' not in db_df.columns:
-                        db_df['parking_available'] = False
-                    db_df.at[idx, 'parking_available'] = parsed_row['parking_available']
-                
-                if 'near_station' in parsed_row:
-                    if 'near_station' not in db_df.columns:
-                        db_df['near_station'] = False
-                    db_df.at[idx, 'near_station'] = parsed_row['near_station']
-                
-                # 🏢 층수 정보 적용
-                if 'floor' in parsed_row and parsed_row['floor'] is not None:
-                    if 'floor' not in db_df.columns:
-                        db_df['floor'] = None
-                    db_df.at[idx, 'floor'] = parsed_row['floor']
-                
-                if 'total_floors' in parsed_row and parsed_row['total_floors'] is not None:
-                    if 'total_floors' not in db_df.columns:
-                        db_df['total_floors'] = None
-                    db_df.at[idx, 'total_floors'] = parsed_row['total_floors']
-                
-                if 'floor_display' in parsed_row and parsed_row['floor_display'] is not None:
-                    if 'floor_display' not in db_df.columns:
-                        db_df['floor_display'] = None
-                    db_df.at[idx, 'floor_display'] = parsed_row['floor_display']
-                
-                # 🏠 면적 정보 적용
-                area_columns = [
-                    'exclusive_area_sqm', 'exclusive_area_pyeong', 
-                    'contract_area_sqm', 'contract_area_pyeong'
-                ]
-                
-                for col in area_columns:
-                    if col in parsed_row:
-                        if col not in db_df.columns:
-                            db_df[col] = None
-                        db_df.at[idx, col] = parsed_row[col]
-                
-                # 🎯 추가 정보 컬럼들 적용
-                additional_columns = [
-                    'management_fee_from_tags', 'management_fee_to_tags', 'loan_status',
-                    'build_year_from_tags', 'build_year_to_tags', 'station_distance', 'station_name',
-                    'facilities', 'usage_type', 'conditions', 'price_quality',
-                    'broker_name', 'broker_company', 'floor_detail', 'parking_available_from_tags'
-                ]
-                
-                for col in additional_columns:
-                    if col in parsed_row:
-                        if col not in db_df.columns:
-                            db_df[col] = None
-                        db_df.at[idx, col] = parsed_row[col]
-                
-                if 'full_address' in parsed_row:
-                    if 'full_address' not in db_df.columns:
-                        db_df['full_address'] = ''
-                    db_df.at[idx, 'full_address'] = parsed_row['full_address']
-                
-                # 🎯 좌표 데이터 적용
-                if 'lat' in parsed_row:
-                    if 'lat' not in db_df.columns:
-                        db_df['lat'] = 0.0
-                    db_df.at[idx, 'lat'] = parsed_row['lat']
-                
-                if 'lng' in parsed_row:
-                    if 'lng' not in db_df.columns:
-                        db_df['lng'] = 0.0
-                    db_df.at[idx, 'lng'] = parsed_row['lng']
+            def column_values(col, default=''):
+                return csv_df[col].tolist() if col in csv_df.columns else [default] * row_count
+            
+            # raw 페이로드는 행마다 한 번만 디코딩
+            parsed_rows = [
+                self.parse_raw_payload(raw_value, building_name, full_address, district)
+                for raw_value, building_name, full_address, district in zip(
+                    csv_df[raw_column].tolist(),
+                    column_values('building_name'),
+                    column_values('full_address'),
+                    column_values('district')
+                )
+            ]
+            print(f"✅ raw 파싱 완료: {row_count}개 행")
+            
+            self._apply_parsed_columns(db_df, csv_df, parsed_rows)
         
         # 기본값 설정 (파싱되지 않은 컬럼들)
         db_df['region'] = '서울특별시'
@@ -516,10 +430,7 @@ class PropertyDataProcessor:
         if 'management_fee' not in db_df.columns:
             db_df['management_fee'] = 0
         
-        if 'total_monthly_cost' not in db_df.columns:
-            db_df['total_monthly_cost'] = db_df.get('monthly_rent', 0) + db_df.get('management_fee', 0)
-        else:
-            db_df['total_monthly_cost'] = db_df.get('monthly_rent', 0) + db_df.get('management_fee', 0)
+        db_df['total_monthly_cost'] = db_df.get('monthly_rent', 0) + db_df.get('management_fee', 0)
         
         if 'ceiling_height' not in db_df.columns:
             db_df['ceiling_height'] = 0.0
@@ -554,6 +465,49 @@ class PropertyDataProcessor:
         
         return db_df
     
+    def _apply_parsed_columns(self, db_df: pd.DataFrame, csv_df: pd.DataFrame, parsed_rows: list):
+        """📋 행별 파싱 결과를 컬럼 단위로 db_df에 반영
+        
+        파싱 값이 없으면 CSV의 같은 이름 컬럼 값을 그대로 사용 (CSV에도 없으면 기존 값 유지)
+        """
+        row_count = min(len(parsed_rows), len(db_df))
+        missing = object()
+        
+        column_updates = []
+        new_columns = []
+        for order, col in enumerate(self.RAW_PARSED_COLUMNS):
+            csv_column = csv_df[col].tolist() if col in csv_df.columns else None
+            skip_none = col in self.RAW_PARSED_SKIP_NONE
+            
+            positions = []
+            values = []
+            for idx in range(row_count):
+                value = parsed_rows[idx].get(col, missing)
+                if value is missing:
+                    if csv_column is None:
+                        continue
+                    value = csv_column[idx]
+                if skip_none and value is None:
+                    continue
+                positions.append(idx)
+                values.append(value)
+            
+            if not positions:
+                continue
+            if col not in db_df.columns:
+                new_columns.append((positions[0], order, col))
+            column_updates.append((col, positions, values))
+        
+        # 새 컬럼은 처음 값이 생긴 행 순서대로 추가
+        for _, _, col in sorted(new_columns):
+            db_df[col] = self.RAW_PARSED_DEFAULTS.get(col)
+        
+        for col, positions, values in column_updates:
+            # object로 채운 뒤 원래 타입이 object가 아니면 다시 추론 (행 단위 대입과 같은 타입 승격)
+            column = db_df[col].astype(object)
+            column.iloc[positions] = values
+            db_df[col] = column if db_df[col].dtype == object else column.infer_objects()
+    
     def import_csv_to_db(self, csv_file_path: str, overwrite: bool = True) -> int:
         """📥 CSV 파일을 DB로 가져오기 (덮어쓰기 옵션)"""
         try:
@@ -612,9 +566,11 @@ class PropertyDataProcessor:
     def get_all_properties_from_db(self) -> pd.DataFrame:
         """📊 DB에서 모든 매물 데이터 조회"""
         try:
+            self.create_tables()
             conn = sqlite3.connect(self.db_path)
             query = "SELECT * FROM properties ORDER BY created_at DESC"
             df = pd.read_sql_query(query, conn)
+            df = self.attach_raw_text(df, conn)
             conn.close()
             
             print(f"📊 DB에서 {len(df)}개 매물 로드됨")
@@ -624,18 +580,203 @@ class PropertyDataProcessor:
             print(f"❌ DB 조회 실패: {e}")
             return pd.DataFrame()
     
-    def get_properties_count(self) -> int:
-        """📊 DB 매물 개수 조회"""
+    # 📋 결과 탭 정렬 옵션 → (정렬 키, 방향) - 동률은 id로 순서 고정, 빈 값은 화면과 같이 0
+    RESULT_SORT_OPTIONS = {
+        "등록순": ("IFNULL(created_at, '')", 'DESC'),
+        "보증금 낮은순": ("IFNULL(deposit, 0)", 'ASC'),
+        "보증금 높은순": ("IFNULL(deposit, 0)", 'DESC'),
+        "월세 낮은순": ("IFNULL(monthly_rent, 0)", 'ASC'),
+        "월세 높은순": ("IFNULL(monthly_rent, 0)", 'DESC'),
+        "면적 큰순": ("IFNULL(area_pyeong, 0)", 'DESC'),
+        "면적 작은순": ("IFNULL(area_pyeong, 0)", 'ASC')
+    }
+    
+    def _sort_spec(self, sort_by: str = None) -> tuple:
+        return self.RESULT_SORT_OPTIONS.get(sort_by, self.RESULT_SORT_OPTIONS["등록순"])
+    
+    @staticmethod
+    def _range_clause(column: str, value_range) -> tuple:
+        """범위 조건 (빈 값은 화면과 같이 0으로 취급)"""
+        low, high = value_range
+        if low <= 0 <= high:
+            # COALESCE: 정렬용 IFNULL 식 인덱스가 넓은 범위 조건에 잡히지 않도록 다른 식으로 작성
+            return f"COALESCE({column}, 0) BETWEEN ? AND ?", [low, high]
+        return f"{column} BETWEEN ? AND ?", [low, high]
+    
+    def build_property_filter(self, conn: sqlite3.Connection, districts=None, deposit_range=None, rent_range=None,
+                              floor_range=None, area_range=None, include_whole_building=True) -> tuple:
+        """🔍 결과 탭 필터 → 파라미터화된 WHERE 절 (where_sql, params)
+        
+        조건은 화면의 apply_enhanced_filters와 동일 (빈 숫자 값은 0, 전용면적 값이 하나도 없으면 면적 필터 생략)
+        """
+        clauses = []
+        params = []
+        
+        # 지역 필터
+        if districts:
+            clause = f"district IN ({', '.join('?' for _ in districts)})"
+            if '' in districts:
+                clause = f"({clause} OR district IS NULL)"
+            clauses.append(clause)
+            params.extend(districts)
+        
+        # 보증금 / 월세 범위
+        for column, value_range in (('deposit', deposit_range), ('monthly_rent', rent_range)):
+            if value_range:
+                clause, clause_params = self._range_clause(column, value_range)
+                clauses.append(clause)
+                params.extend(clause_params)
+        
+        # 🏢 층수 범위 (0층 = 건물 전체)
+        if floor_range:
+            clause, clause_params = self._range_clause('floor', floor_range)
+            if not include_whole_building:
+                clause = "floor BETWEEN ? AND ? AND floor != 0"
+            clauses.append(clause)
+            params.extend(clause_params)
+        
+        # 면적 범위 (전용면적 기준, 값이 있는 매물만)
+        if area_range:
+            where_so_far = f"WHERE {' AND '.join(clauses)} AND" if clauses else "WHERE"
+            has_area = conn.execute(
+                f"SELECT 1 FROM properties {where_so_far} exclusive_area_pyeong IS NOT NULL LIMIT 1", params
+            ).fetchone()
+            if has_area:
+                clauses.append("exclusive_area_pyeong BETWEEN ? AND ?")
+                params.extend(area_range)
+        
+        where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where_sql, params
+    
+    def query_properties(self, filters: dict = None, columns: list = None, sort_by: str = None,
+                         limit: int = None, offset: int = 0) -> pd.DataFrame:
+        """🔍 필터 조건에 맞는 매물만 DB에서 조회 (ORDER BY / LIMIT / OFFSET)"""
+        try:
+            self.create_tables()
+            conn = sqlite3.connect(self.db_path)
+            try:
+                where_sql, params = self.build_property_filter(conn, **(filters or {}))
+                sort_key, direction = self._sort_spec(sort_by)
+                order_sql = f"{sort_key} {direction}, id {direction}"
+                select_sql = ', '.join(columns) if columns else '*'
+                query = f"SELECT {select_sql} FROM properties {where_sql} ORDER BY {order_sql}"
+                if limit is not None:
+                    query += " LIMIT ? OFFSET ?"
+                    params = params + [limit, offset]
+                df = pd.read_sql_query(query, conn, params=params)
+                df = self.attach_raw_text(df, conn)
+            finally:
+                conn.close()
+            return df
+        except Exception as e:
+            print(f"❌ DB 필터 조회 실패: {e}")
+            return pd.DataFrame()
+    
+    def query_properties_page(self, filters: dict = None, sort_by: str = None, page_size: int = 100,
+                              after: tuple = None, columns: list = None, raise_errors: bool = False) -> tuple:
+        """📄 키셋 페이지 조회 → (페이지 DataFrame, 다음 페이지 커서 또는 None)
+        
+        after는 이전 페이지 마지막 행의 (정렬 키, id) - OFFSET 없이 다음 행부터 읽음
+        raise_errors=True면 조회 오류를 빈 결과로 바꾸지 않고 전파 (캐시되는 호출용)
+        """
         try:
+            self.create_tables()
             conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM properties")
-            count = cursor.fetchone()[0]
-            conn.close()
-            return count
-        except:
+            try:
+                where_sql, params = self.build_property_filter(conn, **(filters or {}))
+                sort_key, direction = self._sort_spec(sort_by)
+                
+                if after is not None:
+                    comparison = '<' if direction == 'DESC' else '>'
+                    keyset = f"({sort_key}, id) {comparison} (?, ?)"
+                    where_sql = f"{where_sql} AND {keyset}" if where_sql else f"WHERE {keyset}"
+                    params = params + list(after)
+                
+                select_sql = ', '.join(columns) if columns else '*'
+                query = (f"SELECT {select_sql}, {sort_key} AS _sort_key, id AS _cursor_id FROM properties {where_sql} "
+                         f"ORDER BY {sort_key} {direction}, id {direction} LIMIT ?")
+                # 한 행 더 읽어 다음 페이지 존재 여부 확인
+                df = pd.read_sql_query(query, conn, params=params + [page_size + 1])
+                
+                next_cursor = None
+                if len(df) > page_size:
+                    df = df.iloc[:page_size]
+                    next_cursor = (df['_sort_key'].tolist()[-1], df['_cursor_id'].tolist()[-1])
+                df = df.drop(columns=['_sort_key', '_cursor_id'])
+                df = self.attach_raw_text(df, conn)
+            finally:
+                conn.close()
+            return df, next_cursor
+        except Exception as e:
+            print(f"❌ DB 페이지 조회 실패: {e}")
+            if raise_errors:
+                raise
+            return pd.DataFrame(), None
+    
+    def count_properties(self, filters: dict = None, raise_errors: bool = False) -> int:
+        """📊 필터 조건에 맞는 매물 수 (raise_errors=True면 오류 시 0 대신 예외)"""
+        try:
+            self.create_tables()
+            conn = sqlite3.connect(self.db_path)
+            try:
+                where_sql, params = self.build_property_filter(conn, **(filters or {}))
+                return conn.execute(f"SELECT COUNT(*) FROM properties {where_sql}", params).fetchone()[0]
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"❌ DB 개수 조회 실패: {e}")
+            if raise_errors:
+                raise
+            return 0
+    
+    def get_district_options(self, raise_errors: bool = False) -> list:
+        """📍 DB에 있는 지역 목록 (raise_errors=True면 오류 시 빈 목록 대신 예외)"""
+        try:
+            self.create_tables()
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute(
+                    "SELECT DISTINCT COALESCE(district, '') FROM properties ORDER BY 1"
+                ).fetchall()
+            finally:
+                conn.close()
+            return [row[0] for row in rows]
+        except Exception as e:
+            print(f"❌ 지역 목록 조회 실패: {e}")
+            if raise_errors:
+                raise
+            return []
+    
+    def get_properties_count(self, raise_errors: bool = False) -> int:
+        """📊 DB 매물 개수 조회 (raise_errors=True면 오류 시 0 대신 예외 - 테이블이 없는 빈 DB는 0)"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM properties")
+                return cursor.fetchone()[0]
+            finally:
+                conn.close()
+        except sqlite3.OperationalError as e:
+            if raise_errors and 'no such table' not in str(e):
+                raise
+            return 0
+        except Exception:
+            if raise_errors:
+                raise
             return 0
     
+    def get_change_token(self) -> tuple:
+        """🔖 DB 변경 토큰 (DB / WAL 파일 수정 시각·크기) - 토큰이 같으면 저장된 데이터도 같음"""
+        token = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                stat = os.stat(path)
+                token.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                token.append(None)
+        return tuple(token)
+    
     def is_property_exists(self, naver_link: str) -> bool:
         """🔍 매물이 DB에 이미 존재하는지 확인 (naver_link 기준)"""
         try:
@@ -745,8 +886,39 @@ class PropertyDataProcessor:
             print(f"❌ DataFrame → DB 저장 실패: {e}")
             return 0
     
+    @staticmethod
+    def to_payload_json(raw_value):
+        """📦 raw_text 값 → compact JSON 문자열 (해석 불가 시 None)"""
+        if is_json_payload(raw_value):
+            return raw_value
+        try:
+            payload = decode_payload(raw_value)
+        except ValueError:
+            return None
+        return encode_payload(payload) if payload is not None else None
+    
+    def attach_raw_text(self, df: pd.DataFrame, conn: sqlite3.Connection) -> pd.DataFrame:
+        """📦 raw_payloads에 분리 저장된 원시 페이로드를 raw_text 컬럼으로 복원"""
+        if df.empty or 'raw_text' not in df.columns or 'naver_link' not in df.columns:
+            return df
+        
+        missing = df['raw_text'].isna()
+        if not missing.any():
+            return df
+        
+        article_ids = df.loc[missing, 'naver_link'].map(article_id_from_link)
+        texts = self.raw_payload_store.load_texts(conn, article_ids.dropna().tolist())
+        if texts:
+            df.loc[missing, 'raw_text'] = article_ids.map(texts)
+        return df
+    
+    def migrate_raw_payloads(self) -> dict:
+        """🔧 기존 properties.raw_text (str(dict) 행 포함)를 raw_payloads로 이전"""
+        self.create_tables()
+        return self.raw_payload_store.migrate_properties(self.db_path)
+    
     def import_with_upsert(self, df: pd.DataFrame) -> dict:
-        """📥 UPSERT 방식으로 DataFrame 데이터 저장 (중복 시 업데이트)"""
+        """📥 UPSERT 방식으로 DataFrame 데이터 저장 (중복 시 업데이트) - 단일 트랜잭션 일괄 처리"""
         try:
             print(f"🔄 UPSERT 방식 DB 저장: {len(df)}개 레코드")
             
@@ -761,18 +933,99 @@ class PropertyDataProcessor:
                 'details': []
             }
             
-            # 각 레코드에 대해 UPSERT 실행
-            for _, row in db_df.iterrows():
-                row_dict = row.to_dict()
-                result = self.upsert_property(row_dict)
-                stats['details'].append(result)
+            self.create_tables()
+            conn = sqlite3.connect(self.db_path)
+            try:
+                # 테이블에 존재하는 컬럼만 저장 (id는 자동 증가)
+                table_columns = {row[1] for row in conn.execute("PRAGMA table_info(properties)")}
+                columns = [col for col in db_df.columns if col in table_columns and col != 'id']
+                skipped_columns = [col for col in db_df.columns if col not in table_columns]
+                if skipped_columns:
+                    print(f"   ℹ️ DB에 없는 컬럼 제외: {skipped_columns}")
+                if 'naver_link' not in columns:
+                    stats['error_count'] = len(db_df)
+                    stats['details'] = ["❌ naver_link가 없습니다"] * len(db_df)
+                    return stats
+                for col in ('collected_at', 'created_at'):
+                    if col in table_columns and col not in columns:
+                        columns.append(col)
+                
+                current_time_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                records = db_df.reindex(columns=columns).astype(object)
+                records = records.where(pd.notna(records), None)
+                records['collected_at'] = current_time_str
+                records['created_at'] = current_time_str
+                
+                # 기존 매물 조회 (배치 내 링크만, SQLite 변수 개수 제한 고려해 분할)
+                unique_links = list(dict.fromkeys(link for link in records['naver_link'].tolist() if link))
+                existing = {}
+                for start in range(0, len(unique_links), 500):
+                    chunk = unique_links[start:start + 500]
+                    placeholders = ', '.join('?' for _ in chunk)
+                    for link, old_collected_at in conn.execute(
+                        f"SELECT naver_link, collected_at FROM properties WHERE naver_link IN ({placeholders})", chunk
+                    ):
+                        existing[link] = old_collected_at
                 
-                if "✅ 신규" in result:
-                    stats['new_count'] += 1
-                elif "🔄 업데이트" in result:
-                    stats['updated_count'] += 1
-                else:
-                    stats['error_count'] += 1
+                rows = []
+                payloads = []
+                raw_index = columns.index('raw_text') if 'raw_text' in columns else None
+                for values in records.itertuples(index=False, name=None):
+                    row = dict(zip(columns, values))
+                    naver_link = row.get('naver_link')
+                    if not naver_link:
+                        stats['error_count'] += 1
+                        stats['details'].append("❌ naver_link가 없습니다")
+                        continue
+                    
+                    # 원시 페이로드는 raw_payloads로 분리 (properties.raw_text는 비움)
+                    if raw_index is not None and row['raw_text']:
+                        payload_text = self.to_payload_json(row['raw_text'])
+                        article_id = article_id_from_link(naver_link)
+                        if payload_text is not None and article_id:
+                            payloads.append((article_id, payload_text))
+                            values = values[:raw_index] + (None,) + values[raw_index + 1:]
+                    
+                    article_key = naver_link.split('/')[-1]
+                    if naver_link in existing:
+                        stats['updated_count'] += 1
+                        stats['details'].append(f"🔄 업데이트: {article_key} (이전: {existing[naver_link]})")
+                    else:
+                        stats['new_count'] += 1
+                        stats['details'].append(f"✅ 신규: {article_key}")
+                        existing[naver_link] = current_time_str  # 같은 배치 내 중복은 업데이트로 집계
+                    rows.append(values)
+                
+                update_columns = [col for col in columns if col not in ('naver_link', 'created_at')]
+                upsert_query = f"""
+                    INSERT INTO properties ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})
+                    ON CONFLICT(naver_link) DO UPDATE SET {', '.join(f'{col} = excluded.{col}' for col in update_columns)}
+                """
+                
+                try:
+                    with conn:
+                        conn.executemany(upsert_query, rows)
+                        self.raw_payload_store.save_many(conn, payloads)
+                except Exception as batch_error:
+                    # 일괄 처리 실패 시 행 단위로 재시도 (오류 행만 분리)
+                    print(f"   ⚠️ 일괄 UPSERT 실패, 행 단위 재시도: {batch_error}")
+                    # 신규/업데이트 집계만 다시 계산 (naver_link 누락 등 이미 기록된 오류는 유지)
+                    stats['new_count'] = 0
+                    stats['updated_count'] = 0
+                    stats['details'] = [detail for detail in stats['details'] if detail.startswith('❌')]
+                    for values in rows:
+                        result = self.upsert_property(dict(zip(columns, values)))
+                        stats['details'].append(result)
+                        if "✅ 신규" in result:
+                            stats['new_count'] += 1
+                        elif "🔄 업데이트" in result:
+                            stats['updated_count'] += 1
+                        else:
+                            stats['error_count'] += 1
+                    with conn:
+                        self.raw_payload_store.save_many(conn, payloads)
+            finally:
+                conn.close()
             
             if stats['error_count'] > 0:
                 print(f"✅ UPSERT 완료: 신규 {stats['new_count']}개, 업데이트 {stats['updated_count']}개, ⚠️ 오류 {stats['error_count']}개")
@@ -1017,8 +1270,10 @@ class PropertyDataProcessor:
         if not os.path.exists(self.db_path):
             return pd.DataFrame()
             
+        self.create_tables()
         conn = sqlite3.connect(self.db_path)
         df = pd.read_sql_query("SELECT * FROM properties ORDER BY score DESC, deposit ASC", conn)
+        df = self.attach_raw_text(df, conn)
         conn.close()
         return df
 
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+🗄️ DBSchema - properties DB 버전 관리 마이그레이션
+- PRAGMA user_version으로 적용된 스키마 버전 기록
+- 버전 순서대로 한 번씩만 실행 (각 버전은 한 트랜잭션)
+- 기존 DB(버전 0)도 컬럼/인덱스 존재 여부를 확인하며 안전하게 올림
+"""
+
+import sqlite3
+from typing import Callable, Dict, List, Tuple
+
+from .raw_payload import RawPayloadStore
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    """테이블 컬럼 목록 (없는 테이블이면 빈 목록)"""
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def add_columns(conn: sqlite3.Connection, table: str, columns: Dict[str, str]):
+    """없는 컬럼만 추가"""
+    existing = set(table_columns(conn, table))
+    for name, column_type in columns.items():
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+
+
+def _v1_base_tables(conn: sqlite3.Connection):
+    """매물 / 원시 페이로드 기본 테이블"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS properties (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            region TEXT,
+            district TEXT,
+            building_name TEXT,
+            full_address TEXT,
+            area_sqm REAL,
+            area_pyeong REAL,
+            exclusive_area_sqm REAL,
+            exclusive_area_pyeong REAL,
+            contract_area_sqm REAL,
+            contract_area_pyeong REAL,
+            floor INTEGER,
+            total_floors INTEGER,
+            floor_display TEXT,
+            deposit INTEGER,
+            monthly_rent INTEGER,
+            management_fee INTEGER,
+            total_monthly_cost REAL,
+            ceiling_height REAL,
+            parking_available BOOLEAN,
+            near_station BOOLEAN,
+            build_year INTEGER,
+            naver_link TEXT,
+            data_source TEXT,
+            score INTEGER DEFAULT 0,
+            labels TEXT,
+            collected_at TIMESTAMP,
+            raw_text TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    RawPayloadStore().create_table(conn)
+
+
+def _v2_unique_naver_link(conn: sqlite3.Connection):
+    """naver_link UNIQUE (기존 중복은 최신 레코드만 남김, 빈 링크는 NULL)"""
+    conn.execute("UPDATE properties SET naver_link = NULL WHERE naver_link = ''")
+    removed = conn.execute('''
+        DELETE FROM properties
+        WHERE naver_link IS NOT NULL
+          AND id NOT IN (SELECT MAX(id) FROM properties WHERE naver_link IS NOT NULL GROUP BY naver_link)
+    ''').rowcount
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_properties_naver_link ON properties(naver_link)")
+    if removed:
+        print(f"🧹 중복 naver_link {removed}개 정리 (최신 레코드 유지)")
+
+
+# 수집 시 만들어지지만 지금까지 저장되지 않던 컬럼들
+PERSISTED_COLUMNS = {
+    'article_id': 'TEXT',
+    'cortar_no': 'TEXT',
+    'trade_type': 'TEXT',
+    'lat': 'REAL',
+    'lng': 'REAL',
+    # raw 태그/설명에서 추출한 추가 정보 (15개)
+    'management_fee_from_tags': 'INTEGER',
+    'management_fee_to_tags': 'INTEGER',
+    'loan_status': 'TEXT',
+    'build_year_from_tags': 'INTEGER',
+    'build_year_to_tags': 'INTEGER',
+    'station_distance': 'INTEGER',
+    'station_name': 'TEXT',
+    'facilities': 'TEXT',
+    'usage_type': 'TEXT',
+    'conditions': 'TEXT',
+    'price_quality': 'TEXT',
+    'broker_name': 'TEXT',
+    'broker_company': 'TEXT',
+    'floor_detail': 'TEXT',
+    'parking_available_from_tags': 'BOOLEAN'
+}
+
+
+def _v3_persisted_columns(conn: sqlite3.Connection):
+    """article_id / 행정구역코드 / 거래유형 / 좌표 / 추가 정보 컬럼"""
+    add_columns(conn, 'properties', PERSISTED_COLUMNS)
+    # 기존 행 article_id = naver_link 마지막 경로 (…/article/info/{atclNo})
+    conn.execute('''
+        UPDATE properties
+        SET article_id = substr(naver_link, length(rtrim(naver_link, replace(naver_link, '/', ''))) + 1)
+        WHERE article_id IS NULL AND naver_link IS NOT NULL
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_article_id ON properties(article_id)")
+
+
+def _v4_query_indexes(conn: sqlite3.Connection):
+    """필터 / 정렬용 복합 인덱스"""
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_district_price "
+                 "ON properties(district, deposit, monthly_rent)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_district_area "
+                 "ON properties(district, area_pyeong)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_created_at ON properties(created_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_score_deposit ON properties(score DESC, deposit)")
+
+
+def _v5_exclusive_area_index(conn: sqlite3.Connection):
+    """결과 탭 면적 필터 (전용면적 기준) 인덱스"""
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_district_exclusive_area "
+                 "ON properties(district, exclusive_area_pyeong)")
+
+
+def _v6_sort_key_indexes(conn: sqlite3.Connection):
+    """결과 탭 정렬 키 식 인덱스 (키셋 페이지 조회가 정렬 없이 인덱스 순서로 읽도록)"""
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_sort_created ON properties(IFNULL(created_at, ''))")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_sort_deposit ON properties(IFNULL(deposit, 0))")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_sort_rent ON properties(IFNULL(monthly_rent, 0))")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_sort_area ON properties(IFNULL(area_pyeong, 0))")
+
+
+# (버전, 설명, 적용 함수) - 새 마이그레이션은 끝에만 추가
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, '기본 테이블', _v1_base_tables),
+    (2, 'naver_link UNIQUE', _v2_unique_naver_link),
+    (3, '누락 컬럼 저장 (article_id, cortar_no, trade_type, lat, lng, 추가 정보)', _v3_persisted_columns),
+    (4, '필터/정렬 인덱스', _v4_query_indexes),
+    (5, '전용면적 필터 인덱스', _v5_exclusive_area_index),
+    (6, '정렬 키 인덱스', _v6_sort_key_indexes),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """🗄️ 미적용 마이그레이션 실행 후 현재 스키마 버전 반환"""
+    version = get_schema_version(conn)
+    if version >= SCHEMA_VERSION:
+        return version
+
+    for target, description, apply in MIGRATIONS:
+        if target <= version:
+            continue
+        conn.execute('BEGIN')
+        try:
+            apply(conn)
+            conn.execute(f'PRAGMA user_version = {target}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        version = target
+        print(f"🗄️ DB 스키마 v{target}: {description}")
+
+    # 새 인덱스 통계 갱신 (쿼리 플래너가 인덱스를 선택하도록)
+    conn.execute('ANALYZE')
+    return version
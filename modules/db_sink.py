@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+🚰 StreamingDBSink - 수집 중 실시간 DB 저장
+- 변환된 매물을 배치로 모아 SQLite에 UPSERT (N건 또는 N초마다)
+- DB 쓰기는 스레드에서 실행 (이벤트 루프 비차단)
+- 배치마다 백업 CSV에 이어쓰기
+- 저장 실패 시 재시도, 그래도 실패하면 배치를 버퍼로 되돌림 (미저장 구는 호출자가 미완료 처리)
+- 수집 전체를 메모리에 쌓지 않음
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+
+
+class StreamingDBSink:
+    """🚰 배치 단위 스트리밍 DB 저장소"""
+
+    MAX_RETRIES = 3       # 배치 저장 재시도 횟수 (예: UI 읽기 중 "database is locked")
+    RETRY_BACKOFF = 1.0   # 재시도 대기 (초, 시도마다 2배)
+
+    def __init__(self, data_processor, batch_size: int = 200, flush_interval: float = 2.0,
+                 backup_csv: Optional[str] = None):
+        self.data_processor = data_processor
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.backup_csv = backup_csv
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._timer_task: Optional[asyncio.Task] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._closed = False
+
+        # 누적 통계
+        self.rows_written = 0
+        self.batches = 0
+        self.new_count = 0
+        self.updated_count = 0
+        self.error_count = 0
+        self.failed_flushes = 0  # 재시도 후에도 실패해 버퍼로 되돌린 배치 수
+        self.last_error: Optional[str] = None
+
+    async def start(self) -> None:
+        """⏱️ 주기적 플러시 시작 (실행 중인 이벤트 루프에서 호출)"""
+        self._flush_lock = asyncio.Lock()
+        self._timer_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._buffer:
+                await self.flush()
+
+    def add(self, records: List[Dict[str, Any]]) -> None:
+        """📥 변환된 매물 추가 (배치가 차면 백그라운드 플러시)"""
+        if not records:
+            return
+        self._buffer.extend(records)
+        if len(self._buffer) >= self.batch_size and self._flush_lock is not None:
+            task = asyncio.create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._buffer)
+
+    def unsaved_districts(self) -> Set[str]:
+        """아직 DB에 저장되지 않은 매물이 남아 있는 구"""
+        return {record.get('district') or '' for record in self._buffer}
+
+    async def flush(self) -> bool:
+        """💾 버퍼를 DB에 UPSERT + 백업 CSV 이어쓰기 (재시도 후에도 실패하면 배치를 버퍼로 되돌리고 False)"""
+        async with self._flush_lock:
+            if not self._buffer:
+                return True
+            batch, self._buffer = self._buffer, []
+
+            df = pd.DataFrame(batch)
+            for attempt in range(self.MAX_RETRIES + 1):
+                if attempt:
+                    await asyncio.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
+                try:
+                    stats = await asyncio.to_thread(self.data_processor.import_with_upsert, df)
+                    break
+                except Exception as e:
+                    print(f"         ⚠️ 스트리밍 DB 저장 오류 ({attempt + 1}회): {e}")
+                    self.last_error = str(e)
+            else:
+                # 버린 배치는 복구할 방법이 없으므로 다음 플러시에서 다시 시도
+                self._buffer = batch + self._buffer
+                self.failed_flushes += 1
+                print(f"         ⚠️ 스트리밍 저장 실패: {len(batch)}개 버퍼로 되돌림 (미저장 {len(self._buffer)}개)")
+                return False
+
+            self.batches += 1
+            self.rows_written += len(df)
+            self.new_count += stats.get('new_count', 0)
+            self.updated_count += stats.get('updated_count', 0)
+            self.error_count += stats.get('error_count', 0)
+            print(f"         🚰 스트리밍 저장 #{self.batches}: {len(df)}개 "
+                  f"(신규 {stats.get('new_count', 0)}, 업데이트 {stats.get('updated_count', 0)}) 누적 {self.rows_written}개")
+
+            if self.backup_csv:
+                try:
+                    await asyncio.to_thread(self._append_backup, df)
+                except Exception as e:
+                    print(f"         ⚠️ 백업 CSV 이어쓰기 오류: {e}")
+            return True
+
+    def _append_backup(self, df: pd.DataFrame) -> None:
+        first_write = not os.path.exists(self.backup_csv)
+        # BOM은 파일 처음에만 (엑셀 호환)
+        df.to_csv(self.backup_csv, mode='a', header=first_write, index=False,
+                  encoding='utf-8-sig' if first_write else 'utf-8')
+
+    async def close(self) -> None:
+        """🔒 타이머 중단 후 남은 버퍼 플러시"""
+        if self._closed or self._flush_lock is None:
+            return
+        self._closed = True
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            await asyncio.gather(self._timer_task, return_exceptions=True)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        if not await self.flush() and self.backup_csv:
+            # 끝까지 DB에 못 넣은 매물은 백업 CSV에라도 남김
+            try:
+                await asyncio.to_thread(self._append_backup, pd.DataFrame(self._buffer))
+                print(f"         📦 DB 미저장 {len(self._buffer)}개 백업 CSV에 기록: {self.backup_csv}")
+            except Exception as e:
+                print(f"         ⚠️ 백업 CSV 이어쓰기 오류: {e}")
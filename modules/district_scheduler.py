@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🗓️ DistrictScheduler - 구별 동시 수집 스케줄러
+- 우선순위 작업 큐 (구 단위)
+- 동시 진행 구 개수 제한
+- 호스트별 요청 예산 (동시 요청 수 + 최소 간격)
+- 구별 소요 시간 진행률 보고
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+
+class HostBudget:
+    """🚦 호스트별 요청 예산 관리 (여러 구가 같은 호스트를 공유할 때 과부하 방지)"""
+
+    def __init__(self, max_concurrent_per_host: int = 4, min_interval: float = 0.0):
+        self.max_concurrent_per_host = max_concurrent_per_host
+        self.min_interval = min_interval  # 같은 호스트 요청 사이 최소 간격(초)
+
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._interval_locks: Dict[str, asyncio.Lock] = {}
+        self._last_request_at: Dict[str, float] = {}
+        self.request_counts: Dict[str, int] = {}
+
+    @staticmethod
+    def host_of(url_or_host: str) -> str:
+        """URL 또는 호스트 문자열에서 호스트 추출"""
+        if '://' in url_or_host:
+            return urlparse(url_or_host).netloc
+        return url_or_host
+
+    @asynccontextmanager
+    async def slot(self, url_or_host: str):
+        """호스트 예산 안에서 요청 1건 실행"""
+        host = self.host_of(url_or_host)
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.max_concurrent_per_host))
+        interval_lock = self._interval_locks.setdefault(host, asyncio.Lock())
+
+        async with semaphore:
+            if self.min_interval > 0:
+                async with interval_lock:
+                    elapsed = time.monotonic() - self._last_request_at.get(host, 0.0)
+                    if elapsed < self.min_interval:
+                        await asyncio.sleep(self.min_interval - elapsed)
+                    self._last_request_at[host] = time.monotonic()
+
+            self.request_counts[host] = self.request_counts.get(host, 0) + 1
+            yield
+
+
+class DistrictScheduler:
+    """🗓️ 우선순위 큐 기반 구별 동시 수집 스케줄러"""
+
+    def __init__(self, concurrency: int = 2, progress_manager=None):
+        self.concurrency = max(1, concurrency)
+        self.progress_manager = progress_manager
+
+        self._queue: asyncio.PriorityQueue = None
+        self._pending = []  # run() 이전에 등록된 작업 (큐는 이벤트 루프 안에서 생성)
+        self._sequence = 0
+        self.timings: Dict[str, float] = {}
+
+    def submit(self, district_name: str, priority: int = 0, index: Optional[int] = None) -> None:
+        """📥 구 작업 등록 (priority가 낮을수록 먼저 실행)"""
+        item = (priority, self._sequence, district_name, self._sequence if index is None else index)
+        self._sequence += 1
+        if self._queue is not None:
+            self._queue.put_nowait(item)
+        else:
+            self._pending.append(item)
+
+    def _stop_requested(self) -> bool:
+        try:
+            return bool(self.progress_manager and self.progress_manager.is_stop_requested())
+        except Exception:
+            return False
+
+    async def run(self, worker: Callable[[str, int], Awaitable[Any]]) -> Dict[str, Any]:
+        """🚀 등록된 구들을 동시 실행 후 {구: 결과} 반환"""
+        self._queue = asyncio.PriorityQueue()
+        for item in self._pending:
+            self._queue.put_nowait(item)
+        self._pending = []
+
+        results: Dict[str, Any] = {}
+
+        async def worker_loop(worker_id: int):
+            while True:
+                try:
+                    priority, _, district_name, index = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    if self._stop_requested():
+                        print(f"\n🛑 수집 중지 요청으로 인해 {district_name} 수집을 건너뜁니다.")
+                        continue
+
+                    print(f"\n🗓️ [워커 {worker_id}] {district_name} 시작 (우선순위 {priority}, 대기 {self._queue.qsize()}개)")
+                    started = time.monotonic()
+                    try:
+                        results[district_name] = await worker(district_name, index)
+                    except Exception as e:
+                        print(f"      ❌ {district_name} 수집 오류: {e}")
+                        results[district_name] = None
+                    elapsed = time.monotonic() - started
+                    self.timings[district_name] = elapsed
+
+                    result = results[district_name]
+                    collected = len(result) if isinstance(result, list) else (result if isinstance(result, int) else 0)
+                    print(f"🗓️ [워커 {worker_id}] {district_name} 종료: {elapsed:.1f}초, {collected}개")
+                    if self.progress_manager is not None:
+                        try:
+                            self.progress_manager.record_district_timing(district_name, elapsed, collected)
+                        except Exception:
+                            pass
+                finally:
+                    self._queue.task_done()
+
+        workers = [asyncio.create_task(worker_loop(i + 1)) for i in range(self.concurrency)]
+        await asyncio.gather(*workers)
+        return results
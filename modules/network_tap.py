@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+📡 ArticleListTap - 무한 스크롤 네트워크 모니터링
+- Playwright 응답 감시 (articleList API 감지)
+- 구별 공유 HTTP 세션 (keep-alive 커넥션 풀)
+- 동시 요청 수 제한 + 태스크 추적 (종료 전 drain)
+- 응답 본문 직접 캡처 (재요청 없음) + 선택적 디스크 스풀
+- 페이지별 체크포인트 저장 (스레드) / 재개 시 저장된 페이지 다음부터 / 스트리밍 콜백 (선택)
+- 다음 articleList 응답 대기 (응답 기반 스크롤 루프용)
+- 첫 articleList 요청 템플릿 캡처 → 나머지 페이지는 page 파라미터만 바꿔 직접 요청 (replay)
+"""
+
+import asyncio
+import json
+import os
+import math
+import re
+import traceback
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .async_transport import AiohttpTransport
+
+
+class ArticleListTap:
+    """📡 articleList 응답을 감지해 매물 데이터를 모으는 네트워크 탭"""
+
+    # 감지 대상 URL 키워드 (기존 무한 스크롤 수집기와 동일)
+    WATCH_KEYWORDS = ['article', 'atcl', 'ajax', 'cluster', 'list', 'land', 'm.land']
+    ARTICLE_KEYWORDS = ['articleList', 'cluster', 'ajax']
+
+    # 캡처 모드: 'response' = Playwright 응답 본문 직접 사용, 'refetch' = 같은 URL을 다시 요청
+    CAPTURE_MODES = ('response', 'refetch')
+
+    # 페이지 재생 시 브라우저 요청에서 그대로 가져갈 헤더
+    REPLAY_HEADERS = ('referer', 'user-agent', 'accept', 'accept-language', 'x-requested-with')
+    PAGE_SIZE = 20  # articleList 페이지당 매물 수
+    REPLAY_RETRIES = 3       # 직접 페이지 요청 재시도 횟수 (일시 오류: 예외/429/5xx/JSON 아님)
+    REPLAY_BACKOFF = 1.0     # 재시도 대기 (초, 시도마다 2배)
+
+    def __init__(self, page, district_name: str, host_budget=None, max_concurrent_fetches: int = 4,
+                 capture_mode: str = 'response', spool_dir: Optional[str] = None, run_id: Optional[str] = None,
+                 checkpoint=None,
+                 on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                 progress_manager=None):
+        self.page = page
+        self.district_name = district_name
+        self.capture_mode = capture_mode if capture_mode in self.CAPTURE_MODES else 'response'
+        # 스풀 경로: {spool_dir}/{run_id}/{구}/{탭 시작 시각}_{순번}_page{n}.json (다른 실행/재개와 겹치지 않음)
+        self._spool_session = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        self.spool_dir = os.path.join(spool_dir, run_id or self._spool_session, district_name) if spool_dir else None
+        self._spool_seq = 0
+        self.captured_count = 0  # 직접 캡처한 응답 수
+        self.refetch_count = 0   # 재요청한 응답 수
+        self.checkpoint = checkpoint  # DistrictCheckpoint (선택) - 수신한 페이지마다 저장
+        self._checkpoint_lock = asyncio.Lock()  # 저장 순서 유지 (스레드에서 한 번에 하나씩)
+        self._ingested_pages: Set[int] = set()
+        self._checkpoint_page = 0  # 1페이지부터 빠짐없이 저장된 마지막 페이지 ('scroll' 커서)
+        self.on_page = on_page  # 페이지 수신 즉시 호출 (스트리밍 DB 저장)
+        self.progress_manager = progress_manager  # 페이지마다 구별 진행률/처리량 기록 (선택)
+
+        self.api_requests: List[Dict[str, Any]] = []
+        self.all_properties: List[Dict[str, Any]] = []
+        self.total_property_count = 0  # 전체 매물 수 (totCnt에서 추출)
+        self.article_response_count = 0  # 감지한 articleList 응답 수 (스크롤 루프 진행 기준)
+        self.request_template: Optional[Dict[str, Any]] = None  # 첫 articleList 요청 (URL/헤더)
+        self.seen_pages: Set[int] = set()  # 브라우저가 이미 요청한 페이지 번호
+        self.replayed_count = 0  # 직접 재생한 페이지 수
+        self.replay_complete = False  # 직접 재생이 목록 끝(more=false / 빈 페이지 / totCnt 마지막 페이지)까지 갔는지
+        self.replay_failed_page: Optional[int] = None  # 재시도 후에도 받지 못해 재생을 멈춘 페이지
+
+        # ↩️ 체크포인트 재개: 저장된 페이지까지는 다시 요청하지 않음 (replay가 다음 페이지부터 시작)
+        self.resume_page = 0
+        if self.checkpoint is not None:
+            cursor = self.checkpoint.get_cursor('scroll')
+            if cursor:
+                self.resume_page = self._checkpoint_page = cursor['page']
+                self.seen_pages.update(range(1, self.resume_page + 1))
+                print(f'↩️ {district_name} 체크포인트 재개: {self.resume_page}페이지까지 저장됨')
+        self._article_event = asyncio.Event()
+
+        # 🔗 구별 공유 세션 (요청마다 새 TLS 연결을 만들지 않음)
+        self.transport = AiohttpTransport(
+            pool_limit=max_concurrent_fetches,
+            limit_per_host=max_concurrent_fetches,
+            extra_headers={
+                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
+                'Accept': 'application/json, text/javascript, */*; q=0.01',
+                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+                'X-Requested-With': 'XMLHttpRequest'
+            },
+            host_budget=host_budget
+        )
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
+        self._pending_tasks: Set[asyncio.Task] = set()
+        self._attached = False
+
+    def attach(self) -> None:
+        """🔌 페이지 응답 이벤트 구독"""
+        if not self._attached:
+            self.page.on('response', self.handle_response)
+            self._attached = True
+
+    def detach(self) -> None:
+        """🔌 페이지 응답 이벤트 구독 해제 (새 태스크 생성 중단)"""
+        if self._attached:
+            self.page.remove_listener('response', self.handle_response)
+            self._attached = False
+
+    def handle_response(self, response) -> None:
+        """🌐 Playwright 응답 핸들러"""
+        # 더 넓은 범위의 API 요청 감지
+        if not any(keyword in response.url for keyword in self.WATCH_KEYWORDS):
+            return
+
+        self.api_requests.append({
+            'url': response.url,
+            'status': response.status,
+            'timestamp': asyncio.get_event_loop().time()
+        })
+        print(f'🌐 API 발견: {response.status} {response.url}')
+
+        # totCnt 추출 (전체 매물 수)
+        if 'totCnt=' in response.url:
+            match = re.search(r'totCnt=(\d+)', response.url)
+            if match and self.total_property_count == 0:
+                self.total_property_count = int(match.group(1))
+                print(f'🎯 전체 매물 수 감지: {self.total_property_count}개')
+
+        # 매물 관련 API인지 추가 확인
+        if any(keyword in response.url for keyword in self.ARTICLE_KEYWORDS):
+            print(f'🎯 매물 API 확인: {response.url}')
+            if 'articleList' in response.url:
+                # 스크롤 루프는 목록 페이지 응답만 기다림 (cluster/ajax 응답은 진행으로 세지 않음)
+                self.article_response_count += 1
+                self._article_event.set()
+                self._remember_request(response)
+
+            # 실시간으로 API 처리 (추적되는 비동기 태스크)
+            if self.capture_mode == 'response':
+                self._track(self.capture_response(response))
+            else:
+                self._track(self.process_api_request(response.url))
+
+    def _remember_request(self, response) -> None:
+        """📌 articleList 페이지 번호 기록 + 첫 요청을 재생용 템플릿으로 보관"""
+        self.seen_pages.add(self._page_number(response.url) or 1)
+        if self.request_template is None:
+            try:
+                request_headers = response.request.headers
+            except Exception:
+                request_headers = {}
+            self.request_template = {
+                'url': response.url,
+                'headers': {key: value for key, value in request_headers.items() if key.lower() in self.REPLAY_HEADERS}
+            }
+            print(f'📌 articleList 요청 템플릿 캡처: {response.url}')
+
+    @staticmethod
+    def _page_number(url: str) -> Optional[int]:
+        page_match = re.search(r'[?&]page=(\d+)', url)
+        return int(page_match.group(1)) if page_match else None
+
+    @staticmethod
+    def page_url(template_url: str, page_no: int) -> str:
+        """템플릿 URL에서 page 파라미터만 교체"""
+        parts = urlsplit(template_url)
+        query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != 'page']
+        query.append(('page', str(page_no)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    async def replay_pages(self, concurrency: int = 4, max_items: Optional[int] = None,
+                           max_pages: int = 1000, should_stop: Optional[Callable[[], bool]] = None) -> Optional[int]:
+        """🔁 캡처한 템플릿으로 남은 페이지를 직접 요청 (more/빈 페이지/totCnt로 종료, 첫 요청부터 실패하면 None,
+        중간 페이지가 재시도 후에도 실패하면 replay_failed_page에 기록하고 멈춤)"""
+        if self.request_template is None:
+            return None
+
+        # 브라우저 요청은 더 받지 않음 (스크롤 중단) - 이미 받은 응답 처리는 마저 끝냄
+        self.detach()
+        if self._pending_tasks:
+            await asyncio.wait(set(self._pending_tasks), timeout=30)
+
+        template_url = self.request_template['url']
+        headers = self.request_template['headers']
+        last_page = max_pages
+        if self.total_property_count > 0:
+            last_page = min(last_page, math.ceil(self.total_property_count / self.PAGE_SIZE))
+
+        async def fetch(page_no: int):
+            status, data = None, None
+            for attempt in range(self.REPLAY_RETRIES + 1):
+                if attempt:
+                    await asyncio.sleep(self.REPLAY_BACKOFF * 2 ** (attempt - 1))
+                async with self._fetch_semaphore:
+                    try:
+                        status, data = await self.transport.get_json(self.page_url(template_url, page_no), headers=headers)
+                    except Exception as e:
+                        print(f'                ⚠️ 페이지 {page_no} 재생 실패 ({attempt + 1}회): {e}')
+                        status, data = None, None
+                        continue
+                if status == 200 and isinstance(data, dict):
+                    break
+                if status is not None and status != 200 and status != 429 and status < 500:
+                    break  # 4xx/3xx는 거부 응답 → 재시도하지 않음
+                print(f'                ⚠️ 페이지 {page_no} 응답 오류 ({status}, {attempt + 1}회)')
+            return page_no, status, data
+
+        print(f'            🔁 {self.district_name} articleList 직접 페이지 요청 시작 '
+              f'(동시 {concurrency}개, 최대 {last_page}페이지, 브라우저 수신 {len(self.seen_pages)}페이지 제외)')
+        replayed = 0
+        next_page = 1
+        finished = False
+        stopped = False
+        self.replay_complete = False
+        self.replay_failed_page = None
+        while not finished and next_page <= last_page:
+            if should_stop is not None and should_stop():
+                print(f'            🛑 중지 요청 → 페이지 재생 중단')
+                stopped = True
+                break
+
+            batch = []
+            while len(batch) < concurrency and next_page <= last_page:
+                if next_page not in self.seen_pages:
+                    batch.append(next_page)
+                next_page += 1
+            if not batch:
+                break
+
+            # 페이지 순서대로 반영 (체크포인트/스트리밍 순서 유지)
+            for page_no, status, data in await asyncio.gather(*(fetch(page_no) for page_no in batch)):
+                if status != 200 or not isinstance(data, dict):
+                    if replayed == 0:
+                        print(f'            ⚠️ 페이지 {page_no} 응답 오류 ({status}) → 직접 요청 불가')
+                        return None
+                    # 남은 페이지를 조용히 버리지 않도록 실패 페이지를 기록 (호출자가 미완료 처리)
+                    print(f'            ⚠️ 페이지 {page_no} 재시도 후에도 실패 ({status}) → 재생 중단')
+                    self.replay_failed_page = page_no
+                    finished = True
+                    break
+                self.seen_pages.add(page_no)
+                replayed += 1
+                body = data.get('body')
+                if isinstance(body, list) and body:
+                    self.ingest_payload(data, page_no)
+                if not body or data.get('more') is False:
+                    print(f'            ✅ 마지막 페이지 도달 (페이지 {page_no}, more={data.get("more")})')
+                    self.replay_complete = True
+                    finished = True
+                    break
+                if max_items is not None and len(self.all_properties) >= max_items:
+                    print(f'            ⏹️ {max_items}개 이상 수집됨, 재생 중단')
+                    finished = True
+                    break
+
+        if not finished and not stopped and self.total_property_count > 0 and next_page > last_page:
+            # totCnt 기준 마지막 페이지까지 모두 받음 (페이지 상한에 걸린 경우는 제외)
+            self.replay_complete = last_page * self.PAGE_SIZE >= self.total_property_count
+        self.replayed_count += replayed
+        print(f'            🔁 직접 요청 {replayed}페이지 완료 (총 {len(self.all_properties)}개)')
+        return replayed
+
+    def _track(self, coro) -> asyncio.Task:
+        """태스크 등록 (완료 시 자동 제거)"""
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending_tasks)
+
+    async def wait_for_article_response(self, after_count: int, timeout: float) -> bool:
+        """⏳ after_count 이후 새 articleList 응답이 올 때까지 대기 (처리 태스크 완료 포함, 시간 초과 시 False)"""
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while self.article_response_count <= after_count:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            self._article_event.clear()
+            try:
+                await asyncio.wait_for(self._article_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return False
+
+        # 응답 본문 처리가 끝나야 매물 수가 반영됨
+        if self._pending_tasks:
+            await asyncio.wait(set(self._pending_tasks), timeout=max(deadline - loop.time(), 1.0))
+        return True
+
+    async def capture_response(self, response) -> bool:
+        """📥 Playwright 응답 본문을 직접 읽어 매물 데이터 누적 (업스트림 재요청 없음)"""
+        if response.status != 200:
+            print(f'                ❌ HTTP 오류: {response.status}')
+            return False
+
+        content_type = response.headers.get('content-type', '')
+        if 'json' not in content_type and 'javascript' not in content_type:
+            print(f'                ℹ️ JSON 응답 아님 (건너뜀): {content_type or "content-type 없음"}')
+            return False
+
+        try:
+            data = await response.json()
+        except Exception as e:
+            # 본문을 읽을 수 없는 경우(리다이렉트/페이지 이동 후 폐기 등)에만 재요청
+            print(f'                ⚠️ 응답 본문 캡처 실패, 재요청으로 대체: {e}')
+            return await self.process_api_request(response.url)
+
+        self.captured_count += 1
+        print(f'                🎯 응답 직접 캡처: {response.url}')
+        if self.spool_dir:
+            await self._spool_payload(response.url, data)
+        return self.ingest_payload(data, self._page_number(response.url))
+
+    async def _spool_payload(self, url: str, data: Any) -> None:
+        """💾 캡처한 원본 응답을 디스크에 보관 (재처리/디버깅용)"""
+        self._spool_seq += 1
+        page_match = re.search(r'[?&]page=(\d+)', url)
+        page_no = page_match.group(1) if page_match else 'x'
+        path = os.path.join(self.spool_dir, f"{self._spool_session}_{self._spool_seq:05d}_page{page_no}.json")
+
+        def write():
+            os.makedirs(self.spool_dir, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'payload': data}, f, ensure_ascii=False)
+
+        try:
+            await asyncio.to_thread(write)
+        except Exception as e:
+            print(f'                ⚠️ 스풀 저장 실패: {e}')
+
+    async def process_api_request(self, url: str) -> bool:
+        """📥 감지된 articleList URL 재요청 후 매물 데이터 누적"""
+        async with self._fetch_semaphore:
+            try:
+                self.refetch_count += 1
+                print(f'                🎯 실시간 API 처리: {url}')
+
+                status, data = await self.transport.get_json(url, headers={'Referer': self.page.url})
+                print(f'                📡 응답 상태: {status}')
+
+                if status != 200:
+                    print(f'                ❌ HTTP 오류: {status}')
+                    return False
+
+                return self.ingest_payload(data, self._page_number(url))
+
+            except Exception as e:
+                print(f'                ❌ API 데이터 추출 실패: {e}')
+                print(f'                📋 상세 오류: {traceback.format_exc()}')
+
+            return False
+
+    def ingest_payload(self, data: Any, page_no: Optional[int] = None) -> bool:
+        """📊 articleList 응답 본문에서 매물 목록 누적 (page_no: 체크포인트 커서용 페이지 번호)"""
+        print(f'                📋 응답 키들: {list(data.keys()) if isinstance(data, dict) else "리스트 형태"}')
+
+        if isinstance(data, dict) and 'body' in data and isinstance(data['body'], list):
+            new_properties = data['body']
+            self.all_properties.extend(new_properties)
+            if self.checkpoint is not None:
+                if page_no is None and str(data.get('page', '')).isdigit():
+                    page_no = int(data['page'])
+                self._track(self._save_checkpoint(page_no, new_properties))
+            if self.on_page is not None:
+                self.on_page(new_properties)
+            if self.progress_manager is not None:
+                try:
+                    self.progress_manager.update_page_progress(
+                        page_no or len(self.seen_pages) or 1, len(new_properties),
+                        self.total_property_count or None, district_name=self.district_name
+                    )
+                except Exception:
+                    pass
+            print(f'                📊 매물 데이터: {len(new_properties)}개 추가 (총 {len(self.all_properties)}개)')
+
+            # 매물 데이터 샘플 출력
+            for j, prop in enumerate(new_properties[:3]):  # 처음 3개만
+                name = prop.get('atclNm', '이름없음')
+                deposit = prop.get('prc', 0)
+                rent = prop.get('rentPrc', 0)
+                area = prop.get('spc1', 0)
+                print(f'                  매물 {j+1}: {name} - {deposit}/{rent}만원 ({area}㎡)')
+            return True
+
+        print(f'                ❌ 응답 구조 오류: body 키 없음 또는 리스트 아님')
+        print(f'                📋 응답 구조 (처음 500자): {str(data)[:500]}')
+        return False
+
+    async def _save_checkpoint(self, page_no: Optional[int], articles: List[Dict[str, Any]]) -> None:
+        """💾 페이지 저장 (SQLite 커밋은 스레드에서, 도착 순서대로) - 커서는 1페이지부터 연속 저장된 곳까지만 전진"""
+        async with self._checkpoint_lock:
+            if page_no is not None:
+                self._ingested_pages.add(page_no)
+                while self._checkpoint_page + 1 in self._ingested_pages:
+                    self._checkpoint_page += 1
+            await asyncio.to_thread(self.checkpoint.save_page, 'scroll', self._checkpoint_page, articles)
+
+    async def drain(self, timeout: Optional[float] = 60) -> None:
+        """⏳ 진행 중인 API 처리 태스크 완료 대기 (변환 전 호출)"""
+        self.detach()
+        if not self._pending_tasks:
+            return
+
+        print(f'            ⏳ 진행 중인 API 처리 {len(self._pending_tasks)}개 완료 대기...')
+        done, pending = await asyncio.wait(set(self._pending_tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            print(f'            ⚠️ 시간 초과로 {len(pending)}개 API 처리 취소')
+
+    async def close(self) -> None:
+        """🔒 태스크 정리 후 공유 세션 종료"""
+        await self.drain()
+        await self.transport.close()
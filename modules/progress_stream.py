@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+📡 ProgressStream - 수집 진행률 SSE(Server-Sent Events) 스트림
+- ProgressManager 이벤트 로그(링 버퍼)를 구독해 새 이벤트만 전송
+- 진행률/처리량 스냅샷은 바뀔 때만 'stats' 이벤트로 전송
+- Last-Event-ID로 재연결 시 놓친 이벤트부터 이어서 전송
+- GET /events (text/event-stream), GET /progress (JSON 스냅샷)
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class ProgressStreamServer:
+    """📡 로컬 진행률 SSE 서버 (백그라운드 스레드)"""
+
+    def __init__(self, progress_manager=None, host: str = "127.0.0.1", port: int = 8765,
+                 poll_interval: float = 0.5, keepalive_seconds: float = 15.0):
+        if progress_manager is None:
+            from progress_manager import get_progress_manager
+            progress_manager = get_progress_manager()
+        self.progress_manager = progress_manager
+        self.host = host
+        self.port = port
+        self.poll_interval = poll_interval
+        self.keepalive_seconds = keepalive_seconds
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/events"
+
+    def start(self) -> 'ProgressStreamServer':
+        """서버 시작 (이미 실행 중이면 그대로)"""
+        if self.httpd is not None:
+            return self
+        self.httpd = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="progress-stream", daemon=True)
+        self._thread.start()
+        print(f"📡 진행률 스트림 시작: {self.url}")
+        return self
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+            print("📡 진행률 스트림 종료")
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                if path == '/events':
+                    server._stream_events(self)
+                elif path == '/progress':
+                    body = json.dumps(server.progress_manager.get_live_stats(), ensure_ascii=False).encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json; charset=utf-8')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 로그 출력하지 않음
+
+        return Handler
+
+    def _stream_events(self, handler: BaseHTTPRequestHandler):
+        """연결이 끊길 때까지 새 이벤트 / 바뀐 스냅샷 전송"""
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        handler.send_header('Cache-Control', 'no-cache')
+        handler.send_header('Access-Control-Allow-Origin', '*')
+        handler.end_headers()
+
+        try:
+            last_id = int(handler.headers.get('Last-Event-ID', 0))
+        except ValueError:
+            last_id = 0
+        last_update = None
+        last_sent = time.monotonic()
+
+        try:
+            while True:
+                chunks = []
+                for event in self.progress_manager.get_events(after_id=last_id):
+                    last_id = event["id"]
+                    chunks.append(self._format_event(event["kind"], event, event_id=last_id))
+
+                stats = self.progress_manager.get_live_stats()
+                if stats.get("last_update") != last_update:
+                    last_update = stats.get("last_update")
+                    chunks.append(self._format_event('stats', stats))
+
+                if chunks:
+                    handler.wfile.write(''.join(chunks).encode('utf-8'))
+                    handler.wfile.flush()
+                    last_sent = time.monotonic()
+                elif time.monotonic() - last_sent >= self.keepalive_seconds:
+                    handler.wfile.write(b': keepalive\n\n')
+                    handler.wfile.flush()
+                    last_sent = time.monotonic()
+
+                time.sleep(self.poll_interval)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 구독자 연결 종료
+
+    @staticmethod
+    def _format_event(kind: str, data: dict, event_id: Optional[int] = None) -> str:
+        lines = [f"event: {kind}"]
+        if event_id is not None:
+            lines.append(f"id: {event_id}")
+        lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+        return '\n'.join(lines) + '\n\n'
+
+
+# 프로세스당 하나의 스트림 서버
+_stream_server = None
+
+def start_progress_stream(host: str = "127.0.0.1", port: int = 8765) -> ProgressStreamServer:
+    """📡 진행률 SSE 서버 시작 (이미 실행 중이면 기존 서버 반환)"""
+    global _stream_server
+    if _stream_server is None:
+        _stream_server = ProgressStreamServer(host=host, port=port).start()
+    return _stream_server
+
+
+if __name__ == '__main__':
+    import sys
+
+    start_progress_stream(port=int(sys.argv[1]) if len(sys.argv) > 1 else 8765)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+📦 RawPayload - 원시 매물 페이로드 직렬화 / 저장
+- compact JSON 직렬화 (orjson 설치 시 사용)
+- JSON 우선 디코딩, 기존 str(dict) 행은 ast.literal_eval로 호환
+- raw_payloads 테이블 (article_id 키, zstandard 설치 시 zstd 압축)
+- 기존 properties.raw_text repr 행 마이그레이션
+"""
+
+import ast
+import json
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def encode_payload(payload: Any) -> str:
+    """📦 원시 페이로드 → compact JSON 문자열 (한글 그대로)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload).decode('utf-8')
+        except TypeError:
+            pass  # orjson이 지원하지 않는 타입 (큰 정수 등) → 표준 json
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def decode_payload(value: Any) -> Optional[Any]:
+    """📦 raw_text 값 → 원시 페이로드 (비어 있으면 None, 해석 불가 시 ValueError)
+
+    JSON을 먼저 시도하고, 실패하면 예전 str(dict) 형식으로 해석
+    """
+    if value is None:
+        return None
+    if not isinstance(value, (str, bytes)):
+        return value
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    if value == '':
+        return None
+
+    if value[:2] in ('{"', '[{', '[]', '{}'):
+        try:
+            return orjson.loads(value) if orjson is not None else json.loads(value)
+        except ValueError:
+            pass
+
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        raise ValueError(f"raw 페이로드 해석 실패: {value[:100]}...")
+
+
+def is_json_payload(value: Any) -> bool:
+    """이미 JSON으로 저장된 문자열인지 (repr 행 판별용)"""
+    return isinstance(value, str) and value[:2] in ('{"', '{}')
+
+
+def article_id_from_link(naver_link: Any) -> Optional[str]:
+    """🔗 naver_link → 매물번호 (https://m.land.naver.com/article/info/{atclNo})"""
+    if not isinstance(naver_link, str) or not naver_link:
+        return None
+    article_id = naver_link.rstrip('/').rsplit('/', 1)[-1]
+    return article_id or None
+
+
+class RawPayloadStore:
+    """📦 raw_payloads 테이블 (article_id → 압축 JSON)"""
+
+    def __init__(self, use_zstd: bool = True, level: int = 3):
+        self.level = level
+        self.codec = 'zstd' if use_zstd and zstandard is not None else 'json'
+
+    def create_table(self, conn: sqlite3.Connection):
+        """raw_payloads 테이블 생성"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS raw_payloads (
+                article_id TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                raw_size INTEGER,
+                updated_at TIMESTAMP
+            )
+        ''')
+
+    def pack(self, text: str, compressor=None) -> Tuple[str, bytes]:
+        data = text.encode('utf-8')
+        if self.codec == 'zstd':
+            compressor = compressor or zstandard.ZstdCompressor(level=self.level)
+            return 'zstd', compressor.compress(data)
+        return 'json', data
+
+    @staticmethod
+    def unpack(codec: str, blob: Any, decompressor=None) -> str:
+        if codec == 'zstd':
+            if zstandard is None:
+                raise RuntimeError("zstd 압축 페이로드를 읽으려면 zstandard 패키지가 필요합니다")
+            decompressor = decompressor or zstandard.ZstdDecompressor()
+            return decompressor.decompress(blob).decode('utf-8')
+        return blob.decode('utf-8') if isinstance(blob, bytes) else blob
+
+    def save_many(self, conn: sqlite3.Connection, items: Iterable[Tuple[str, str]]) -> int:
+        """💾 (article_id, JSON 문자열) 목록 저장 (같은 article_id는 덮어쓰기)"""
+        compressor = zstandard.ZstdCompressor(level=self.level) if self.codec == 'zstd' else None
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = []
+        for article_id, text in items:
+            codec, blob = self.pack(text, compressor)
+            rows.append((article_id, codec, blob, len(text), now))
+        if rows:
+            conn.executemany('''
+                INSERT INTO raw_payloads (article_id, codec, payload, raw_size, updated_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(article_id) DO UPDATE SET
+                    codec = excluded.codec, payload = excluded.payload,
+                    raw_size = excluded.raw_size, updated_at = excluded.updated_at
+            ''', rows)
+        return len(rows)
+
+    def load_texts(self, conn: sqlite3.Connection, article_ids: Optional[List[str]] = None) -> Dict[str, str]:
+        """📖 article_id → JSON 문자열 (article_ids 없으면 전체)"""
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'raw_payloads'").fetchone():
+            return {}
+
+        if article_ids is None:
+            fetched = conn.execute('SELECT article_id, codec, payload FROM raw_payloads').fetchall()
+        else:
+            fetched = []
+            unique_ids = list(dict.fromkeys(article_ids))
+            for start in range(0, len(unique_ids), 500):
+                chunk = unique_ids[start:start + 500]
+                placeholders = ', '.join('?' for _ in chunk)
+                fetched.extend(conn.execute(
+                    f'SELECT article_id, codec, payload FROM raw_payloads WHERE article_id IN ({placeholders})', chunk
+                ).fetchall())
+
+        decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+        texts = {}
+        for article_id, codec, blob in fetched:
+            try:
+                texts[article_id] = self.unpack(codec, blob, decompressor)
+            except Exception as e:
+                print(f"⚠️ raw 페이로드 복원 실패 ({article_id}): {e}")
+        return texts
+
+    def migrate_properties(self, db_path: str, vacuum: bool = True) -> Dict[str, int]:
+        """🔧 properties.raw_text (repr/JSON) → raw_payloads 이전 후 raw_text 비움
+
+        매물번호를 알 수 없는 행은 raw_text를 compact JSON으로만 다시 씀
+        """
+        stats = {'moved': 0, 'rewritten': 0, 'failed': 0}
+        conn = sqlite3.connect(db_path)
+        try:
+            table = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'properties'").fetchone()
+            if not table:
+                return stats
+
+            with conn:
+                self.create_table(conn)
+            size_before = self._file_size(conn)
+
+            rows = conn.execute(
+                "SELECT id, naver_link, raw_text FROM properties WHERE raw_text IS NOT NULL AND raw_text != ''"
+            ).fetchall()
+            payloads = []
+            cleared_ids = []
+            rewritten = []
+            for row_id, naver_link, raw_text in rows:
+                try:
+                    payload = decode_payload(raw_text)
+                except ValueError:
+                    stats['failed'] += 1
+                    continue
+                text = raw_text if is_json_payload(raw_text) else encode_payload(payload)
+                article_id = article_id_from_link(naver_link)
+                if article_id is None and isinstance(payload, dict) and payload.get('atclNo'):
+                    article_id = str(payload['atclNo'])
+                if article_id:
+                    payloads.append((article_id, text))
+                    cleared_ids.append((row_id,))
+                elif text != raw_text:
+                    rewritten.append((text, row_id))
+
+            with conn:
+                stats['moved'] = self.save_many(conn, payloads)
+                conn.executemany('UPDATE properties SET raw_text = NULL WHERE id = ?', cleared_ids)
+                conn.executemany('UPDATE properties SET raw_text = ? WHERE id = ?', rewritten)
+                stats['rewritten'] = len(rewritten)
+
+            if vacuum and (payloads or rewritten):
+                conn.execute('VACUUM')
+            size_after = self._file_size(conn)
+        finally:
+            conn.close()
+
+        print(f"🔧 raw 페이로드 마이그레이션: 이전 {stats['moved']}개, JSON 변환 {stats['rewritten']}개, "
+              f"실패 {stats['failed']}개 ({self.codec}, DB {size_before / 1024:.0f}KB → {size_after / 1024:.0f}KB)")
+        return stats
+
+    @staticmethod
+    def _file_size(conn: sqlite3.Connection) -> int:
+        page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+        page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+        return page_count * page_size
+
+
+if __name__ == '__main__':
+    import sys
+
+    RawPayloadStore().migrate_properties(sys.argv[1] if len(sys.argv) > 1 else 'data/properties.db')
@@ -7,6 +7,7 @@
 - 봇 탐지 우회
 """
 
+import asyncio
 import random
 import time
 import requests
@@ -64,26 +65,30 @@ class StealthManager:
             session = requests.Session()
             user_agent = random.choice(self.stealth_user_agents)
             
-            session.headers.update({
-                'User-Agent': user_agent,
-                'Accept': 'application/json, text/plain, */*',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': 'https://m.land.naver.com/',
-                'Origin': 'https://m.land.naver.com',
-                'Connection': 'keep-alive',
-                'Sec-Fetch-Dest': 'empty',
-                'Sec-Fetch-Mode': 'cors',
-                'Sec-Fetch-Site': 'same-origin',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache'
-            })
+            session.headers.update(self.build_stealth_headers(user_agent))
             
             self.session_pool.append(session)
             self.session_usage_count[i] = 0
             
             print(f"   세션 #{i+1}: {user_agent[:50]}...")
     
+    def build_stealth_headers(self, user_agent: str = None) -> Dict[str, str]:
+        """🎭 스텔스 요청 헤더 생성 (requests/aiohttp 세션 공용)"""
+        return {
+            'User-Agent': user_agent or random.choice(self.stealth_user_agents),
+            'Accept': 'application/json, text/plain, */*',
+            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Referer': 'https://m.land.naver.com/',
+            'Origin': 'https://m.land.naver.com',
+            'Connection': 'keep-alive',
+            'Sec-Fetch-Dest': 'empty',
+            'Sec-Fetch-Mode': 'cors',
+            'Sec-Fetch-Site': 'same-origin',
+            'Cache-Control': 'no-cache',
+            'Pragma': 'no-cache'
+        }
+    
     def get_stealth_session(self) -> requests.Session:
         """🎯 로테이션 방식으로 세션 반환"""
         session_idx = self.current_session_idx
@@ -148,6 +153,21 @@ class StealthManager:
         print(f"         😴 {operation_name} 완료, 다음까지 {rest_time}초 휴식...", flush=True)
         time.sleep(rest_time)
     
+    async def async_wait_with_message(self, wait_time: float, message: str = "") -> None:
+        """⏳ 메시지와 함께 대기 (이벤트 루프 비차단)"""
+        if message:
+            print(f"         ⏳ {wait_time}초 대기 중... {message}", flush=True)
+        else:
+            print(f"         ⏳ {wait_time}초 대기 중... (인간 패턴)", flush=True)
+        
+        await asyncio.sleep(wait_time)
+    
+    async def async_rest_between_operations(self, operation_name: str = "작업") -> None:
+        """😴 작업 간 휴식 (이벤트 루프 비차단)"""
+        rest_time = self.get_human_wait_time(long_wait=True)
+        print(f"         😴 {operation_name} 완료, 다음까지 {rest_time}초 휴식...", flush=True)
+        await asyncio.sleep(rest_time)
+    
     def get_session_info(self) -> Dict[str, Any]:
         """📊 현재 세션 풀 상태 반환"""
         return {
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+🧩 TilePlanner - 쿼드트리 타일 분할 수집
+- 구 좌표 범위(bounding box)에서 시작
+- totCnt가 임계값을 넘거나 (totCnt 없이) 페이지 상한까지 더 남은 타일은 4개 하위 타일로 재귀 분할
+- 타일 병렬 조회 (동시 타일 수 제한)
+- atclNo 기준 병합 (타일 경계 중복 제거)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class Tile:
+    """🧩 위경도 사각형 타일"""
+
+    __slots__ = ('btm', 'lft', 'top', 'rgt', 'depth')
+
+    def __init__(self, btm: float, lft: float, top: float, rgt: float, depth: int = 0):
+        self.btm = btm
+        self.lft = lft
+        self.top = top
+        self.rgt = rgt
+        self.depth = depth
+
+    @classmethod
+    def from_coords(cls, coords: Dict[str, float]) -> 'Tile':
+        """SEOUL_DISTRICT_COORDS 형식의 좌표 사전에서 루트 타일 생성"""
+        return cls(float(coords['btm']), float(coords['lft']), float(coords['top']), float(coords['rgt']))
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.btm + self.top) / 2, (self.lft + self.rgt) / 2
+
+    def split(self) -> List['Tile']:
+        """4개 하위 타일로 분할 (남서, 남동, 북서, 북동)"""
+        mid_lat, mid_lng = self.center
+        depth = self.depth + 1
+        return [
+            Tile(self.btm, self.lft, mid_lat, mid_lng, depth),
+            Tile(self.btm, mid_lng, mid_lat, self.rgt, depth),
+            Tile(mid_lat, self.lft, self.top, mid_lng, depth),
+            Tile(mid_lat, mid_lng, self.top, self.rgt, depth),
+        ]
+
+    def to_params(self) -> Dict[str, str]:
+        """articleList 좌표 파라미터"""
+        lat, lng = self.center
+        return {
+            'lat': f"{lat:.6f}",
+            'lon': f"{lng:.6f}",
+            'btm': f"{self.btm:.6f}",
+            'lft': f"{self.lft:.6f}",
+            'top': f"{self.top:.6f}",
+            'rgt': f"{self.rgt:.6f}",
+        }
+
+    @property
+    def key(self) -> str:
+        """체크포인트용 고정 키"""
+        return f"{self.depth}:{self.btm:.6f},{self.lft:.6f},{self.top:.6f},{self.rgt:.6f}"
+
+    def __repr__(self) -> str:
+        return f"Tile(d{self.depth} {self.btm:.4f},{self.lft:.4f}~{self.top:.4f},{self.rgt:.4f})"
+
+
+def extract_total_count(data: Any) -> Optional[int]:
+    """articleList 응답에서 totCnt 추출 (최상위 / data.totCnt / body.totCnt)"""
+    if not isinstance(data, dict):
+        return None
+    candidates = [data.get('totCnt')]
+    if isinstance(data.get('data'), dict):
+        candidates.append(data['data'].get('totCnt'))
+    if isinstance(data.get('body'), dict):
+        candidates.append(data['body'].get('totCnt'))
+    for value in candidates:
+        try:
+            if value is not None and value != '':
+                return int(value)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def extract_articles(data: Any) -> Optional[List[Dict[str, Any]]]:
+    """articleList 응답에서 매물 목록 추출 (정상 목록 구조가 아니면 None)"""
+    if not isinstance(data, dict):
+        return None
+    if isinstance(data.get('body'), list):
+        return data['body']
+    if isinstance(data.get('data'), dict) and isinstance(data['data'].get('ARTICLE'), list):
+        return data['data']['ARTICLE']
+    return None
+
+
+def is_rejection(status: int, data: Any = None) -> bool:
+    """API가 요청 파라미터를 거부한 응답인지 (200인데 목록 구조가 아님 / 4xx·307) - 429·5xx는 일시 오류"""
+    if status == 200:
+        return extract_articles(data) is None
+    return status == 307 or (400 <= status < 500 and status != 429)
+
+
+class QuadtreeTiler:
+    """🧩 결과 상한을 넘는 구를 타일로 나눠 전체 매물을 모으는 수집기"""
+
+    def __init__(self, transport, api_url: str, base_params: Dict[str, Any],
+                 split_threshold: int = 1000, max_depth: int = 4, max_parallel_tiles: int = 4,
+                 max_pages_per_tile: int = 200, page_wait: Optional[Callable[[], Awaitable[None]]] = None,
+                 progress_manager=None, checkpoint=None,
+                 on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                 district_name: Optional[str] = None):
+        self.transport = transport
+        self.api_url = api_url
+        self.base_params = {k: v for k, v in base_params.items() if k != 'totCnt'}
+        self.split_threshold = split_threshold
+        self.max_depth = max_depth
+        self.max_pages_per_tile = max_pages_per_tile
+        self.page_wait = page_wait  # 페이지 사이 대기 (스텔스 패턴)
+        self.progress_manager = progress_manager
+        self.checkpoint = checkpoint  # DistrictCheckpoint (선택) - 타일별 페이지 커서 저장/재개
+        self.on_page = on_page  # 새 유니크 매물 수신 즉시 호출 (스트리밍 DB 저장)
+        self.district_name = district_name  # 진행률을 기록할 구 (병렬 타일/동시 수집 구 구분)
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._max_parallel_tiles = max(1, max_parallel_tiles)
+
+        self.articles: Dict[str, Dict[str, Any]] = {}
+        self.root_total: Optional[int] = None
+        self.params_accepted = False
+        self.rejection_seen = False  # 파라미터 거부 응답을 받았는지 (네트워크 오류/중지와 구분)
+        self.request_count = 0
+        self.split_count = 0
+        self.leaf_count = 0
+        self.truncated_tiles: List[Tile] = []  # 최대 깊이에서도 다 받지 못한 타일 (누락 가능)
+        self.failed_tiles: List[Tile] = []  # 오류로 중간에 끊긴 타일 (재개 시 다시 수집)
+        self._anonymous_seq = 0
+        self._pages_done = 0
+
+    def _stop_requested(self) -> bool:
+        try:
+            return bool(self.progress_manager and self.progress_manager.is_stop_requested())
+        except Exception:
+            return False
+
+    async def collect(self, root: Tile) -> List[Dict[str, Any]]:
+        """🚀 루트 타일부터 분할 수집 후 atclNo 기준 병합 결과 반환"""
+        self._semaphore = asyncio.Semaphore(self._max_parallel_tiles)
+        if self.checkpoint is not None:
+            restored = self.checkpoint.load_articles()
+            if restored:
+                self._ingest(restored)
+                self.params_accepted = True
+                print(f"            ↩️ 체크포인트에서 {len(restored)}개 매물 복원", flush=True)
+        await self._visit(root)
+
+        print(f"            🧩 타일 수집 완료: 요청 {self.request_count}회, 분할 {self.split_count}회, "
+              f"말단 타일 {self.leaf_count}개 → 유니크 {len(self.articles)}개"
+              + (f" (전체 {self.root_total}개)" if self.root_total else ""), flush=True)
+        if self.truncated_tiles:
+            print(f"            ⚠️ 최대 깊이에서도 다 받지 못한 타일 {len(self.truncated_tiles)}개 (일부 누락 가능): "
+                  f"{', '.join(map(repr, self.truncated_tiles[:5]))}", flush=True)
+        if self.failed_tiles:
+            print(f"            ⚠️ 오류로 끝까지 받지 못한 타일 {len(self.failed_tiles)}개: "
+                  f"{', '.join(map(repr, self.failed_tiles[:5]))}", flush=True)
+        return list(self.articles.values())
+
+    @property
+    def complete(self) -> bool:
+        """모든 타일을 목록 끝까지 받았는지 (잘림/오류/중지 없음)"""
+        return (self.params_accepted and not self.truncated_tiles and not self.failed_tiles
+                and not self._stop_requested())
+
+    async def _fetch_page(self, tile: Tile, page: int) -> Tuple[int, Any]:
+        params = dict(self.base_params)
+        params.update(tile.to_params())
+        params['z'] = str(int(self.base_params.get('z', 12)) + tile.depth)
+        params['page'] = page
+        self.request_count += 1
+        return await self.transport.get_json(self.api_url, params=params, timeout=30)
+
+    async def _visit(self, tile: Tile) -> None:
+        if self._stop_requested():
+            return
+
+        # ↩️ 체크포인트 재개: 분할된 타일은 하위 타일로, 완료 타일은 건너뜀, 진행 중 타일은 다음 페이지부터
+        cursor = self.checkpoint.get_cursor(tile.key) if self.checkpoint is not None else None
+        if cursor is not None:
+            if cursor['state'] == 'split':
+                self.split_count += 1
+                await asyncio.gather(*(self._visit(sub_tile) for sub_tile in tile.split()))
+                return
+            if cursor['state'] == 'done':
+                self.leaf_count += 1
+                return
+            if cursor['state'] == 'truncated':
+                self.leaf_count += 1
+                self._mark_truncated(tile)
+                return
+            self.leaf_count += 1
+            await self._collect_leaf(tile, None, start_page=cursor['page'] + 1)
+            return
+
+        async with self._semaphore:
+            try:
+                status, data = await self._fetch_page(tile, 1)
+            except Exception as e:
+                print(f"               ❌ {tile} 조회 오류: {e}", flush=True)
+                self.failed_tiles.append(tile)
+                return
+
+        articles = extract_articles(data) if status == 200 else None
+        if articles is None:
+            print(f"               ❌ {tile}: HTTP {status} 또는 목록 없음", flush=True)
+            self.rejection_seen = self.rejection_seen or is_rejection(status, data)
+            self.failed_tiles.append(tile)
+            return
+        self.params_accepted = True
+
+        total = extract_total_count(data)
+        if tile.depth == 0:
+            self.root_total = total
+
+        if total is not None and total > self.split_threshold:
+            if tile.depth < self.max_depth:
+                self.split_count += 1
+                print(f"               🧩 {tile}: {total}개 > {self.split_threshold} → 4분할", flush=True)
+                await self._save(tile, 1, [], 'split')
+                await asyncio.gather(*(self._visit(sub_tile) for sub_tile in tile.split()))
+                return
+            # 최대 깊이 - 잘림 여부는 말단 순회에서 페이지 상한에 걸렸는지로만 판단
+            print(f"               ⚠️ {tile}: {total}개 > {self.split_threshold}, 최대 깊이 → 분할 없이 순회", flush=True)
+
+        self.leaf_count += 1
+        await self._collect_leaf(tile, data, total)
+
+    async def _collect_leaf(self, tile: Tile, first_data: Any, total: Optional[int] = None,
+                            start_page: int = 1) -> None:
+        """📄 말단 타일 페이지 순회 (more=false / 빈 페이지까지, 페이지 상한에서 남으면 분할 또는 잘림 기록)"""
+        page = start_page - 1  # 마지막으로 저장된 페이지
+        has_more = True
+
+        if first_data is not None:
+            page = 1
+            articles = extract_articles(first_data)
+            self._ingest(articles)
+            await self._save(tile, page, articles)
+            has_more = bool(articles) and first_data.get('more', True)
+
+        async with self._semaphore:
+            while has_more and page < self.max_pages_per_tile:
+                if self._stop_requested():
+                    return
+                if self.page_wait is not None:
+                    await self.page_wait()
+
+                page += 1
+                try:
+                    status, data = await self._fetch_page(tile, page)
+                except Exception as e:
+                    print(f"               ❌ {tile} {page}페이지 오류: {e}", flush=True)
+                    self.failed_tiles.append(tile)
+                    return
+                articles = extract_articles(data) if status == 200 else None
+                if articles is None:
+                    print(f"               ❌ {tile} {page}페이지: HTTP {status}", flush=True)
+                    self.failed_tiles.append(tile)
+                    return
+                self._ingest(articles)
+                await self._save(tile, page, articles)
+                has_more = bool(articles) and data.get('more', True)
+
+        if has_more:
+            # 페이지 상한 도달 + 남은 매물 있음 (totCnt 없는 응답이면 분할 판단을 여기서)
+            if tile.depth < self.max_depth:
+                self.split_count += 1
+                self.leaf_count -= 1
+                print(f"               🧩 {tile}: {page}페이지 상한 도달, 남은 매물 있음 → 4분할", flush=True)
+                await self._save(tile, page, [], 'split')
+                await asyncio.gather(*(self._visit(sub_tile) for sub_tile in tile.split()))
+                return
+            self._mark_truncated(tile)
+            await self._save(tile, page, [], 'truncated')
+            print(f"               ⚠️ {tile}: 최대 깊이에서 {page}페이지 상한 도달 → 남은 매물 누락 "
+                  f"(누적 유니크 {len(self.articles)}개)", flush=True)
+            return
+
+        await self._save(tile, page, [], 'done')
+        print(f"               ✅ {tile}: {page}페이지, 타일 {total if total is not None else '?'}개 "
+              f"(누적 유니크 {len(self.articles)}개)", flush=True)
+
+    def _mark_truncated(self, tile: Tile) -> None:
+        if tile not in self.truncated_tiles:
+            self.truncated_tiles.append(tile)
+
+    async def _save(self, tile: Tile, page: int, articles: List[Dict[str, Any]], state: str = 'partial') -> None:
+        if self.checkpoint is not None:
+            await asyncio.to_thread(self.checkpoint.save_page, tile.key, page, articles, state)
+
+    def _ingest(self, articles: List[Dict[str, Any]]) -> None:
+        """atclNo 기준 병합 (타일 경계에 걸친 매물 중복 제거)"""
+        before = len(self.articles)
+        new_articles = []
+        for article in articles:
+            if not isinstance(article, dict):
+                continue
+            key = article.get('atclNo')
+            if not key:
+                self._anonymous_seq += 1
+                key = f"_anon_{self._anonymous_seq}"
+            if str(key) not in self.articles:
+                self.articles[str(key)] = article
+                new_articles.append(article)
+
+        if new_articles and self.on_page is not None:
+            self.on_page(new_articles)
+
+        self._pages_done += 1
+        if self.progress_manager is not None:
+            try:
+                self.progress_manager.update_page_progress(self._pages_done, len(self.articles) - before, self.root_total,
+                                                           district_name=self.district_name)
+            except Exception:
+                pass
@@ -2,91 +2,297 @@
 """
 📊 ProgressManager - 실시간 진행률 관리
 - Streamlit과 API 수집기 간 실시간 상태 공유
-- 파일 기반 진행률 저장 및 읽기
+- SQLite(WAL) 기반 진행률 저장 (필드/카운터 단위 O(1) 갱신, 읽기는 쓰기를 막지 않음)
+- 오류/구 완료/페이지는 종류별 최근 N개만 유지하는 이벤트 로그 (링 버퍼)
+- 구별 처리량(페이지/초, 매물/초)과 예상 완료 시간 계산 (실시간 스트림/대시보드용)
+- 수집 경로의 갱신은 메모리 버퍼에 합쳐 두었다가 백그라운드 스레드가 주기적으로 기록
+  (시작/완료/중지 같은 상태 전환은 즉시 기록)
 - 안전한 멀티 프로세스 지원
 """
 
+import atexit
 import json
 import os
+import sqlite3
+import threading
 import time
 from typing import Dict, Any, Optional
 from datetime import datetime
-import fcntl
 
 
 class ProgressManager:
     """📊 실시간 진행률 관리 클래스"""
-    
-    def __init__(self, progress_file: str = "data/collection_progress.json"):
-        self.progress_file = progress_file
+
+    # 단일 값 필드 (get_progress 딕셔너리의 키와 동일)
+    DEFAULT_FIELDS = {
+        "status": "idle",
+        "progress_percent": 0,
+        "current_step": "대기 중",
+        "total_districts": 0,
+        "current_district": "",
+        "district_index": 0,
+        "total_properties_target": 0,
+        "current_page": 0,
+        "total_pages_estimated": 0,
+        "start_time": None,
+        "last_update": None,
+        "estimated_completion": None
+    }
+
+    # 증가 연산으로만 바뀌는 카운터
+    COUNTERS = ("current_properties_collected", "current_district_properties")
+
+    # 이벤트 종류별 보관 개수 (넘으면 오래된 것부터 삭제)
+    EVENT_LIMITS = {"error": 100, "district_complete": 500, "page": 2000}
+
+    def __init__(self, db_path: str = "data/collection_progress.db", flush_interval: float = 0.5):
+        """flush_interval: 버퍼 기록 주기(초), 0 이하면 매 갱신마다 바로 기록"""
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = self._empty_buffer()
+        self._flusher = None
         self.ensure_data_directory()
         self.init_progress_file()
-    
+
     def ensure_data_directory(self):
         """데이터 디렉토리 생성"""
-        os.makedirs(os.path.dirname(self.progress_file), exist_ok=True)
-    
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 (autocommit, 쓰기는 명시적 트랜잭션)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
     def init_progress_file(self):
-        """진행률 파일 초기화"""
-        initial_data = {
-            "status": "idle",
-            "progress_percent": 0,
-            "current_step": "대기 중",
-            "total_districts": 0,
-            "current_district": "",
-            "district_index": 0,
-            "total_properties_target": 0,
-            "current_properties_collected": 0,
-            "current_page": 0,
-            "total_pages_estimated": 0,
-            "start_time": None,
-            "last_update": datetime.now().isoformat(),
-            "errors": [],
-            "completed_districts": [],
-            "current_district_properties": 0,
-            "estimated_completion": None
-        }
-        
-        # 파일이 없거나 손상된 경우에만 초기화
-        if not os.path.exists(self.progress_file):
-            self._write_progress_safe(initial_data)
-    
-    def _write_progress_safe(self, data: Dict[str, Any]) -> bool:
-        """안전한 진행률 파일 쓰기 (파일 락 사용)"""
+        """진행률 테이블 초기화 (비어 있을 때만 기본값 기록)"""
+        conn = self._connect()
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS progress_fields (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS progress_counters (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS progress_maps (
+                map TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT,
+                PRIMARY KEY (map, key)
+            );
+            CREATE TABLE IF NOT EXISTS progress_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_seq INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT,
+                created_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_progress_events_run_kind ON progress_events(run_seq, kind, id);
+            CREATE INDEX IF NOT EXISTS idx_progress_events_kind ON progress_events(kind, id);
+        ''')
+
+        if conn.execute('SELECT 1 FROM progress_fields LIMIT 1').fetchone() is None:
+            fields = dict(self.DEFAULT_FIELDS)
+            fields["stop_requested"] = False
+            self._write(fields, counters_set={key: 0 for key in self.COUNTERS + ('run_seq',)})
+
+    def _write(self, fields: Optional[Dict[str, Any]] = None, counters_add: Optional[Dict[str, int]] = None,
+               counters_set: Optional[Dict[str, int]] = None, maps: Optional[Dict[str, Dict[str, Any]]] = None,
+               events: Optional[list] = None, reset_run: bool = False) -> bool:
+        """필드/카운터/맵/이벤트를 한 트랜잭션으로 기록 (바뀐 항목만)"""
         try:
-            data["last_update"] = datetime.now().isoformat()
-            
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                # 파일 락 적용 (멀티 프로세스 안전)
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                if reset_run:
+                    conn.execute('DELETE FROM progress_maps')
+                    conn.execute("UPDATE progress_counters SET value = value + 1 WHERE key = 'run_seq'")
+                for key, value in (counters_set or {}).items():
+                    conn.execute('INSERT INTO progress_counters (key, value) VALUES (?, ?) '
+                                 'ON CONFLICT(key) DO UPDATE SET value = excluded.value', (key, value))
+                for key, delta in (counters_add or {}).items():
+                    conn.execute('UPDATE progress_counters SET value = value + ? WHERE key = ?', (delta, key))
+
+                fields = dict(fields or {})
+                fields["last_update"] = datetime.now().isoformat()
+                conn.executemany(
+                    'INSERT INTO progress_fields (key, value) VALUES (?, ?) '
+                    'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                    [(key, json.dumps(value, ensure_ascii=False)) for key, value in fields.items()]
+                )
+                for map_name, entries in (maps or {}).items():
+                    conn.executemany(
+                        'INSERT INTO progress_maps (map, key, value) VALUES (?, ?, ?) '
+                        'ON CONFLICT(map, key) DO UPDATE SET value = excluded.value',
+                        [(map_name, key, json.dumps(value, ensure_ascii=False)) for key, value in entries.items()]
+                    )
+                if events:
+                    conn.executemany(
+                        "INSERT INTO progress_events (run_seq, kind, payload, created_at) "
+                        "VALUES ((SELECT value FROM progress_counters WHERE key = 'run_seq'), ?, ?, ?)",
+                        [(kind, json.dumps(payload, ensure_ascii=False), created_at)
+                         for kind, payload, created_at in events]
+                    )
+                    for kind in {event[0] for event in events}:
+                        conn.execute(
+                            'DELETE FROM progress_events WHERE kind = ? AND id <= '
+                            '(SELECT id FROM progress_events WHERE kind = ? ORDER BY id DESC LIMIT 1 OFFSET ?)',
+                            (kind, kind, self.EVENT_LIMITS.get(kind, 500))
+                        )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
             return True
         except Exception as e:
             print(f"⚠️ 진행률 저장 오류: {e}")
             return False
-    
+
+    @staticmethod
+    def _empty_buffer() -> Dict[str, Any]:
+        return {"fields": {}, "counters_add": {}, "counters_set": {}, "maps": {}, "events": []}
+
+    def _buffer(self, fields: Optional[Dict[str, Any]] = None, counters_add: Optional[Dict[str, int]] = None,
+                counters_set: Optional[Dict[str, int]] = None, maps: Optional[Dict[str, Dict[str, Any]]] = None,
+                event: Optional[tuple] = None) -> bool:
+        """수집 경로 갱신을 메모리 버퍼에 합침 (필드/맵은 마지막 값, 카운터는 누적, 이벤트는 순서대로)"""
+        if event is not None:
+            event = (event[0], event[1], datetime.now().isoformat())
+        if self.flush_interval <= 0:
+            return self._write(fields, counters_add, counters_set, maps, [event] if event else None)
+
+        with self._buffer_lock:
+            pending = self._pending
+            pending["fields"].update(fields or {})
+            for key, value in (counters_set or {}).items():
+                pending["counters_set"][key] = value
+                pending["counters_add"].pop(key, None)
+            for key, delta in (counters_add or {}).items():
+                pending["counters_add"][key] = pending["counters_add"].get(key, 0) + delta
+            for map_name, entries in (maps or {}).items():
+                pending["maps"].setdefault(map_name, {}).update(entries)
+            if event is not None:
+                pending["events"].append(event)
+
+        if self._flusher is None:
+            self._start_flusher()
+        return True
+
+    def _start_flusher(self):
+        """백그라운드 기록 스레드 시작 (프로세스 종료 시 남은 버퍼도 기록)"""
+        with self._flush_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="progress-flusher", daemon=True)
+            self._flusher.start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self) -> bool:
+        """💾 버퍼에 쌓인 갱신을 한 트랜잭션으로 기록"""
+        with self._flush_lock:
+            with self._buffer_lock:
+                pending, self._pending = self._pending, self._empty_buffer()
+            if not any(pending.values()):
+                return True
+            if self._write(pending["fields"], pending["counters_add"], pending["counters_set"],
+                           pending["maps"], pending["events"]):
+                return True
+
+            # 기록 실패 시 다음 주기에 다시 시도 (그 사이 쌓인 갱신이 더 최신)
+            with self._buffer_lock:
+                newer, self._pending = self._pending, pending
+            self._merge_pending(newer)
+            return False
+
+    def _merge_pending(self, newer: Dict[str, Any]):
+        with self._buffer_lock:
+            pending = self._pending
+            pending["fields"].update(newer["fields"])
+            for key, value in newer["counters_set"].items():
+                pending["counters_set"][key] = value
+                pending["counters_add"].pop(key, None)
+            for key, delta in newer["counters_add"].items():
+                pending["counters_add"][key] = pending["counters_add"].get(key, 0) + delta
+            for map_name, entries in newer["maps"].items():
+                pending["maps"].setdefault(map_name, {}).update(entries)
+            pending["events"].extend(newer["events"])
+
+    def _get_field(self, key: str, default: Any = None) -> Any:
+        with self._buffer_lock:
+            if key in self._pending["fields"]:
+                return self._pending["fields"][key]
+        row = self._connect().execute('SELECT value FROM progress_fields WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else default
+
+    def _get_counter(self, key: str) -> int:
+        """기록된 값 + 아직 버퍼에 있는 증감"""
+        with self._buffer_lock:
+            pending_set = self._pending["counters_set"].get(key)
+            pending_add = self._pending["counters_add"].get(key, 0)
+        if pending_set is not None:
+            return pending_set + pending_add
+        row = self._connect().execute('SELECT value FROM progress_counters WHERE key = ?', (key,)).fetchone()
+        return (row[0] if row else 0) + pending_add
+
+    def _get_map_entry(self, map_name: str, key: str, default: Any = None) -> Any:
+        with self._buffer_lock:
+            entries = self._pending["maps"].get(map_name, {})
+            if key in entries:
+                return entries[key]
+        row = self._connect().execute(
+            "SELECT value FROM progress_maps WHERE map = ? AND key = ?", (map_name, key)
+        ).fetchone()
+        return json.loads(row[0]) if row else default
+
     def _read_progress_safe(self) -> Dict[str, Any]:
-        """안전한 진행률 파일 읽기"""
+        """진행률 전체 조회 (기존 JSON 파일과 같은 딕셔너리 구조)"""
         try:
-            if not os.path.exists(self.progress_file):
-                self.init_progress_file()
-            
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                data = json.load(f)
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                return data
+            conn = self._connect()
+            data = dict(self.DEFAULT_FIELDS)
+            for key, value in conn.execute('SELECT key, value FROM progress_fields'):
+                data[key] = json.loads(value) if value is not None else None
+            counters = dict(conn.execute('SELECT key, value FROM progress_counters').fetchall())
+            for key in self.COUNTERS:
+                data[key] = counters.get(key, 0)
+
+            for map_name, key, value in conn.execute('SELECT map, key, value FROM progress_maps ORDER BY rowid'):
+                data.setdefault(map_name, {})[key] = json.loads(value)
+
+            run_seq = counters.get('run_seq', 0)
+            data["errors"] = []
+            data["completed_districts"] = []
+            for kind, payload in conn.execute(
+                'SELECT kind, payload FROM progress_events WHERE run_seq = ? ORDER BY id', (run_seq,)
+            ):
+                if kind == 'error':
+                    data["errors"].append(json.loads(payload))
+                elif kind == 'district_complete':
+                    data["completed_districts"].append(json.loads(payload))
+            return data
         except Exception as e:
             print(f"⚠️ 진행률 읽기 오류: {e}")
             # 오류 시 기본 데이터 반환
             return {"status": "error", "progress_percent": 0, "current_step": f"오류: {e}"}
-    
+
     def start_collection(self, districts: list, estimated_properties_per_district: int = 4000):
         """수집 시작"""
         total_target = len(districts) * estimated_properties_per_district
-        
-        data = {
+
+        fields = {
             "status": "running",
             "progress_percent": 0,
             "current_step": "수집 시작",
@@ -94,155 +300,152 @@ class ProgressManager:
             "current_district": "",
             "district_index": 0,
             "total_properties_target": total_target,
-            "current_properties_collected": 0,
             "current_page": 0,
             "total_pages_estimated": len(districts) * 200,  # 구별 200페이지
             "start_time": datetime.now().isoformat(),
-            "errors": [],
-            "completed_districts": [],
-            "current_district_properties": 0,
             "estimated_completion": None,
             "stop_requested": False  # 중지 요청 플래그 초기화
         }
-        
-        return self._write_progress_safe(data)
-    
+
+        # 이전 실행의 남은 갱신을 먼저 기록한 뒤
+        # 새 실행 번호 → 이전 실행의 오류/완료 이벤트, 구별 맵은 보이지 않음
+        self.flush()
+        return self._write(fields, counters_set={key: 0 for key in self.COUNTERS}, reset_run=True)
+
     def update_district_start(self, district_name: str, district_index: int):
         """구별 수집 시작"""
-        data = self._read_progress_safe()
-        data.update({
+        total_districts = self._get_field("total_districts", 0)
+        fields = {
             "current_district": district_name,
             "district_index": district_index,
             "current_step": f"{district_name} 수집 시작",
-            "current_district_properties": 0,
             "current_page": 0
-        })
-        
+        }
+
         # 진행률 계산 (구별 진행률)
-        district_progress = (district_index / data["total_districts"]) * 100
-        data["progress_percent"] = min(district_progress, 95)  # 최대 95%까지
-        
-        return self._write_progress_safe(data)
-    
-    def update_page_progress(self, current_page: int, properties_in_page: int, total_properties_found: Optional[int] = None):
-        """페이지별 진행률 업데이트"""
-        data = self._read_progress_safe()
-        data.update({
-            "current_page": current_page,
-            "current_properties_collected": data.get("current_properties_collected", 0) + properties_in_page,
-            "current_district_properties": data.get("current_district_properties", 0) + properties_in_page,
-            "last_update": datetime.now().isoformat()
-        })
-        
+        district_progress = (district_index / total_districts) * 100
+        fields["progress_percent"] = min(district_progress, 95)  # 최대 95%까지
+
+        return self._buffer(fields, counters_set={"current_district_properties": 0})
+
+    def update_page_progress(self, current_page: int, properties_in_page: int, total_properties_found: Optional[int] = None,
+                             district_name: Optional[str] = None):
+        """페이지별 진행률 업데이트 (district_name: 페이지를 받은 구 - 동시 수집 시 필수, 생략하면 현재 구)"""
+        current_district = self._get_field("current_district", "")
+        district_name = district_name or current_district
+
+        # 구별 누적 집계 (이벤트 링은 오래된 페이지를 지우므로 합계는 맵에 따로 보관)
+        now = datetime.now().isoformat()
+        district_stats = dict(self._get_map_entry("district_stats", district_name, None)
+                              or {"pages": 0, "properties": 0, "started_at": now})
+        district_stats["pages"] += 1
+        district_stats["properties"] += properties_in_page
+        district_stats["last_at"] = now
+        district_collected = district_stats["properties"]
+
         # 브라우저에서 감지한 총 매물 수가 있으면 더 정확한 진행률 계산
+        district_progress = None
         if total_properties_found and total_properties_found > 0:
-            current_collected = data["current_district_properties"]
-            district_progress = min((current_collected / total_properties_found) * 100, 99)
-            print(f"                  📊 정확한 진행률: {current_collected}/{total_properties_found}개 ({district_progress:.1f}%)")
-            
-            # 🎯 브라우저 기준 진행률을 메인 진행률로 사용
-            data["progress_percent"] = district_progress
+            district_progress = min((district_collected / total_properties_found) * 100, 99)
+            print(f"                  📊 {district_name} 정확한 진행률: {district_collected}/{total_properties_found}개 ({district_progress:.1f}%)")
         else:
             # 브라우저 총 매물 수를 저장된 데이터에서 확인
-            browser_totals = data.get("browser_totals", {})
-            current_district = data.get("current_district", "")
-            browser_total = browser_totals.get(current_district, 0)
-            
+            browser_total = self._get_map_entry("browser_totals", district_name, 0)
             if browser_total > 0:
-                current_collected = data["current_district_properties"]
-                district_progress = min((current_collected / browser_total) * 100, 99)
-                print(f"                  📊 저장된 브라우저 총 매물 수 기준 진행률: {current_collected}/{browser_total}개 ({district_progress:.1f}%)")
-                data["progress_percent"] = district_progress
+                district_progress = min((district_collected / browser_total) * 100, 99)
+                print(f"                  📊 {district_name} 저장된 브라우저 총 매물 수 기준 진행률: {district_collected}/{browser_total}개 ({district_progress:.1f}%)")
+
+        # 메인 진행률 바/현재 구 카운터는 화면에 표시 중인 구의 페이지로만 갱신 (동시 수집 중 다른 구와 섞이지 않게)
+        fields = {}
+        counters_set = {}
+        if district_name == current_district:
+            fields["current_page"] = current_page
+            counters_set["current_district_properties"] = district_collected
+            if district_progress is not None:
+                # 🎯 브라우저 기준 진행률을 메인 진행률로 사용
+                fields["progress_percent"] = district_progress
             else:
                 # 폴백: 기존 방식
-                if data["total_properties_target"] > 0:
-                    overall_progress = min((data["current_properties_collected"] / data["total_properties_target"]) * 90, 90)
-                    data["progress_percent"] = overall_progress
-        
-        return self._write_progress_safe(data)
-    
+                total_target = self._get_field("total_properties_target", 0)
+                if total_target > 0:
+                    overall_collected = self._get_counter("current_properties_collected") + properties_in_page
+                    fields["progress_percent"] = min((overall_collected / total_target) * 90, 90)
+
+        return self._buffer(
+            fields,
+            counters_add={"current_properties_collected": properties_in_page},
+            counters_set=counters_set,
+            maps={"district_stats": {district_name: district_stats}},
+            event=('page', {"district": district_name, "page": current_page, "properties": properties_in_page})
+        )
+
     def set_district_browser_total(self, district_name: str, browser_total: int):
         """브라우저에서 감지한 구별 총 매물 수 설정"""
-        data = self._read_progress_safe()
-        if "browser_totals" not in data:
-            data["browser_totals"] = {}
-        
-        data["browser_totals"][district_name] = browser_total
-        data["current_step"] = f"{district_name} 브라우저 감지: {browser_total}개 매물"
-        
         print(f"                  🎯 진행률 관리자: {district_name} 총 {browser_total}개 설정")
-        return self._write_progress_safe(data)
-    
+        return self._buffer(
+            {"current_step": f"{district_name} 브라우저 감지: {browser_total}개 매물"},
+            maps={"browser_totals": {district_name: browser_total}}
+        )
+
     def update_district_complete(self, district_name: str, properties_collected: int):
         """구별 수집 완료"""
-        data = self._read_progress_safe()
-        data["completed_districts"].append({
-            "name": district_name,
+        return self._buffer(
+            {"current_step": f"{district_name} 완료 ({properties_collected}개)"},
+            event=('district_complete', {
+                "name": district_name,
+                "properties": properties_collected,
+                "completed_at": datetime.now().isoformat()
+            })
+        )
+
+    def record_district_timing(self, district_name: str, elapsed_seconds: float, properties_collected: int = 0):
+        """구별 수집 소요 시간 기록 (동시 수집 스케줄러용)"""
+        return self._buffer(maps={"district_timings": {district_name: {
+            "elapsed_seconds": round(elapsed_seconds, 1),
             "properties": properties_collected,
-            "completed_at": datetime.now().isoformat()
-        })
-        
-        data.update({
-            "current_step": f"{district_name} 완료 ({properties_collected}개)"
-        })
-        
-        return self._write_progress_safe(data)
-    
+            "finished_at": datetime.now().isoformat()
+        }}})
+
     def complete_collection(self, total_collected: int, success: bool = True):
-        """전체 수집 완료"""
-        data = self._read_progress_safe()
-        data.update({
+        """전체 수집 완료 (남은 갱신 먼저 기록)"""
+        self.flush()
+        return self._write({
             "status": "completed" if success else "cancelled",
             "progress_percent": 100,
             "current_step": f"수집 완료! 총 {total_collected}개 매물" if success else "수집 중지됨",
-            "current_properties_collected": total_collected,
             "estimated_completion": datetime.now().isoformat()
-        })
-        
-        return self._write_progress_safe(data)
-    
+        }, counters_set={"current_properties_collected": total_collected})
+
     def request_stop(self):
-        """수집 중지 요청"""
-        data = self._read_progress_safe()
-        data["stop_requested"] = True
-        data["current_step"] = "수집 중지 요청됨..."
-        
-        return self._write_progress_safe(data)
-    
+        """수집 중지 요청 (즉시 기록)"""
+        self.flush()
+        return self._write({"stop_requested": True, "current_step": "수집 중지 요청됨..."})
+
     def is_stop_requested(self) -> bool:
-        """수집 중지 요청 여부 확인"""
-        data = self._read_progress_safe()
-        return data.get("stop_requested", False)
-    
+        """수집 중지 요청 여부 확인 (단일 행 조회)"""
+        try:
+            return bool(self._get_field("stop_requested", False))
+        except Exception as e:
+            print(f"⚠️ 진행률 읽기 오류: {e}")
+            return False
+
     def add_error(self, error_message: str):
         """오류 추가"""
-        data = self._read_progress_safe()
-        data["errors"].append({
+        return self._buffer(event=('error', {
             "message": error_message,
             "timestamp": datetime.now().isoformat()
-        })
-        
-        return self._write_progress_safe(data)
-    
+        }))
+
     def get_progress(self) -> Dict[str, Any]:
         """현재 진행률 조회 (최신 데이터 보장)"""
-        # 파일을 직접 읽어서 캐시 무효화
-        try:
-            if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    print(f"🔍 진행률 파일 직접 읽기: progress_percent={data.get('progress_percent', 0)}")
-            else:
-                data = self._get_default_progress()
-        except Exception as e:
-            print(f"⚠️ 진행률 파일 읽기 오류: {e}")
-            data = self._read_progress_safe()
-        
+        self.flush()
+        data = self._read_progress_safe()
+
         # 추가 계산된 정보
         if data.get("start_time") and data["status"] == "running":
             start_time = datetime.fromisoformat(data["start_time"])
             elapsed = (datetime.now() - start_time).total_seconds()
-            
+
             if data["progress_percent"] > 0:
                 estimated_total_time = elapsed / (data["progress_percent"] / 100)
                 remaining_time = estimated_total_time - elapsed
@@ -251,18 +454,122 @@ class ProgressManager:
                 data["estimated_remaining_seconds"] = None
         else:
             data["estimated_remaining_seconds"] = None
-        
+
         return data
-    
+
+    def get_events(self, after_id: int = 0, kinds: Optional[tuple] = None, limit: int = 200) -> list:
+        """📡 현재 실행의 이벤트 중 after_id 이후 것 (스트림 구독용, 오래된 순)"""
+        self.flush()
+        try:
+            conn = self._connect()
+            sql = ("SELECT id, kind, payload, created_at FROM progress_events "
+                   "WHERE run_seq = (SELECT value FROM progress_counters WHERE key = 'run_seq') AND id > ?")
+            params = [after_id]
+            if kinds:
+                sql += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+                params.extend(kinds)
+            sql += " ORDER BY id LIMIT ?"
+            params.append(limit)
+            return [
+                {"id": event_id, "kind": kind, "created_at": created_at, **json.loads(payload)}
+                for event_id, kind, payload, created_at in conn.execute(sql, params)
+            ]
+        except Exception as e:
+            print(f"⚠️ 진행률 이벤트 읽기 오류: {e}")
+            return []
+
+    def get_live_stats(self, window_seconds: float = 60) -> Dict[str, Any]:
+        """⚡ 구별 처리량 / 예상 완료 시간 (합계는 구별 집계 맵, 속도는 최근 window_seconds 동안의 페이지 이벤트 기준)"""
+        self.flush()
+        stats = {
+            "status": self._get_field("status", "idle"),
+            "current_district": self._get_field("current_district", ""),
+            "current_step": self._get_field("current_step", ""),
+            "progress_percent": self._get_field("progress_percent", 0),
+            "last_update": self._get_field("last_update"),
+            "districts": {},
+            "pages_per_second": 0.0,
+            "properties_per_second": 0.0
+        }
+        try:
+            conn = self._connect()
+            maps = {}
+            for map_name, key, value in conn.execute(
+                "SELECT map, key, value FROM progress_maps WHERE map IN ('browser_totals', 'district_stats')"
+            ):
+                maps.setdefault(map_name, {})[key] = json.loads(value)
+            completed = {json.loads(payload)["name"] for (payload,) in conn.execute(
+                "SELECT payload FROM progress_events WHERE kind = 'district_complete' "
+                "AND run_seq = (SELECT value FROM progress_counters WHERE key = 'run_seq')")}
+            pages = self.get_events(kinds=('page',), limit=self.EVENT_LIMITS["page"])
+        except Exception as e:
+            print(f"⚠️ 진행률 통계 계산 오류: {e}")
+            return stats
+
+        browser_totals = maps.get("browser_totals", {})
+        now = datetime.now()
+
+        # 창 안의 페이지 이벤트만 속도 계산에 사용
+        window = {}
+        window_pages = 0
+        window_properties = 0
+        window_start = now
+        for event in pages:
+            created_at = datetime.fromisoformat(event["created_at"])
+            if (now - created_at).total_seconds() > window_seconds:
+                continue
+            recent = window.setdefault(event["district"], {"pages": 0, "properties": 0})
+            recent["pages"] += 1
+            recent["properties"] += event["properties"]
+            window_pages += 1
+            window_properties += event["properties"]
+            window_start = min(window_start, created_at)
+
+        for name, totals in maps.get("district_stats", {}).items():
+            started_at = datetime.fromisoformat(totals["started_at"])
+            last_at = datetime.fromisoformat(totals["last_at"])
+            active = name not in completed
+            if active:
+                # 수집 시작 후 창보다 짧으면 실제 경과 시간으로 나눔
+                elapsed = max(min((now - started_at).total_seconds(), window_seconds), 1.0)
+                recent = window.get(name, {"pages": 0, "properties": 0})
+                recent_pages, recent_properties = recent["pages"], recent["properties"]
+            else:
+                # 완료된 구는 전체 평균
+                elapsed = max((last_at - started_at).total_seconds(), 1.0)
+                recent_pages, recent_properties = totals["pages"], totals["properties"]
+
+            district = {"pages": totals["pages"], "properties": totals["properties"]}
+            district["pages_per_second"] = round(recent_pages / elapsed, 2)
+            district["properties_per_second"] = round(recent_properties / elapsed, 1)
+            district["browser_total"] = browser_totals.get(name, 0)
+            district["completed"] = not active
+            if not active:
+                district["eta_seconds"] = 0
+            elif district["browser_total"] > 0 and district["properties_per_second"] > 0:
+                remaining = max(district["browser_total"] - district["properties"], 0)
+                district["eta_seconds"] = round(remaining / district["properties_per_second"])
+            else:
+                district["eta_seconds"] = None
+            stats["districts"][name] = district
+
+        if window_pages:
+            elapsed = max((now - window_start).total_seconds(), 1.0)
+            stats["pages_per_second"] = round(window_pages / elapsed, 2)
+            stats["properties_per_second"] = round(window_properties / elapsed, 1)
+        return stats
+
     def reset_progress(self):
         """진행률 리셋"""
         self.init_progress_file()
         return True
-    
+
     def is_running(self) -> bool:
         """수집 진행 중인지 확인"""
-        data = self._read_progress_safe()
-        return data.get("status") == "running"
+        try:
+            return self._get_field("status") == "running"
+        except Exception:
+            return False
 
 
 # 싱글톤 인스턴스
@@ -13,7 +13,6 @@ import os
 import glob
 import asyncio
 import subprocess
-import threading
 import time
 
 # 실시간 진행률 관리자 임포트
@@ -26,6 +25,9 @@ except ImportError:
             def reset_progress(self): pass
         return DummyProgressManager()
 
+# 수집 작업 실행기 (수집은 별도 워커 프로세스에서 실행)
+from job_runner import get_job_runner
+
 # 페이지 설정
 st.set_page_config(
     page_title="부동산 매물 수집 & 분석 시스템",
@@ -74,15 +76,10 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # 세션 상태 초기화
-if 'collection_started' not in st.session_state:
-    st.session_state.collection_started = False
+if 'collection_job_id' not in st.session_state:
+    st.session_state.collection_job_id = None
 if 'collection_params' not in st.session_state:
     st.session_state.collection_params = {}
-if 'collection_progress' not in st.session_state:
-    st.session_state.collection_progress = 0
-
-if 'collection_status' not in st.session_state:
-    st.session_state.collection_status = ""
 
 @st.cache_data
 def load_property_data():
@@ -116,125 +113,71 @@ def load_property_data():
         st.error(f"데이터 로드 오류: {e}")
         return pd.DataFrame()
 
-def load_database_data():
-    """데이터베이스에서 매물 데이터 로드"""
+def render_empty_database_prompt(processor):
+    """DB가 비어 있을 때 안내 + CSV 가져오기"""
+    st.warning("⚠️ 데이터베이스가 비어있습니다.")
+    
+    # CSV → DB 자동 가져오기 제안
+    if st.button("📥 최신 CSV → DB 자동 가져오기"):
+        csv_files = [f for f in os.listdir('.') if f.endswith('.csv') and 'collection' in f]
+        if csv_files:
+            latest_csv = max(csv_files, key=lambda x: os.path.getmtime(x))
+            saved_count = processor.import_csv_to_db(latest_csv, overwrite=True)
+            st.success(f"✅ {saved_count}개 매물을 DB에 저장했습니다!")
+            st.rerun()
+        else:
+            st.error("❌ CSV 파일을 찾을 수 없습니다.")
+
+def normalize_property_frame(df):
+    """DB 조회 결과 전처리 (빈 값 정리 + 숫자 컬럼 변환)"""
+    df = df.fillna('')
+    
+    # 숫자 컬럼 변환
+    numeric_columns = ['area_pyeong', 'area_sqm', 'floor', 'deposit', 'monthly_rent', 'management_fee', 'total_monthly_cost', 'score']
+    for col in numeric_columns:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    
+    return df
+
+def load_filtered_database_data(processor, filters, sort_by=None):
+    """🔍 필터 조건에 맞는 매물만 DB에서 로드 (WHERE / ORDER BY를 SQL로 처리)"""
     try:
-        from modules.data_processor import PropertyDataProcessor
-        processor = PropertyDataProcessor()
-        
-        # DB 매물 개수 확인
-        db_count = processor.get_properties_count()
-        
-        if db_count == 0:
-            st.warning("⚠️ 데이터베이스가 비어있습니다.")
-            
-            # CSV → DB 자동 가져오기 제안
-            if st.button("📥 최신 CSV → DB 자동 가져오기"):
-                csv_files = [f for f in os.listdir('.') if f.endswith('.csv') and 'collection' in f]
-                if csv_files:
-                    latest_csv = max(csv_files, key=lambda x: os.path.getmtime(x))
-                    saved_count = processor.import_csv_to_db(latest_csv, overwrite=True)
-                    st.success(f"✅ {saved_count}개 매물을 DB에 저장했습니다!")
-                    st.rerun()
-                else:
-                    st.error("❌ CSV 파일을 찾을 수 없습니다.")
-            
-            return pd.DataFrame()
-        
-        # DB에서 데이터 로드
-        df = processor.get_all_properties_from_db()
-        st.info(f"📊 데이터베이스: {len(df)}개 매물 로드됨")
-        
-        # 데이터 전처리 (CSV와 동일하게)
-        df = df.fillna('')
-        
-        # 숫자 컬럼 변환
-        numeric_columns = ['area_pyeong', 'area_sqm', 'floor', 'deposit', 'monthly_rent', 'management_fee', 'total_monthly_cost', 'score']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-        
-        return df
-        
+        df = processor.query_properties(filters, sort_by=sort_by)
+        return normalize_property_frame(df)
     except Exception as e:
         st.error(f"❌ DB 로드 오류: {e}")
         return pd.DataFrame()
 
-def apply_enhanced_filters(df, districts=None, deposit_range=None, rent_range=None, floor_range=None, area_range=None, include_whole_building=True):
-    """🎯 개선된 필터 적용 함수 (층수 포함, 0층 옵션)"""
-    if df.empty:
-        return df
-        
-    filtered = df.copy()
-    
-    # 지역 필터
-    if districts:
-        filtered = filtered[filtered['district'].isin(districts)]
-    
-    # 보증금 범위
-    if deposit_range and 'deposit' in filtered.columns:
-        filtered = filtered[
-            (filtered['deposit'] >= deposit_range[0]) &
-            (filtered['deposit'] <= deposit_range[1])
-        ]
-    
-    # 월세 범위
-    if rent_range and 'monthly_rent' in filtered.columns:
-        filtered = filtered[
-            (filtered['monthly_rent'] >= rent_range[0]) &
-            (filtered['monthly_rent'] <= rent_range[1])
-        ]
-    
-    # 🏢 층수 범위 (0층 = 건물 전체 처리)
-    if floor_range and 'floor' in filtered.columns:
-        if include_whole_building:
-            # 0층(건물 전체) 포함
-            filtered = filtered[
-                (filtered['floor'] >= floor_range[0]) &
-                (filtered['floor'] <= floor_range[1])
-            ]
-        else:
-            # 0층(건물 전체) 제외
-            filtered = filtered[
-                (filtered['floor'] >= floor_range[0]) &
-                (filtered['floor'] <= floor_range[1]) &
-                (filtered['floor'] != 0)
-            ]
-    
-    # 면적 범위 (전용면적 기준)
-    if area_range:
-        # 전용면적이 있으면 전용면적 기준으로 필터링
-        if 'exclusive_area_pyeong' in filtered.columns:
-            try:
-                # 안전한 숫자 변환: 에러 발생 시 0으로 처리
-                area_numeric = pd.to_numeric(filtered['exclusive_area_pyeong'], errors='coerce')
-                # 유효한 숫자 값만 필터링 (NaN 제외)
-                area_valid = area_numeric.notna()
-                if area_valid.any():
-                    filtered = filtered[
-                        area_valid &
-                        (area_numeric >= area_range[0]) &
-                        (area_numeric <= area_range[1])
-                    ]
-            except Exception as e:
-                print(f"면적 필터링 오류: {e}")
-        # 전용면적이 없으면 기존 area_pyeong 기준으로 필터링
-        elif 'area_pyeong' in filtered.columns:
-            try:
-                # 안전한 숫자 변환: 에러 발생 시 0으로 처리
-                area_numeric = pd.to_numeric(filtered['area_pyeong'], errors='coerce')
-                # 유효한 숫자 값만 필터링 (NaN 제외)
-                area_valid = area_numeric.notna()
-                if area_valid.any():
-                    filtered = filtered[
-                        area_valid &
-                        (area_numeric >= area_range[0]) &
-                        (area_numeric <= area_range[1])
-                    ]
-            except Exception as e:
-                print(f"면적 필터링 오류: {e}")
+def get_db_change_token():
+    """🔖 DB 변경 토큰 (수집기가 새로 쓴 경우에만 바뀜) - 캐시 키로 사용"""
+    from modules.data_processor import PropertyDataProcessor
+    return PropertyDataProcessor().get_change_token()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_db_summary(db_token):
+    """📊 DB 매물 수 + 지역 목록 (DB 변경 시에만 다시 조회, 조회 오류는 캐시하지 않고 전파)"""
+    from modules.data_processor import PropertyDataProcessor
+    processor = PropertyDataProcessor()
+    return processor.get_properties_count(raise_errors=True), processor.get_district_options(raise_errors=True)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_result_count(db_token, filters):
+    """📊 필터 결과 매물 수 (DB 변경 또는 필터 변경 시에만 다시 조회)"""
+    from modules.data_processor import PropertyDataProcessor
+    return PropertyDataProcessor().count_properties(filters, raise_errors=True)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_result_page(db_token, filters, sort_by, page_size, after=None):
+    """📄 필터 결과 한 페이지만 DB에서 로드 → (전처리된 DataFrame, 다음 페이지 커서)
     
-    return filtered
+    DB 변경 토큰이 같으면 전처리(숫자 변환)된 페이지를 그대로 재사용
+    """
+    from modules.data_processor import PropertyDataProcessor
+    df, next_cursor = PropertyDataProcessor().query_properties_page(
+        filters, sort_by=sort_by, page_size=page_size, after=after, raise_errors=True
+    )
+    return normalize_property_frame(df), next_cursor
 
 def apply_sorting(df, sort_by):
     """정렬 적용"""
@@ -275,30 +218,168 @@ def calculate_compliance_rate(df):
         "조건 미충족": 100 - compliant_rate
     }
 
-def run_collection_in_background(params):
-    """백그라운드에서 수집 실행 (하이브리드 방식)"""
+def submit_collection_job(params):
+    """📥 수집 작업 제출 (UI는 제출/관찰만, 수집은 워커 프로세스)"""
+    st.session_state.collection_params = params
+    st.session_state.collection_job_id = get_job_runner().submit(params)
+
+
+def get_resumable_run():
+    """💾 이어서 수집할 수 있는 중단된 실행 조회"""
     try:
-        st.session_state.collection_status = "🚀 하이브리드 수집 시스템 시작..."
-        st.session_state.collection_progress = 10
-        
-        # district_collector 임포트 및 실행
-        from district_collector import run_streamlit_collection_sync
-        
-        st.session_state.collection_status = "📍 브라우저 지역 설정 중..."
-        st.session_state.collection_progress = 20
+        from modules.checkpoint_store import CheckpointStore
+        return CheckpointStore().latest_resumable_run()
+    except Exception:
+        return None
+
+
+PROGRESS_REFRESH_SECONDS = 1.0
+
+
+def format_eta(seconds):
+    """⏱️ 남은 초 → 'N분 M초'"""
+    if seconds is None:
+        return "계산 중..."
+    return f"{int(seconds // 60)}분 {int(seconds % 60)}초"
+
+
+@st.fragment(run_every=PROGRESS_REFRESH_SECONDS)
+def render_live_progress(progress_manager, job_id):
+    """📡 실시간 진행률 / 구별 처리량 (프래그먼트 단위 자동 갱신)"""
+    job = get_job_runner().status(job_id)["job"]
+    if job is not None and job['status'] not in ('queued', 'running'):
+        # 작업이 끝나면 전체 화면을 다시 그려 결과 표시로 전환
+        st.rerun()
+    if job is not None and job['status'] == 'queued':
+        st.info(f"⏳ 대기 중인 작업: {job['job_id']} (앞선 수집이 끝나면 시작됩니다)")
+        return
+
+    current_progress = progress_manager.get_progress()
+    live_stats = progress_manager.get_live_stats()
+
+    last_update = current_progress.get('last_update', '')
+    if last_update:
+        try:
+            update_time = datetime.fromisoformat(last_update)
+            st.caption(f"마지막 업데이트: {update_time.strftime('%H:%M:%S')} (자동 갱신 {PROGRESS_REFRESH_SECONDS:g}초)")
+        except ValueError:
+            st.caption("마지막 업데이트: 알 수 없음")
+
+    # 메인 진행률 바 (브라우저 기준)
+    progress_percent = current_progress.get('progress_percent', 0)
+    current_collected = current_progress.get('current_district_properties', 0)
+    browser_totals = current_progress.get('browser_totals', {})
+    current_district = current_progress.get('current_district', '')
+    browser_total = browser_totals.get(current_district, 0)
+    
+    # 브라우저 총 매물 수가 있으면 실시간 재계산
+    if browser_total > 0 and current_collected > 0:
+        real_progress = min((current_collected / browser_total) * 100, 100)
+        st.progress(real_progress / 100, text=f"전체 진행률: {real_progress:.1f}% ({current_collected}/{browser_total}개)")
         
-        # 실제 수집 실행
-        properties = run_streamlit_collection_sync(params)
+        # 중복 통계 표시
+        if current_collected > browser_total:
+            duplicate_count = current_collected - browser_total
+            efficiency = (browser_total / current_collected) * 100 if current_collected > 0 else 0
+            st.info(f"📊 중복 제거: {duplicate_count}개 중복 감지됨 (효율성: {efficiency:.1f}%)")
+            st.caption(f"✅ 유니크 매물: {browser_total}개 / 전체 수집: {current_collected}개")
+    else:
+        st.progress(progress_percent / 100, text=f"전체 진행률: {progress_percent:.1f}%")
+    
+    # 상세 진행 정보
+    col2_1, col2_2 = st.columns(2)
+    
+    with col2_1:
+        st.metric(
+            "📍 현재 지역", 
+            current_progress.get('current_district', '대기 중'),
+            f"{current_progress.get('district_index', 0) + 1}/{current_progress.get('total_districts', 0)}"
+        )
         
-        st.session_state.collection_progress = 100
+        st.metric(
+            "📄 현재 페이지",
+            current_progress.get('current_page', 0),
+            f"진행 중..."
+        )
+    
+    with col2_2:
+        # 브라우저 감지 총 매물 수 기준으로 표시
+        if browser_total > 0:
+            st.metric(
+                "🏠 수집된 매물", 
+                f"{current_collected:,}개",
+                f"목표: {browser_total:,}개"
+            )
+        else:
+            st.metric(
+                "🏠 수집된 매물",
+                f"{current_progress.get('current_properties_collected', 0):,}개",
+                f"목표: {current_progress.get('total_properties_target', 0):,}개"
+            )
         
-        if properties and len(properties) > 0:
-            st.session_state.collection_status = f"✅ 하이브리드 수집 완료! {len(properties)}개 매물 수집됨"
+        # 예상 완료 시간
+        remaining = current_progress.get('estimated_remaining_seconds')
+        if remaining:
+            remaining_min = int(remaining / 60)
+            remaining_sec = int(remaining % 60)
+            st.metric("⏱️ 예상 완료", f"{remaining_min}분 {remaining_sec}초")
         else:
-            st.session_state.collection_status = "⚠️ 하이브리드 수집 완료되었으나 조건에 맞는 매물이 없습니다"
-            
-    except Exception as e:
-        st.session_state.collection_status = f"❌ 하이브리드 수집 오류: {str(e)}"
+            st.metric("⏱️ 예상 완료", "계산 중...")
+    
+    # 현재 상태
+    current_step = current_progress.get('current_step', '진행 중...')
+    st.info(f"🔄 {current_step}")
+    
+    # 완료된 지역 목록
+    completed = current_progress.get('completed_districts', [])
+    if completed:
+        with st.expander(f"✅ 완료된 지역 ({len(completed)}개)"):
+            for district in completed:
+                st.write(f"• {district.get('name', '')}: {district.get('properties', 0)}개")
+    
+    # 오류 목록
+    errors = current_progress.get('errors', [])
+    if errors:
+        with st.expander(f"⚠️ 오류 로그 ({len(errors)}개)", expanded=False):
+            for error in errors[-5:]:  # 최근 5개만 표시
+                st.error(f"{error.get('timestamp', '')}: {error.get('message', '')}")
+    
+    # ⚡ 처리량 (최근 1분 기준)
+    col3_1, col3_2 = st.columns(2)
+    col3_1.metric("📄 페이지/초", f"{live_stats.get('pages_per_second', 0):.2f}")
+    col3_2.metric("🏠 매물/초", f"{live_stats.get('properties_per_second', 0):.1f}")
+
+    district_stats = live_stats.get('districts', {})
+    if district_stats:
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "지역": name,
+                    "페이지": stats['pages'],
+                    "수집 매물": stats['properties'],
+                    "브라우저 총계": stats['browser_total'] or None,
+                    "페이지/초": stats['pages_per_second'],
+                    "매물/초": stats['properties_per_second'],
+                    "예상 완료": "완료" if stats['completed'] else format_eta(stats['eta_seconds'])
+                }
+                for name, stats in district_stats.items()
+            ]),
+            hide_index=True,
+            use_container_width=True
+        )
+
+    # 수집 중지 버튼
+    if current_progress.get('status') == 'running' and job is not None:
+        if job['cancel_requested']:
+            st.warning("🛑 중지 요청됨... 워커가 현재 페이지를 마치면 중지됩니다")
+            if st.button("⛔ 강제 종료", type="secondary", key="force_stop_collection"):
+                get_job_runner().cancel(job['job_id'], force=True)
+                st.rerun()
+        elif st.button("🛑 수집 중지", type="secondary"):
+            # 중지 요청 전송 (워커가 다음 페이지 전에 확인)
+            get_job_runner().cancel(job['job_id'])
+            st.success("🛑 수집 중지 요청을 전송했습니다. 잠시 후 중지됩니다...")
+            st.rerun()
 
 
 def tab_collection():
@@ -401,6 +482,40 @@ def tab_collection():
                 key="area_max"
             )
         
+        # 동시 수집 설정
+        st.subheader("🗓️ 동시 수집")
+        max_concurrent_districts = st.number_input(
+            "동시 진행 구 수",
+            min_value=1, max_value=8, value=2, step=1,
+            key="max_concurrent_districts",
+            help="여러 구를 동시에 수집합니다 (구마다 브라우저 1개 사용)"
+        )
+        collection_mode = st.radio(
+            "수집 방식",
+            options=['hybrid', 'api-only'],
+            format_func=lambda m: "🌐 하이브리드 (브라우저)" if m == 'hybrid' else "⚡ 순수 API (브라우저 없음)",
+            key="collection_mode",
+            help="순수 API 모드는 구별 좌표 범위로 바로 수집하고, API가 거부할 때만 브라우저로 전환합니다"
+        )
+        incremental = st.checkbox(
+            "🔁 증분 수집 (새 매물만)",
+            value=False,
+            key="incremental_collection",
+            help="이전에 끝까지 수집한 구는 최신순으로 보다가 지난 수집 시점(워터마크)을 넘으면 중단합니다. 수집 기록이 없는 구는 전체 수집합니다"
+        )
+        headless = st.checkbox(
+            "🖥️ 브라우저 화면 없이 실행",
+            value=False,
+            key="headless_browser",
+            help="서버처럼 화면이 없는 환경에서는 켜 주세요 (헤드리스 Chromium)"
+        )
+        block_resources = st.checkbox(
+            "🚧 지도 이미지/폰트 차단 (경량 모드)",
+            value=True,
+            key="block_resources",
+            help="매물 목록 요청과 '구만 보기' 버튼에 필요한 리소스만 받아 페이지 로딩과 메모리 사용을 줄입니다"
+        )
+        
         # 조건 검증
         validation_errors = []
         if deposit_min > deposit_max:
@@ -451,8 +566,7 @@ def tab_collection():
             disabled=not conditions_valid,
             key="hybrid_collection"
         ):
-            st.session_state.collection_started = True
-            st.session_state.collection_params = {
+            submit_collection_job({
                 'districts': districts,
                 'filters': {
                     'deposit_max': deposit_max,
@@ -461,18 +575,26 @@ def tab_collection():
                 },
                 'deposit_range': (deposit_min, deposit_max),
                 'rent_range': (rent_min, rent_max),
-                'area_range': (area_min, area_max)
-            }
-            st.session_state.collection_progress = 0
-            st.session_state.collection_status = "하이브리드 수집 시작..."
-            
-            # 백그라운드 하이브리드 수집 시작
-            thread = threading.Thread(
-                target=run_collection_in_background, 
-                args=(st.session_state.collection_params,)
-            )
-            thread.start()
+                'area_range': (area_min, area_max),
+                'max_concurrent_districts': int(max_concurrent_districts),
+                'mode': collection_mode,
+                'incremental': incremental,
+                'headless': headless,
+                'block_resources': block_resources
+            })
             st.rerun()
+        
+        # ↩️ 중단된 수집 이어하기 (체크포인트가 남아 있을 때만 표시)
+        resumable_run = get_resumable_run()
+        if resumable_run and get_job_runner().active_job() is None:
+            resume_districts = resumable_run['params'].get('districts', [])
+            st.caption(f"💾 중단된 수집: {resumable_run['run_id']} ({len(resume_districts)}개 구)")
+            if st.button("↩️ 중단된 수집 이어하기", key="resume_collection"):
+                submit_collection_job({
+                    'resume': True,
+                    'resume_run_id': resumable_run['run_id']
+                })
+                st.rerun()
 
 
     # 진행률 표시 섹션
@@ -482,123 +604,35 @@ def tab_collection():
     # 실시간 진행률 표시
     progress_manager = get_progress_manager()
     current_progress = progress_manager.get_progress()
-    
-    if st.session_state.get('collection_started', False) or current_progress.get('status') == 'running':
-        st.success("🚀 수집이 진행 중입니다!")
-        
-        # 🔄 수동 새로고침 버튼 (WebSocket 오류 방지)
-        col_refresh1, col_refresh2 = st.columns([3, 1])
-        with col_refresh2:
-            if st.button("🔄 새로고침", key="refresh_progress"):
-                st.rerun()
-        
-        with col_refresh1:
-            last_update = current_progress.get('last_update', '')
-            if last_update:
-                from datetime import datetime
-                try:
-                    update_time = datetime.fromisoformat(last_update)
-                    st.caption(f"마지막 업데이트: {update_time.strftime('%H:%M:%S')}")
-                except:
-                    st.caption("마지막 업데이트: 알 수 없음")
-        
-        # 메인 진행률 바 (브라우저 기준)
-        progress_percent = current_progress.get('progress_percent', 0)
-        current_collected = current_progress.get('current_district_properties', 0)
-        browser_totals = current_progress.get('browser_totals', {})
-        current_district = current_progress.get('current_district', '')
-        browser_total = browser_totals.get(current_district, 0)
-        
-        # 브라우저 총 매물 수가 있으면 실시간 재계산
-        if browser_total > 0 and current_collected > 0:
-            real_progress = min((current_collected / browser_total) * 100, 100)
-            st.progress(real_progress / 100, text=f"전체 진행률: {real_progress:.1f}% ({current_collected}/{browser_total}개)")
-            
-            # 중복 통계 표시
-            if current_collected > browser_total:
-                duplicate_count = current_collected - browser_total
-                efficiency = (browser_total / current_collected) * 100 if current_collected > 0 else 0
-                st.info(f"📊 중복 제거: {duplicate_count}개 중복 감지됨 (효율성: {efficiency:.1f}%)")
-                st.caption(f"✅ 유니크 매물: {browser_total}개 / 전체 수집: {current_collected}개")
-        else:
-            st.progress(progress_percent / 100, text=f"전체 진행률: {progress_percent:.1f}%")
-        
-        # 상세 진행 정보
-        col2_1, col2_2 = st.columns(2)
-        
-        with col2_1:
-            st.metric(
-                "📍 현재 지역", 
-                current_progress.get('current_district', '대기 중'),
-                f"{current_progress.get('district_index', 0) + 1}/{current_progress.get('total_districts', 0)}"
-            )
-            
-            st.metric(
-                "📄 현재 페이지",
-                current_progress.get('current_page', 0),
-                f"진행 중..."
-            )
-        
-        with col2_2:
-            # 브라우저 감지 총 매물 수 기준으로 표시
-            if browser_total > 0:
-                st.metric(
-                    "🏠 수집된 매물", 
-                    f"{current_collected:,}개",
-                    f"목표: {browser_total:,}개"
-                )
-            else:
-                st.metric(
-                    "🏠 수집된 매물",
-                    f"{current_progress.get('current_properties_collected', 0):,}개",
-                    f"목표: {current_progress.get('total_properties_target', 0):,}개"
-                )
-            
-            # 예상 완료 시간
-            remaining = current_progress.get('estimated_remaining_seconds')
-            if remaining:
-                remaining_min = int(remaining / 60)
-                remaining_sec = int(remaining % 60)
-                st.metric("⏱️ 예상 완료", f"{remaining_min}분 {remaining_sec}초")
-            else:
-                st.metric("⏱️ 예상 완료", "계산 중...")
-        
-        # 현재 상태
-        current_step = current_progress.get('current_step', '진행 중...')
-        st.info(f"🔄 {current_step}")
-        
-        # 완료된 지역 목록
-        completed = current_progress.get('completed_districts', [])
-        if completed:
-            with st.expander(f"✅ 완료된 지역 ({len(completed)}개)"):
-                for district in completed:
-                    st.write(f"• {district.get('name', '')}: {district.get('properties', 0)}개")
-        
-        # 오류 목록
-        errors = current_progress.get('errors', [])
-        if errors:
-            with st.expander(f"⚠️ 오류 로그 ({len(errors)}개)", expanded=False):
-                for error in errors[-5:]:  # 최근 5개만 표시
-                    st.error(f"{error.get('timestamp', '')}: {error.get('message', '')}")
-        
+
+    # 이 세션이 제출한 작업, 없으면 다른 세션이 실행 중인 작업을 관찰
+    job_status = get_job_runner().status(st.session_state.get('collection_job_id'))
+    job = job_status["job"]
+    if job is None or job['status'] not in ('queued', 'running'):
+        job = get_job_runner().active_job()
+
+    if job is not None:
+        st.success(f"🚀 수집이 진행 중입니다! (작업 {job['job_id']})")
+        if job_status["queued"]:
+            st.caption(f"⏳ 대기 중인 작업 {job_status['queued']}개")
+
+        # 진행률/처리량은 프래그먼트만 주기적으로 다시 그림 (전체 페이지 재실행 없음)
+        render_live_progress(progress_manager, job['job_id'])
+
         # 수집 파라미터 표시
-        params = st.session_state.get('collection_params', {})
+        params = job['params']
         if params:
             with st.expander("🔧 수집 파라미터"):
                 st.json(params)
-        
-        # 수집 중지 버튼
-        if current_progress.get('status') == 'running':
-            if st.button("🛑 수집 중지", type="secondary"):
-                # 중지 요청 전송
-                progress_manager.request_stop()
-                st.session_state.collection_started = False
-                st.success("🛑 수집 중지 요청을 전송했습니다. 잠시 후 중지됩니다...")
-                st.rerun()
-                
+
     else:
         st.info("🎯 필터 조건을 설정하고 '수집 시작'을 눌러주세요")
-        
+
+        # 이 세션에서 제출한 작업이 실패했으면 원인 표시
+        last_job = job_status["job"]
+        if last_job is not None and last_job['status'] == 'failed':
+            st.error(f"❌ 수집 작업 실패 ({last_job['job_id']}): {last_job.get('error') or '알 수 없는 오류'}")
+
         # 이전 수집 결과가 있다면 표시
         if current_progress.get('status') == 'completed':
             st.success(f"✅ 이전 수집 완료: {current_progress.get('current_properties_collected', 0)}개 매물")
@@ -668,21 +702,32 @@ def tab_results():
         except Exception as e:
             st.error(f"❌ DB 디버그 오류: {e}")
     
-    # 데이터 로드 (DB만 사용)
-    df = load_database_data()
+    # DB 상태 확인 (전체 테이블은 로드하지 않음)
+    from modules.data_processor import PropertyDataProcessor
+    processor = PropertyDataProcessor()
+    db_token = get_db_change_token()
+    try:
+        total_count, district_options = load_db_summary(db_token)
+    except Exception as e:
+        # 일시 오류(database is locked 등)는 캐시되지 않으므로 다음 실행에서 다시 조회
+        st.error(f"❌ DB 조회 오류: {e} - 잠시 후 다시 시도해주세요")
+        return
     
-    if df.empty:
+    if total_count == 0:
+        render_empty_database_prompt(processor)
         st.info("📭 아직 수집된 매물이 없습니다. '수집' 탭에서 데이터를 수집해주세요.")
         return
     
+    st.info(f"📊 데이터베이스: {total_count:,}개 매물")
+    
     # 🔍 깔끔한 필터 섹션
     st.subheader("🔍 결과 필터링")
     
     # 지역 선택 (최상단)
     filter_districts = st.multiselect(
         "📍 지역 선택", 
-        options=sorted(df['district'].unique()),
-        default=sorted(df['district'].unique()),
+        options=district_options,
+        default=district_options,
         help="표시할 지역을 선택하세요"
     )
     
@@ -747,26 +792,37 @@ def tab_results():
             key="filter_area_max"
         )
     
-    # 🎯 개선된 필터 적용 (층수 포함)
-    filtered_df = apply_enhanced_filters(
-        df, 
-        districts=filter_districts,
-        deposit_range=(filter_deposit_min, filter_deposit_max),
-        rent_range=(filter_rent_min, filter_rent_max),
-        floor_range=(filter_floor_min, filter_floor_max),
-        area_range=(filter_area_min, filter_area_max),
-        include_whole_building=include_whole_building
+    # 정렬
+    sort_by = st.selectbox(
+        "↕️ 정렬", list(PropertyDataProcessor.RESULT_SORT_OPTIONS.keys()),
+        key="result_sort_by"
     )
     
+    # 🎯 필터 적용 (층수 포함) - DB에서 조건에 맞는 행만 조회
+    result_filters = {
+        'districts': filter_districts,
+        'deposit_range': (filter_deposit_min, filter_deposit_max),
+        'rent_range': (filter_rent_min, filter_rent_max),
+        'floor_range': (filter_floor_min, filter_floor_max),
+        'area_range': (filter_area_min, filter_area_max),
+        'include_whole_building': include_whole_building
+    }
+    # COUNT는 필터나 DB 내용이 바뀔 때만 다시 계산 (페이지 이동 시 재사용)
+    try:
+        filtered_count = load_result_count(db_token, result_filters)
+    except Exception as e:
+        st.error(f"❌ DB 개수 조회 오류: {e} - 잠시 후 다시 시도해주세요")
+        return
+    
     # 필터 결과 표시
-    st.success(f"🎯 필터 적용 후: **{len(filtered_df):,}개** 매물 (전체 {len(df):,}개 중)")
+    st.success(f"🎯 필터 적용 후: **{filtered_count:,}개** 매물 (전체 {total_count:,}개 중)")
     
-    # 📋 필터링된 데이터 테이블 표시
-    if len(filtered_df) > 0:
+    # 📋 필터링된 데이터 테이블 표시 (현재 페이지만 조회/렌더링)
+    if filtered_count > 0:
         # 🎯 동적 컬럼 표시 (필터 결과에 맞게)
-        col1, col2 = st.columns([3, 1])
+        col1, col2, col3 = st.columns([2, 1, 1])
         with col1:
-            st.subheader(f"📋 필터 결과 ({len(filtered_df):,}개 매물)")
+            st.subheader(f"📋 필터 결과 ({filtered_count:,}개 매물)")
         with col2:
             # 표시 모드 선택
             display_mode = st.selectbox(
@@ -774,6 +830,40 @@ def tab_results():
                 ["전체 컬럼", "핵심 컬럼만"],
                 key="display_mode"
             )
+        with col3:
+            page_size = st.selectbox(
+                "페이지당 매물 수", [50, 100, 200, 500], index=1,
+                key="result_page_size"
+            )
+        
+        # 필터/정렬/페이지 크기가 바뀌면 첫 페이지부터 (페이지별 시작 커서 스택)
+        query_key = repr((result_filters, sort_by, page_size))
+        if st.session_state.get('result_query_key') != query_key:
+            st.session_state.result_query_key = query_key
+            st.session_state.result_page_cursors = [None]
+        page_cursors = st.session_state.result_page_cursors
+        
+        try:
+            filtered_df, next_cursor = load_result_page(db_token, result_filters, sort_by, page_size, page_cursors[-1])
+        except Exception as e:
+            st.error(f"❌ DB 로드 오류: {e}")
+            filtered_df, next_cursor = pd.DataFrame(), None
+        
+        # 페이지 이동
+        page_number = len(page_cursors)
+        total_pages = max(1, -(-filtered_count // page_size))
+        nav1, nav2, nav3 = st.columns([1, 2, 1])
+        with nav1:
+            if st.button("◀ 이전", disabled=page_number <= 1, key="result_prev_page"):
+                page_cursors.pop()
+                st.rerun()
+        with nav2:
+            st.caption(f"📄 {page_number} / {total_pages} 페이지 "
+                       f"({(page_number - 1) * page_size + 1:,}~{(page_number - 1) * page_size + len(filtered_df):,}번째)")
+        with nav3:
+            if st.button("다음 ▶", disabled=next_cursor is None, key="result_next_page"):
+                page_cursors.append(next_cursor)
+                st.rerun()
         
         st.info("💡 좌우 스크롤하여 모든 데이터를 확인할 수 있습니다")
         
@@ -876,7 +966,7 @@ def tab_results():
         )
 
         # 추가: 모든 컬럼을 볼 수 있는 HTML 테이블 (필요시)
-        with st.expander("📋 전체 컬럼 HTML 뷰 (개발용)"):
+        with st.expander("📋 전체 컬럼 HTML 뷰 (개발용, 현재 페이지)"):
             # HTML로 모든 컬럼 표시
             html_table = filtered_df[available_columns].to_html(
                 index=False,
@@ -912,14 +1002,16 @@ def tab_results():
 
             st.markdown(html_table, unsafe_allow_html=True)
         
-        # 다운로드 버튼
-        csv = filtered_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button(
-            "📥 CSV 다운로드", 
-            data=csv, 
-            file_name=f"매물검색결과_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-            mime="text/csv"
-        )
+        # 다운로드 버튼 (요청 시에만 전체 필터 결과 조회)
+        if st.button("📥 필터 결과 CSV 준비", key="prepare_result_csv"):
+            export_df = load_filtered_database_data(processor, result_filters, sort_by)
+            csv = export_df.to_csv(index=False, encoding='utf-8-sig')
+            st.download_button(
+                "📥 CSV 다운로드", 
+                data=csv, 
+                file_name=f"매물검색결과_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                mime="text/csv"
+            )
     else:
         st.warning("🔍 필터 조건에 맞는 매물이 없습니다.")
         st.info("💡 필터 조건을 완화하거나 다른 지역을 선택해보세요.")